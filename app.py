@@ -1,42 +1,92 @@
+import threading
+
 from dash import Dash, dcc, html
 from tabs import overview, batting_stats, bowling_stats, teams_comparison, player_insights
 from dash.dependencies import Input, Output
+from utils.stats_export import register_routes as register_export_routes
+from utils.ingest import register_routes as register_ingest_routes
+from utils.metrics import register_routes as register_metrics_routes, instrument_callbacks
+from utils.client_store import CLIENTSIDE_FILTER, season_store
+from utils.live_feed import start_feed
+from utils.data_loader import get_data, data_version
 
 # Initialize app
 app = Dash(__name__, suppress_callback_exceptions=True)
 app.title = "IPL Dashboard"
+server = app.server  # WSGI entry point for multi-worker servers (e.g. gunicorn app:server)
+register_export_routes(server)  # /exports/<kind>.csv downloads of the player stats export
+register_ingest_routes(server)  # POST /ingest/match, only with IPL_INGEST_TOKEN set
+register_metrics_routes(server)  # GET /metrics, only with IPL_METRICS=1
+start_feed()  # Tails IPL_LIVE_FEED, if set
+
+# Tab modules register their callbacks at import; each layout (and the figures it starts with)
+# is built on the tab's first selection and reused until the data version changes (see ingest_match)
+TABS = {
+    'overview': overview,
+    'batting': batting_stats,
+    'bowling': bowling_stats,
+    'team': teams_comparison,
+    'player': player_insights
+}
+_layouts = {}
+_layouts_lock = threading.Lock()
+
+def _versioned(key, build):
+    version = data_version()
+    cached = _layouts.get(key)
+    if cached is None or cached[0] != version:
+        with _layouts_lock:
+            cached = _layouts.get(key)
+            if cached is None or cached[0] != version:
+                cached = _layouts[key] = (version, build())
+    return cached[1]
+
+def tab_layout(tab):
+    """
+    Return the layout of a tab, building it on first use and after the data changes.
+    Args:
+        tab (str): Tab value, a key of TABS
+    Returns:
+        html.Div: Tab layout
+    """
+    return _versioned(tab, TABS[tab].build_layout)
+
+def page_layout():
+    """
+    Return the page shell with the tabs, served on every page load.
+    Returns:
+        html.Div: Page layout
+    """
+    return html.Div([
+        html.Div([
+            html.H2("IPL Statistics Dashboard", className="main-title"),
+            dcc.Tabs(id='tabs', value='overview', children=[
+                dcc.Tab(label='Overview', value='overview'),
+                dcc.Tab(label='Batting Stats', value='batting'),
+                dcc.Tab(label='Bowling Stats', value='bowling'),
+                dcc.Tab(label='Team Comparison', value='team'),
+                dcc.Tab(label='Player Insights', value='player'),
+            ], className="main-tabs"),
+        ], className="header-tabs-row"),
+
+        html.Div(id='tab-content'),  # Tab output content
+        # Per-season aggregates for client-side season filtering, sent once with the page
+        *([_versioned('season-store', lambda: season_store(get_data()[2], get_data()[0]))] if CLIENTSIDE_FILTER else [])
+    ])
 
 # Layout
-app.layout = html.Div([
-    html.Div([
-        html.H2("IPL Statistics Dashboard", className="main-title"),
-        dcc.Tabs(id='tabs', value='overview', children=[
-            dcc.Tab(label='Overview', value='overview'),
-            dcc.Tab(label='Batting Stats', value='batting'),
-            dcc.Tab(label='Bowling Stats', value='bowling'),
-            dcc.Tab(label='Team Comparison', value='team'),
-            dcc.Tab(label='Player Insights', value='player'),
-        ], className="main-tabs"),
-    ], className="header-tabs-row"),
-
-    html.Div(id='tab-content')  # Tab output content
-])
+app.layout = page_layout
 
 @app.callback(
     Output('tab-content', 'children'),
     Input('tabs', 'value')
 )
 def render_content(tab):
-    if tab == 'overview':
-        return overview.layout
-    elif tab == 'batting':
-        return batting_stats.layout
-    elif tab == 'bowling':
-        return bowling_stats.layout
-    elif tab == 'team':
-        return teams_comparison.layout
-    elif tab == 'player':
-        return player_insights.layout
+    if tab in TABS:
+        return tab_layout(tab)
+
+# Every callback is registered by now; time them for /metrics (IPL_METRICS=1)
+instrument_callbacks(app)
 
 if __name__ == '__main__':
     app.run(debug=True)
@@ -0,0 +1,132 @@
+/*
+ * Client-side season filtering (IPL_CLIENTSIDE_FILTER=1, see utils/client_store.py).
+ *
+ * The season store holds per-season tables; these callbacks sum the selected seasons' rows and
+ * restyle the figures the server rendered for all seasons, mirroring the matching helpers in
+ * utils/data_loader.py.
+ */
+(function () {
+    // Dismissal kinds as labelled by get_dismissal_kind
+    const DISMISSAL_LABELS = ['Bowled', 'Caught', 'LBW', 'Stumped', 'Caught and Bowled', 'Hit Wicket'];
+
+    // Round half to even at two decimals, as pandas .round(2)
+    function round2(value) {
+        const scaled = value * 100;
+        let rounded = Math.round(scaled);
+        if (Math.abs(scaled % 1) === 0.5 && rounded % 2 !== 0) {
+            rounded -= 1;
+        }
+        return rounded / 100;
+    }
+
+    // Selected season positions; an empty selection means every season
+    function selectedSeasons(store, seasons) {
+        const chosen = new Set(seasons || []);
+        return store.seasons.map(season => chosen.size === 0 || chosen.has(season));
+    }
+
+    function seasonSum(store, column, selected) {
+        return store[column].reduce((total, value, pos) => selected[pos] && value !== null ? total + value : total, 0);
+    }
+
+    function seasonExtreme(store, column, selected, pick) {
+        const values = store[column].filter((value, pos) => selected[pos] && value !== null);
+        return values.length ? pick(...values) : '-';
+    }
+
+    // Sum the measures of a table per key over the selected seasons, in key order
+    function sumBy(table, key, measures, selected) {
+        const sums = new Map();
+        table.season.forEach((season, row) => {
+            if (!selected[season]) {
+                return;
+            }
+            const keyValue = table[key][row];
+            if (!sums.has(keyValue)) {
+                sums.set(keyValue, Object.fromEntries(measures.map(measure => [measure, 0])));
+            }
+            const entry = sums.get(keyValue);
+            measures.forEach(measure => { entry[measure] += table[measure][row]; });
+        });
+        return [...sums.keys()].sort((a, b) => a - b).map(keyValue => ({key: keyValue, ...sums.get(keyValue)}));
+    }
+
+    // Top n rows by a measure, largest last as in the horizontal bar charts. Keys index the names in
+    // category order, so ties are listed by name like the server-side charts
+    function topRows(rows, measure, n) {
+        return [...rows].sort((a, b) => b[measure] - a[measure] || a.key - b.key).slice(0, n).reverse();
+    }
+
+    function restyle(figure, traceUpdate, layoutUpdate) {
+        const updated = JSON.parse(JSON.stringify(figure));
+        Object.assign(updated.data[0], traceUpdate);
+        if (layoutUpdate) {
+            layoutUpdate(updated.layout);
+        }
+        return updated;
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        ipl: {
+            battingPage: function (seasons, store, topScorers, runsDistribution, runsPerOver, runRate, strikeRate, average) {
+                const noUpdate = window.dash_clientside.no_update;
+                if (!store) {
+                    return Array(11).fill(noUpdate);
+                }
+                const selected = selectedSeasons(store, seasons);
+                const teamNames = store.names.team;
+
+                const batters = topRows(sumBy(store.batters, 'batter', ['runs'], selected), 'runs', 10);
+                const top = batters[batters.length - 1];
+
+                const fours = seasonSum(store, 'four_run_balls', selected);
+                const sixes = seasonSum(store, 'six_run_balls', selected);
+                const runTypes = [['4s', fours], ['6s', sixes], ['Other', seasonSum(store, 'scoring_balls', selected) - fours - sixes]]
+                    .filter(([, count]) => count > 0);
+
+                const overs = sumBy(store.overs, 'over', ['runs'], selected);
+                const maxY = Math.max(...overs.map(row => row.runs)) + 1000;
+
+                const teams = sumBy(store.teams, 'team', ['runs', 'balls', 'legal_batsman_runs', 'legal_balls', 'matches'], selected);
+                const legalTeams = teams.filter(row => row.legal_balls > 0);
+
+                return [
+                    seasonSum(store, 'runs', selected),
+                    seasonSum(store, 'matches', selected),
+                    top ? `${store.names.batter[top.key]} (${top.runs} runs)` : '-',
+                    seasonExtreme(store, 'highest_chase', selected, Math.max),
+                    seasonExtreme(store, 'lowest_total', selected, Math.min),
+                    restyle(topScorers, {x: batters.map(row => row.runs), y: batters.map(row => store.names.batter[row.key])}),
+                    restyle(runsDistribution, {labels: runTypes.map(([label]) => label), values: runTypes.map(([, count]) => count)}),
+                    restyle(runsPerOver, {x: overs.map(row => row.key + 1), y: overs.map(row => row.runs)}, layout => {
+                        (layout.shapes || []).forEach(shape => { shape.y1 = maxY; });
+                        (layout.annotations || []).forEach(annotation => { annotation.y = maxY; });
+                    }),
+                    restyle(runRate, {x: teams.map(row => teamNames[row.key]), y: teams.map(row => round2(row.runs / (row.balls / 6)))}),
+                    restyle(strikeRate, {x: legalTeams.map(row => teamNames[row.key]), y: legalTeams.map(row => (row.legal_batsman_runs / row.legal_balls) * 100)}),
+                    restyle(average, {x: teams.map(row => teamNames[row.key]), y: teams.map(row => round2(row.runs / row.matches))})
+                ];
+            },
+
+            bowlingPage: function (seasons, store, topWicketTakers, dismissalKind) {
+                const noUpdate = window.dash_clientside.no_update;
+                if (!store) {
+                    return Array(5).fill(noUpdate);
+                }
+                const selected = selectedSeasons(store, seasons);
+
+                const bowlers = topRows(sumBy(store.bowlers, 'bowler', ['wickets', 'balls'], selected), 'wickets', 10);
+                const top = bowlers[bowlers.length - 1];
+                const kinds = sumBy(store.dismissals, 'kind', ['dismissals'], selected);
+
+                return [
+                    seasonSum(store, 'wickets', selected),
+                    seasonSum(store, 'matches', selected),
+                    top ? `${store.names.bowler[top.key]} (${top.wickets} wickets)` : '-',
+                    restyle(topWicketTakers, {x: bowlers.map(row => row.wickets), y: bowlers.map(row => store.names.bowler[row.key])}),
+                    restyle(dismissalKind, {labels: DISMISSAL_LABELS, values: kinds.map(row => row.dismissals)})
+                ];
+            }
+        }
+    });
+})();
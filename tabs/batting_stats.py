@@ -1,100 +1,107 @@
-from dash import html, dcc, callback, Output, Input
+from dash import html, dcc, callback, clientside_callback, ClientsideFunction, Output, Input, State
 from utils.data_loader import (
-    load_data, get_highest_run_chase, get_top_scorers, get_total_runs, get_total_matches,
+    get_data, get_highest_run_chase, get_top_scorers, get_total_runs, get_total_matches,
     get_runs_distribution, get_runs_distribution_per_over, get_batting_runrate_by_team,
     get_batting_average_by_team, get_lowest_total, get_batting_strike_rate_by_team
 )
+from utils.aggregates import batting_summary
+from utils.callback_cache import season_cached
+from utils.client_store import CLIENTSIDE_FILTER, STORE_ID
+from utils.live_feed import LIVE_FEED, live_panel, register_live_panel
 
-matches_df, deliveries_df, ipl_df = load_data()
-seasons = matches_df['season'].unique()
-
-# Precompute initial values for layout (no season filter)
-initial_values = {
-    'total_runs': get_total_runs(ipl_df),
-    'total_matches': get_total_matches(matches_df),
-    'batsman_runs': get_top_scorers(ipl_df, 1),
-    'top_scorers_fig': get_top_scorers(ipl_df, 10),
-    'runs_distribution_fig': get_runs_distribution(ipl_df),
-    'runs_distribution_per_over_fig': get_runs_distribution_per_over(ipl_df),
-    'batting_runrate_by_team_fig': get_batting_runrate_by_team(ipl_df),
-    'batting_average_by_team_fig': get_batting_average_by_team(ipl_df),
-    'batting_strike_rate_by_team_fig': get_batting_strike_rate_by_team(ipl_df),
-    'highest_run_chase': get_highest_run_chase(matches_df),
-    'lowest_total': get_lowest_total(ipl_df)
-}
+def build_layout():
+    matches_df, deliveries_df, ipl_df = get_data()
+    seasons = matches_df['season'].unique()
+    # Precompute initial values for layout (no season filter)
+    initial_summary = batting_summary(ipl_df)
+    initial_values = {
+        'total_runs': get_total_runs(ipl_df, summary=initial_summary),
+        'total_matches': get_total_matches(matches_df),
+        'batsman_runs': get_top_scorers(ipl_df, 1, summary=initial_summary),
+        'top_scorers_fig': get_top_scorers(ipl_df, 10, summary=initial_summary),
+        'runs_distribution_fig': get_runs_distribution(ipl_df, summary=initial_summary),
+        'runs_distribution_per_over_fig': get_runs_distribution_per_over(ipl_df, summary=initial_summary),
+        'batting_runrate_by_team_fig': get_batting_runrate_by_team(ipl_df, summary=initial_summary),
+        'batting_average_by_team_fig': get_batting_average_by_team(ipl_df, summary=initial_summary),
+        'batting_strike_rate_by_team_fig': get_batting_strike_rate_by_team(ipl_df, summary=initial_summary),
+        'highest_run_chase': get_highest_run_chase(matches_df),
+        'lowest_total': get_lowest_total(ipl_df, summary=initial_summary)
+    }
 
-layout = html.Div([
-    html.Hr(),
-    html.Div([
-        dcc.Dropdown(
-            id='season-filter',
-            options=[{'label': i, 'value': i} for i in seasons],
-            value='',
-            multi=True,
-            className='season-filter',
-            placeholder="Select Season"
-        )
-    ]),
-    # KPI Cards
-    html.Div([
-        html.Div([
-            html.Div(initial_values['total_runs'], className='kpi-value', id='total_runs'),
-            html.Div('Total Runs', className='kpi-label')
-        ], className='kpi-card'),
+    return html.Div([
+        html.Hr(),
+        # Score and chart of the match in progress (IPL_LIVE_FEED)
+        *([live_panel('batting', 'runs')] if LIVE_FEED else []),
         html.Div([
-            html.Div(initial_values['total_matches'], className='kpi-value', id='batting_total_matches'),
-            html.Div('Total Matches', className='kpi-label')
-        ], className='kpi-card'),
+            dcc.Dropdown(
+                id='season-filter',
+                options=[{'label': i, 'value': i} for i in seasons],
+                value='',
+                multi=True,
+                className='season-filter',
+                placeholder="Select Season"
+            )
+        ]),
+        # KPI Cards
         html.Div([
-            html.Div(initial_values['batsman_runs'], className='kpi-value', id='top_scorer'),
-            html.Div('Top Scorer', className='kpi-label')
-        ], className='kpi-card'),
+            html.Div([
+                html.Div(initial_values['total_runs'], className='kpi-value', id='total_runs'),
+                html.Div('Total Runs', className='kpi-label')
+            ], className='kpi-card'),
+            html.Div([
+                html.Div(initial_values['total_matches'], className='kpi-value', id='batting_total_matches'),
+                html.Div('Total Matches', className='kpi-label')
+            ], className='kpi-card'),
+            html.Div([
+                html.Div(initial_values['batsman_runs'], className='kpi-value', id='top_scorer'),
+                html.Div('Top Scorer', className='kpi-label')
+            ], className='kpi-card'),
+            html.Div([
+                html.Div(initial_values['highest_run_chase'], className='kpi-value', id='highest_run_chase'),
+                html.Div('Highest Run Chase', className='kpi-label')
+            ], className='kpi-card'),
+            html.Div([
+                html.Div(initial_values['lowest_total'], className='kpi-value', id='lowest_total'),
+                html.Div('Lowest Total', className='kpi-label')
+            ], className='kpi-card'),
+            html.Div([
+                html.Div(initial_values['batting_runrate_by_team_fig'].data[0]['y'][0] if initial_values['batting_runrate_by_team_fig'].data else '-', className='kpi-value', id='batting_runrate'),
+                html.Div('Best Team Run Rate', className='kpi-label')
+            ], className='kpi-card'),
+            html.Div([
+                html.Div(round(initial_values['batting_strike_rate_by_team_fig'].data[0]['y'][0], 2) if initial_values['batting_strike_rate_by_team_fig'].data else '-', className='kpi-value', id='batting_strike_rate'),
+                html.Div('Best Team Strike Rate', className='kpi-label')
+            ], className='kpi-card'),
+            html.Div([
+                html.Div(initial_values['batting_average_by_team_fig'].data[0]['y'][0] if initial_values['batting_average_by_team_fig'].data else '-', className='kpi-value', id='batting_average'),
+                html.Div('Best Team Batting Avg', className='kpi-label')
+            ], className='kpi-card'),
+        ], className='kpi-row'),
+        # Toss Scorers
         html.Div([
-            html.Div(initial_values['highest_run_chase'], className='kpi-value', id='highest_run_chase'),
-            html.Div('Highest Run Chase', className='kpi-label')
-        ], className='kpi-card'),
+            html.Div([
+                dcc.Graph(figure=initial_values['top_scorers_fig'], id='top_scorers', className='chart-style')
+            ], className="half-chart"),
+            html.Div([
+                dcc.Graph(figure=initial_values['runs_distribution_fig'], id='runs_distribution', className='chart-style')
+            ], className="half-chart"),
+        ], className="chart-row"),
+        #runs per over
         html.Div([
-            html.Div(initial_values['lowest_total'], className='kpi-value', id='lowest_total'),
-            html.Div('Lowest Total', className='kpi-label')
-        ], className='kpi-card'),
+            dcc.Graph(figure=initial_values['runs_distribution_per_over_fig'], className="chart-style", id="runs_distribution_per_over")
+        ], className='full-chart'),
         html.Div([
-            html.Div(initial_values['batting_runrate_by_team_fig'].data[0]['y'][0] if initial_values['batting_runrate_by_team_fig'].data else '-', className='kpi-value', id='batting_runrate'),
-            html.Div('Best Team Run Rate', className='kpi-label')
-        ], className='kpi-card'),
+            dcc.Graph(figure=initial_values['batting_runrate_by_team_fig'], className="chart-style", id="batting_runrate_by_team")
+        ], className='full-chart'),
         html.Div([
-            html.Div(round(initial_values['batting_strike_rate_by_team_fig'].data[0]['y'][0], 2) if initial_values['batting_strike_rate_by_team_fig'].data else '-', className='kpi-value', id='batting_strike_rate'),
-            html.Div('Best Team Strike Rate', className='kpi-label')
-        ], className='kpi-card'),
+            dcc.Graph(figure=initial_values['batting_strike_rate_by_team_fig'], className="chart-style", id="batting_strike_rate_by_team")
+        ], className='full-chart'),
         html.Div([
-            html.Div(initial_values['batting_average_by_team_fig'].data[0]['y'][0] if initial_values['batting_average_by_team_fig'].data else '-', className='kpi-value', id='batting_average'),
-            html.Div('Best Team Batting Avg', className='kpi-label')
-        ], className='kpi-card'),
-    ], className='kpi-row'),
-    # Toss Scorers
-    html.Div([
-        html.Div([
-            dcc.Graph(figure=initial_values['top_scorers_fig'], id='top_scorers', className='chart-style')
-        ], className="half-chart"),
-        html.Div([
-            dcc.Graph(figure=initial_values['runs_distribution_fig'], id='runs_distribution', className='chart-style')
-        ], className="half-chart"),
-    ], className="chart-row"),
-    #runs per over
-    html.Div([
-        dcc.Graph(figure=initial_values['runs_distribution_per_over_fig'], className="chart-style", id="runs_distribution_per_over")
-    ], className='full-chart'),
-    html.Div([
-        dcc.Graph(figure=initial_values['batting_runrate_by_team_fig'], className="chart-style", id="batting_runrate_by_team")
-    ], className='full-chart'),
-    html.Div([
-        dcc.Graph(figure=initial_values['batting_strike_rate_by_team_fig'], className="chart-style", id="batting_strike_rate_by_team")
-    ], className='full-chart'),
-    html.Div([
-        dcc.Graph(figure=initial_values['batting_average_by_team_fig'], className="chart-style", id="batting_average_by_team")
-    ], className='full-chart'),
-])
+            dcc.Graph(figure=initial_values['batting_average_by_team_fig'], className="chart-style", id="batting_average_by_team")
+        ], className='full-chart'),
+    ])
 
-@callback(
+PAGE_OUTPUTS = [
     Output(component_id='total_runs', component_property='children'),
     Output(component_id='batting_total_matches', component_property='children'),
     Output(component_id='top_scorer', component_property='children'),
@@ -105,23 +112,27 @@ layout = html.Div([
     Output(component_id='runs_distribution_per_over', component_property='figure'),
     Output(component_id='batting_runrate_by_team', component_property='figure'),
     Output(component_id='batting_strike_rate_by_team', component_property='figure'),
-    Output(component_id='batting_average_by_team', component_property='figure'),
-    Input(component_id='season-filter', component_property='value')
-)
+    Output(component_id='batting_average_by_team', component_property='figure')
+]
+
+@season_cached()
 def update_page(selected_seasons):
+    matches_df, deliveries_df, ipl_df = get_data()
+    # One pass over the selected seasons feeds every chart below
+    summary = batting_summary(ipl_df, selected_seasons)
     # Use a dict to group all outputs for clarity
     outputs = {
-        'total_runs': get_total_runs(ipl_df, selected_seasons),
+        'total_runs': get_total_runs(ipl_df, selected_seasons, summary=summary),
         'total_matches': get_total_matches(matches_df, selected_seasons),
-        'batsman_runs': get_top_scorers(ipl_df, 1, selected_seasons),
-        'top_scorers_fig': get_top_scorers(ipl_df, 10, selected_seasons),
-        'runs_distribution_fig': get_runs_distribution(ipl_df, selected_seasons),
-        'runs_distribution_per_over_fig': get_runs_distribution_per_over(ipl_df, selected_seasons),
-        'batting_runrate_by_team_fig': get_batting_runrate_by_team(ipl_df, selected_seasons),
-        'batting_strike_rate_by_team_fig': get_batting_strike_rate_by_team(ipl_df, selected_seasons),
-        'batting_average_by_team_fig': get_batting_average_by_team(ipl_df, selected_seasons),
+        'batsman_runs': get_top_scorers(ipl_df, 1, selected_seasons, summary=summary),
+        'top_scorers_fig': get_top_scorers(ipl_df, 10, selected_seasons, summary=summary),
+        'runs_distribution_fig': get_runs_distribution(ipl_df, selected_seasons, summary=summary),
+        'runs_distribution_per_over_fig': get_runs_distribution_per_over(ipl_df, selected_seasons, summary=summary),
+        'batting_runrate_by_team_fig': get_batting_runrate_by_team(ipl_df, selected_seasons, summary=summary),
+        'batting_strike_rate_by_team_fig': get_batting_strike_rate_by_team(ipl_df, selected_seasons, summary=summary),
+        'batting_average_by_team_fig': get_batting_average_by_team(ipl_df, selected_seasons, summary=summary),
         'highest_run_chase': get_highest_run_chase(matches_df, selected_seasons),
-        'lowest_total': get_lowest_total(ipl_df, selected_seasons)
+        'lowest_total': get_lowest_total(ipl_df, selected_seasons, summary=summary)
     }
     return (
         outputs['total_runs'],
@@ -136,3 +147,24 @@ def update_page(selected_seasons):
         outputs['batting_strike_rate_by_team_fig'],
         outputs['batting_average_by_team_fig']
     )
+
+
+if CLIENTSIDE_FILTER:
+    # Re-aggregate the shipped per-season store in the browser instead of calling the server
+    clientside_callback(
+        ClientsideFunction(namespace='ipl', function_name='battingPage'),
+        *PAGE_OUTPUTS,
+        Input(component_id='season-filter', component_property='value'),
+        State(component_id=STORE_ID, component_property='data'),
+        State(component_id='top_scorers', component_property='figure'),
+        State(component_id='runs_distribution', component_property='figure'),
+        State(component_id='runs_distribution_per_over', component_property='figure'),
+        State(component_id='batting_runrate_by_team', component_property='figure'),
+        State(component_id='batting_strike_rate_by_team', component_property='figure'),
+        State(component_id='batting_average_by_team', component_property='figure')
+    )
+else:
+    callback(*PAGE_OUTPUTS, Input(component_id='season-filter', component_property='value'))(update_page)
+
+if LIVE_FEED:
+    register_live_panel('batting', 'runs')
@@ -1,111 +1,118 @@
-from dash import html, dcc, callback, Output, Input
+from dash import html, dcc, callback, clientside_callback, ClientsideFunction, Output, Input, State
 from utils.data_loader import (
-    load_data, get_top_bowlers, get_total_wickets, get_total_matches, get_best_bowling_figures,
+    get_data, get_top_bowlers, get_total_wickets, get_total_matches, get_best_bowling_figures,
     get_bowling_average_by_team, get_most_expensive_overs, get_dismissal_kind,
     get_most_number_of_hattricks, get_bowling_strike_rate_by_team, get_bowling_economy_by_team,
     get_best_team_average, get_best_team_economy, get_best_team_strike_rate
 )
+from utils.aggregates import bowling_summary
+from utils.callback_cache import season_cached
+from utils.client_store import CLIENTSIDE_FILTER, STORE_ID
+from utils.live_feed import LIVE_FEED, live_panel, register_live_panel
 
-matches_df, deliveries_df, ipl_df = load_data()
-seasons = matches_df['season'].unique()
+def build_layout():
+    matches_df, deliveries_df, ipl_df = get_data()
+    seasons = matches_df['season'].unique()
+    # Precompute initial values for layout (no season filter) using dictionary comprehension for consistency
+    initial_summary = bowling_summary(ipl_df)
+    top_bowlers_wickets, top_bowlers_economy = get_top_bowlers(ipl_df, 10, summary=initial_summary)
+    initial_values = {
+        'total_wickets': get_total_wickets(ipl_df, summary=initial_summary),
+        'bowler_wickets': get_top_bowlers(ipl_df, 1, summary=initial_summary),
+        'top_wicket_takers': top_bowlers_wickets,
+        'top_bowlers_by_economy': top_bowlers_economy,
+        'total_matches': get_total_matches(matches_df),
+        'most_expensive_overs': get_most_expensive_overs(ipl_df, 10, summary=initial_summary),
+        'dismissal_kind': get_dismissal_kind(ipl_df, summary=initial_summary),
+        'most_number_of_hattricks': get_most_number_of_hattricks(ipl_df),
+        'best_bowling_figures': get_best_bowling_figures(ipl_df, summary=initial_summary),
+        'bowling_strike_rate_by_team': get_bowling_strike_rate_by_team(ipl_df, summary=initial_summary),
+        'bowling_average_by_team': get_bowling_average_by_team(ipl_df, summary=initial_summary),
+        'bowling_economy_by_team': get_bowling_economy_by_team(ipl_df, summary=initial_summary),
+        'best_team_average': get_best_team_average(ipl_df, summary=initial_summary),
+        'best_team_economy': get_best_team_economy(ipl_df, summary=initial_summary),
+        'best_team_strike_rate': get_best_team_strike_rate(ipl_df, summary=initial_summary)
 
-# Precompute initial values for layout (no season filter) using dictionary comprehension for consistency
-top_bowlers_wickets, top_bowlers_economy = get_top_bowlers(ipl_df, 10)
-initial_values = {
-    'total_wickets': get_total_wickets(ipl_df),
-    'bowler_wickets': get_top_bowlers(ipl_df, 1),
-    'top_wicket_takers': top_bowlers_wickets,
-    'top_bowlers_by_economy': top_bowlers_economy,
-    'total_matches': get_total_matches(matches_df),
-    'most_expensive_overs': get_most_expensive_overs(ipl_df, 10),
-    'dismissal_kind': get_dismissal_kind(ipl_df),
-    'most_number_of_hattricks': get_most_number_of_hattricks(ipl_df),
-    'best_bowling_figures': get_best_bowling_figures(ipl_df),
-    'bowling_strike_rate_by_team': get_bowling_strike_rate_by_team(ipl_df),
-    'bowling_average_by_team': get_bowling_average_by_team(ipl_df),
-    'bowling_economy_by_team': get_bowling_economy_by_team(ipl_df),
-    'best_team_average': get_best_team_average(ipl_df),
-    'best_team_economy': get_best_team_economy(ipl_df),
-    'best_team_strike_rate': get_best_team_strike_rate(ipl_df)
-    
-}
+    }
 
-layout = html.Div([
-    html.Hr(),
-    html.Div([
-        dcc.Dropdown(
-            id='season-filter',
-            options=[{'label': i, 'value': i} for i in seasons],
-            value='',
-            multi=True,
-            className='season-filter',
-            placeholder="Select Season"
-        )
-    ]),
-    # KPI Cards
-    html.Div([
-        html.Div([
-            html.Div(initial_values['total_wickets'], className='kpi-value', id='total_wickets'),
-            html.Div('Total Wickets', className='kpi-label')
-        ], className='kpi-card'),
-        html.Div([
-            html.Div(initial_values['total_matches'], className='kpi-value', id='bowling_total_matches'),
-            html.Div('Total Matches', className='kpi-label')
-        ], className='kpi-card'),
-        html.Div([
-            html.Div(initial_values['bowler_wickets'], className='kpi-value', id='highest_wicket_taker'),
-            html.Div('Highest Wicket Taker', className='kpi-label')
-        ], className='kpi-card'),
+    return html.Div([
+        html.Hr(),
+        # Score and chart of the match in progress (IPL_LIVE_FEED)
+        *([live_panel('bowling', 'wickets')] if LIVE_FEED else []),
         html.Div([
-            html.Div(initial_values['best_bowling_figures'], className='kpi-value', id='best_bowling_figures'),
-            html.Div('Best Bowling Figures', className='kpi-label')
-        ], className='kpi-card'),
+            dcc.Dropdown(
+                id='season-filter',
+                options=[{'label': i, 'value': i} for i in seasons],
+                value='',
+                multi=True,
+                className='season-filter',
+                placeholder="Select Season"
+            )
+        ]),
+        # KPI Cards
         html.Div([
-            html.Div(initial_values['most_number_of_hattricks'], className='kpi-value', id='most_number_of_hattricks'),
-            html.Div('Most No.of Hattricks', className='kpi-label')
-        ], className='kpi-card'),
+            html.Div([
+                html.Div(initial_values['total_wickets'], className='kpi-value', id='total_wickets'),
+                html.Div('Total Wickets', className='kpi-label')
+            ], className='kpi-card'),
+            html.Div([
+                html.Div(initial_values['total_matches'], className='kpi-value', id='bowling_total_matches'),
+                html.Div('Total Matches', className='kpi-label')
+            ], className='kpi-card'),
+            html.Div([
+                html.Div(initial_values['bowler_wickets'], className='kpi-value', id='highest_wicket_taker'),
+                html.Div('Highest Wicket Taker', className='kpi-label')
+            ], className='kpi-card'),
+            html.Div([
+                html.Div(initial_values['best_bowling_figures'], className='kpi-value', id='best_bowling_figures'),
+                html.Div('Best Bowling Figures', className='kpi-label')
+            ], className='kpi-card'),
+            html.Div([
+                html.Div(initial_values['most_number_of_hattricks'], className='kpi-value', id='most_number_of_hattricks'),
+                html.Div('Most No.of Hattricks', className='kpi-label')
+            ], className='kpi-card'),
+            html.Div([
+                html.Div(initial_values['best_team_economy'], className='kpi-value', id='best_team_economy'),
+                html.Div('Best Team Economy', className='kpi-label')
+            ], className='kpi-card'),
+            html.Div([
+                html.Div(initial_values['best_team_strike_rate'], className='kpi-value', id='best_team_strike_rate'),
+                html.Div('Best Team Strike Rate', className='kpi-label')
+            ], className='kpi-card'),
+            html.Div([
+                html.Div(initial_values['best_team_average'], className='kpi-value', id='best_team_average'),
+                html.Div('Best Team Bowling Avg', className='kpi-label')
+            ], className='kpi-card'),
+        ], className='kpi-row'),
+        # Toss Scorers
         html.Div([
-            html.Div(initial_values['best_team_economy'], className='kpi-value', id='best_team_economy'),
-            html.Div('Best Team Economy', className='kpi-label')
-        ], className='kpi-card'),
+            html.Div([
+                dcc.Graph(figure=initial_values['top_wicket_takers'], id='top_wicket_takers', className='chart-style')
+            ], className="half-chart"),
+            html.Div([
+                dcc.Graph(figure=initial_values['most_expensive_overs'], id='most_expensive_overs', className='chart-style')
+            ], className="half-chart"),
+        ], className="chart-row"),
         html.Div([
-            html.Div(initial_values['best_team_strike_rate'], className='kpi-value', id='best_team_strike_rate'),
-            html.Div('Best Team Strike Rate', className='kpi-label')
-        ], className='kpi-card'),
+            html.Div([
+                dcc.Graph(figure=initial_values['top_bowlers_by_economy'], id='top_bowlers_by_economy', className='chart-style')
+            ], className="half-chart"),
+            html.Div([
+                dcc.Graph(figure=initial_values['dismissal_kind'], id='dismissal_kind', className='chart-style')
+            ], className="half-chart"),
+        ], className="chart-row"),
         html.Div([
-            html.Div(initial_values['best_team_average'], className='kpi-value', id='best_team_average'),
-            html.Div('Best Team Bowling Avg', className='kpi-label')
-        ], className='kpi-card'),
-    ], className='kpi-row'),
-    # Toss Scorers
-    html.Div([
+            dcc.Graph(figure=initial_values['bowling_economy_by_team'], className="chart-style", id="bowling_economy_by_team")
+        ], className='full-chart'),
         html.Div([
-            dcc.Graph(figure=initial_values['top_wicket_takers'], id='top_wicket_takers', className='chart-style')
-        ], className="half-chart"),
+            dcc.Graph(figure=initial_values['bowling_strike_rate_by_team'], className="chart-style", id="bowling_strike_rate_by_team")
+        ], className='full-chart'),
         html.Div([
-            dcc.Graph(figure=initial_values['most_expensive_overs'], id='most_expensive_overs', className='chart-style')
-        ], className="half-chart"),
-    ], className="chart-row"),
-    html.Div([
-        html.Div([
-            dcc.Graph(figure=initial_values['top_bowlers_by_economy'], id='top_bowlers_by_economy', className='chart-style')
-        ], className="half-chart"),
-        html.Div([
-            dcc.Graph(figure=initial_values['dismissal_kind'], id='dismissal_kind', className='chart-style')
-        ], className="half-chart"),
-    ], className="chart-row"),
-    html.Div([
-        dcc.Graph(figure=initial_values['bowling_economy_by_team'], className="chart-style", id="bowling_economy_by_team")
-    ], className='full-chart'),
-    html.Div([
-        dcc.Graph(figure=initial_values['bowling_strike_rate_by_team'], className="chart-style", id="bowling_strike_rate_by_team")
-    ], className='full-chart'),
-    html.Div([
-        dcc.Graph(figure=initial_values['bowling_average_by_team'], className="chart-style", id="bowling_average_by_team")
-    ], className='full-chart'),
-])
+            dcc.Graph(figure=initial_values['bowling_average_by_team'], className="chart-style", id="bowling_average_by_team")
+        ], className='full-chart'),
+    ])
 
-@callback(
+PAGE_OUTPUTS = [
     Output(component_id='total_wickets', component_property='children'),
     Output(component_id='bowling_total_matches', component_property='children'),
     Output(component_id='highest_wicket_taker', component_property='children'),
@@ -119,26 +126,32 @@ layout = html.Div([
     Output(component_id='dismissal_kind', component_property='figure'),
     Output(component_id='bowling_economy_by_team', component_property='figure'),
     Output(component_id='bowling_strike_rate_by_team', component_property='figure'),
-    Output(component_id='bowling_average_by_team', component_property='figure'),
-    Input(component_id='season-filter', component_property='value')
-)
+    Output(component_id='bowling_average_by_team', component_property='figure')
+]
+# Outputs recomputed in the browser when client-side season filtering is on
+CLIENT_OUTPUTS = ['total_wickets', 'bowling_total_matches', 'highest_wicket_taker', 'top_wicket_takers', 'dismissal_kind']
+
+@season_cached()
 def update_page(selected_seasons):
-    top_wicket_takers_fig, _ = get_top_bowlers(ipl_df, 10, selected_seasons)
+    matches_df, deliveries_df, ipl_df = get_data()
+    # One pass over the selected seasons feeds every chart below
+    summary = bowling_summary(ipl_df, selected_seasons)
+    top_wicket_takers_fig, _ = get_top_bowlers(ipl_df, 10, selected_seasons, summary=summary)
     outputs = {
-        'total_wickets': get_total_wickets(ipl_df, selected_seasons),
+        'total_wickets': get_total_wickets(ipl_df, selected_seasons, summary=summary),
         'total_matches': get_total_matches(matches_df, selected_seasons),
-        'highest_wicket_taker': get_top_bowlers(ipl_df, 1, selected_seasons),
-        'best_bowling_figures': get_best_bowling_figures(ipl_df, selected_seasons),
+        'highest_wicket_taker': get_top_bowlers(ipl_df, 1, selected_seasons, summary=summary),
+        'best_bowling_figures': get_best_bowling_figures(ipl_df, selected_seasons, summary=summary),
         'most_number_of_hattricks': get_most_number_of_hattricks(ipl_df, selected_seasons),
         'top_wicket_takers': top_wicket_takers_fig,
-        'most_expensive_overs': get_most_expensive_overs(ipl_df, 10, selected_seasons),
-        'dismissal_kind': get_dismissal_kind(ipl_df, selected_seasons),
-        'bowling_economy_by_team': get_bowling_economy_by_team(ipl_df, selected_seasons),
-        'bowling_strike_rate_by_team': get_bowling_strike_rate_by_team(ipl_df, selected_seasons),
-        'bowling_average_by_team': get_bowling_average_by_team(ipl_df, selected_seasons),
-        'best_team_average': get_best_team_average(ipl_df, selected_seasons),
-        'best_team_economy': get_best_team_economy(ipl_df, selected_seasons),
-        'best_team_strike_rate': get_best_team_strike_rate(ipl_df, selected_seasons)
+        'most_expensive_overs': get_most_expensive_overs(ipl_df, 10, selected_seasons, summary=summary),
+        'dismissal_kind': get_dismissal_kind(ipl_df, selected_seasons, summary=summary),
+        'bowling_economy_by_team': get_bowling_economy_by_team(ipl_df, selected_seasons, summary=summary),
+        'bowling_strike_rate_by_team': get_bowling_strike_rate_by_team(ipl_df, selected_seasons, summary=summary),
+        'bowling_average_by_team': get_bowling_average_by_team(ipl_df, selected_seasons, summary=summary),
+        'best_team_average': get_best_team_average(ipl_df, selected_seasons, summary=summary),
+        'best_team_economy': get_best_team_economy(ipl_df, selected_seasons, summary=summary),
+        'best_team_strike_rate': get_best_team_strike_rate(ipl_df, selected_seasons, summary=summary)
     }
     return (
         outputs['total_wickets'],
@@ -156,3 +169,42 @@ def update_page(selected_seasons):
         outputs['bowling_strike_rate_by_team'],
         outputs['bowling_average_by_team']
     )
+
+
+@season_cached()
+def update_server_page(selected_seasons):
+    matches_df, deliveries_df, ipl_df = get_data()
+    # The outputs of update_page that need ball-level data, in PAGE_OUTPUTS order
+    summary = bowling_summary(ipl_df, selected_seasons)
+    return (
+        get_best_bowling_figures(ipl_df, selected_seasons, summary=summary),
+        get_most_number_of_hattricks(ipl_df, selected_seasons),
+        get_best_team_average(ipl_df, selected_seasons, summary=summary),
+        get_best_team_economy(ipl_df, selected_seasons, summary=summary),
+        get_best_team_strike_rate(ipl_df, selected_seasons, summary=summary),
+        get_most_expensive_overs(ipl_df, 10, selected_seasons, summary=summary),
+        get_bowling_economy_by_team(ipl_df, selected_seasons, summary=summary),
+        get_bowling_strike_rate_by_team(ipl_df, selected_seasons, summary=summary),
+        get_bowling_average_by_team(ipl_df, selected_seasons, summary=summary)
+    )
+
+
+if CLIENTSIDE_FILTER:
+    # Re-aggregate the shipped per-season store in the browser for the additive outputs
+    clientside_callback(
+        ClientsideFunction(namespace='ipl', function_name='bowlingPage'),
+        *[output for output in PAGE_OUTPUTS if output.component_id in CLIENT_OUTPUTS],
+        Input(component_id='season-filter', component_property='value'),
+        State(component_id=STORE_ID, component_property='data'),
+        State(component_id='top_wicket_takers', component_property='figure'),
+        State(component_id='dismissal_kind', component_property='figure')
+    )
+    callback(
+        *[output for output in PAGE_OUTPUTS if output.component_id not in CLIENT_OUTPUTS],
+        Input(component_id='season-filter', component_property='value')
+    )(update_server_page)
+else:
+    callback(*PAGE_OUTPUTS, Input(component_id='season-filter', component_property='value'))(update_page)
+
+if LIVE_FEED:
+    register_live_panel('bowling', 'wickets')
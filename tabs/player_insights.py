@@ -1,56 +1,70 @@
 from dash import html, dcc, callback, Output, Input, dash_table
-from utils.data_loader import load_data, BATSMANS, BOWLERS, ALL_ROUNDERS, get_batter_runs, get_batter_strike_rate_average, get_batter_runs_against_other_teams, get_batter_runs_at_each_venue,get_bowler_wickets, get_bowler_strike_rate_average, get_bowler_economy, get_bowler_wickets_against_other_teams, get_bowler_wickets_at_each_venue, get_player_stats
-matches_df, deliveries_df, ipl_df = load_data()
-seasons = matches_df['season'].unique()
-
-layout = html.Div([
-    html.Hr(),
-    html.Div([
-        # dcc.Dropdown(
-        #     id='season-filter',
-        #     options=[{'label': i, 'value': i} for i in seasons],
-        #     value='',
-        #     multi=True,
-        #     className='season-filter',
-        #     placeholder="Select Season"
-        # ),
-        dcc.Dropdown(
-            id='player1-filter',
-            options=[
-                {'label': '--- Batsman ---', 'value': 'batsman-separator', 'disabled': True},
-                *[{'label': i, 'value': i} for i in BATSMANS],
-                {'label': '--- Bowlers ---', 'value': 'bowler-separator', 'disabled': True},
-                *[{'label': i, 'value': i} for i in BOWLERS],
-                {'label': '--- All-rounders ---', 'value': 'allrounder-separator', 'disabled': True},
-                *[{'label': i, 'value': i} for i in ALL_ROUNDERS],
-            ],
-            value='',
-            className='player1-filter',
-            placeholder="Select Player 1"
-        ),
-        dcc.Dropdown(
-            id='player2-filter',
-            options=[],
-            value='',
-            className='player2-filter',
-            placeholder="Select Player 2"
-        ),
-    ], className='filters'),
-    html.Div(id='batter-key-metrics-row-container'),
-    html.Div(id='batter-runs-row-container'),
-    html.Div(id='batter-sr-row-container'),
-    html.Div(id='batter-avg-row-container'),
-    html.Div(id='batter-runs-agnst-oth-teams-row-container'),
-    html.Div(id='batter-runs-at-each-venue'),
-    
-    html.Div(id='bowler-key-metrics-row-container'),
-    html.Div(id='bowler-wickets-row-container'),
-    html.Div(id='bowler-sr-row-container'),
-    html.Div(id='bowler-avg-row-container'),
-    html.Div(id='bowler-economy-row-container'),
-    html.Div(id='bowler-wickets-agnst-oth-teams-row-container'),
-    html.Div(id='bowler-wickets-at-each-venue')
-])
+from utils.data_loader import get_data, BATSMANS, BOWLERS, ALL_ROUNDERS, get_batter_runs, get_batter_strike_rate_average, get_batter_runs_against_other_teams, get_batter_runs_at_each_venue,get_bowler_wickets, get_bowler_strike_rate_average, get_bowler_economy, get_bowler_wickets_against_other_teams, get_bowler_wickets_at_each_venue, get_player_stats
+from utils.aggregates import player_team_index, player_row_index, player_profiles
+
+def build_layout():
+    matches_df, deliveries_df, ipl_df = get_data()
+    seasons = matches_df['season'].unique()
+    # Build the player -> season -> team index used to colour the charts, the per-player row index and
+    # the career profiles behind the KPI cards before the tab is first shown
+    player_team_index(ipl_df)
+    player_row_index(ipl_df)
+    player_profiles(ipl_df)
+
+    return html.Div([
+        html.Hr(),
+        html.Div([
+            # dcc.Dropdown(
+            #     id='season-filter',
+            #     options=[{'label': i, 'value': i} for i in seasons],
+            #     value='',
+            #     multi=True,
+            #     className='season-filter',
+            #     placeholder="Select Season"
+            # ),
+            dcc.Dropdown(
+                id='player1-filter',
+                options=[
+                    {'label': '--- Batsman ---', 'value': 'batsman-separator', 'disabled': True},
+                    *[{'label': i, 'value': i} for i in BATSMANS],
+                    {'label': '--- Bowlers ---', 'value': 'bowler-separator', 'disabled': True},
+                    *[{'label': i, 'value': i} for i in BOWLERS],
+                    {'label': '--- All-rounders ---', 'value': 'allrounder-separator', 'disabled': True},
+                    *[{'label': i, 'value': i} for i in ALL_ROUNDERS],
+                ],
+                value='',
+                className='player1-filter',
+                placeholder="Select Player 1"
+            ),
+            dcc.Dropdown(
+                id='player2-filter',
+                options=[],
+                value='',
+                className='player2-filter',
+                placeholder="Select Player 2"
+            ),
+        ], className='filters'),
+        html.Div([
+            html.Span('Download stats export: '),
+            html.A('Batsmen', href='/exports/batter_stats.csv'), ' | ',
+            html.A('Bowlers', href='/exports/bowler_stats.csv'), ' | ',
+            html.A('All-rounders', href='/exports/allrounder_stats.csv')
+        ], className='export-links'),
+        html.Div(id='batter-key-metrics-row-container'),
+        html.Div(id='batter-runs-row-container'),
+        html.Div(id='batter-sr-row-container'),
+        html.Div(id='batter-avg-row-container'),
+        html.Div(id='batter-runs-agnst-oth-teams-row-container'),
+        html.Div(id='batter-runs-at-each-venue'),
+
+        html.Div(id='bowler-key-metrics-row-container'),
+        html.Div(id='bowler-wickets-row-container'),
+        html.Div(id='bowler-sr-row-container'),
+        html.Div(id='bowler-avg-row-container'),
+        html.Div(id='bowler-economy-row-container'),
+        html.Div(id='bowler-wickets-agnst-oth-teams-row-container'),
+        html.Div(id='bowler-wickets-at-each-venue')
+    ])
 
 
 
@@ -100,6 +114,7 @@ def update_player2_options(selected_player1):
     Input('player2-filter', 'value')
 )
 def update_player_content(player1, player2, seasons=None):
+    matches_df, deliveries_df, ipl_df = get_data()
     if not player1:
         return html.Div("Select Player 1", className="compare-msg"), *[None]*12
 
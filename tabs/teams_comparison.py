@@ -1,46 +1,49 @@
 from dash import html, dcc, callback, Output, Input, dash_table
-from utils.data_loader import load_data, get_team_stats, get_teams_stats_figs, get_team_wins_fig, get_head_to_head_win_stats, get_powerplay_death_batting_stats, get_powerplay_death_bowling_stats, get_top_scorer_top_bowler_stats, get_boundary_count, get_dismissal_type_distribution, get_batting_strike_rate, get_bowling_economy
+from utils.data_loader import get_data, get_team_stats, get_teams_stats_figs, get_team_wins_fig, get_head_to_head_win_stats, get_powerplay_death_batting_stats, get_powerplay_death_bowling_stats, get_top_scorer_top_bowler_stats, get_boundary_count, get_dismissal_type_distribution, get_batting_strike_rate, get_bowling_economy
+from utils.callback_cache import season_cached
+from utils.producers import run_producers
 
-matches_df, deliveries_df, ipl_df = load_data()
-seasons = matches_df['season'].unique()
 teams = ['Royal Challengers Bengaluru', 'Punjab Kings', 'Delhi Capitals', 'Mumbai Indians', 'Kolkata Knight Riders', 'Rajasthan Royals', 'Sunrisers Hyderabad', 'Chennai Super Kings', 'Gujarat Titans', 'Lucknow Super Giants']
 
-layout = html.Div([
-    html.Hr(),
-    html.Div([
-        dcc.Dropdown(
-            id='season-filter',
-            options=[{'label': i, 'value': i} for i in seasons],
-            value='',
-            multi=True,
-            className='season-filter',
-            placeholder="Select Season"
-        ),
-        dcc.Dropdown(
-            id='team1-filter',
-            options=[{'label': i, 'value': i} for i in teams],
-            value='',
-            className='team1-filter',
-            placeholder="Select Team 1"
-        ),
-        dcc.Dropdown(
-            id='team2-filter',
-            options=[{'label': i, 'value': i} for i in teams],
-            value='',
-            className='team2-filter',
-            placeholder="Select Team 2"
-        ),
-    ], className='filters'),
-    html.Div(id='comparison-content'),
-    html.Div(id='stats-row-container'),
-    html.Div(id='other-stats-row-container'),
-    html.Div(id='wickets-stats-row-container'),
-    html.Div(id='wins-row-container'),
-    html.Div(id='batting-stats-row-container'),
-    html.Div(id='bowling-stats-row-container'),
-    html.Div(id='strike-rate-row-container'),
-    html.Div(id='bowling-economy-row-container')
-])
+def build_layout():
+    matches_df, deliveries_df, ipl_df = get_data()
+    seasons = matches_df['season'].unique()
+    return html.Div([
+        html.Hr(),
+        html.Div([
+            dcc.Dropdown(
+                id='season-filter',
+                options=[{'label': i, 'value': i} for i in seasons],
+                value='',
+                multi=True,
+                className='season-filter',
+                placeholder="Select Season"
+            ),
+            dcc.Dropdown(
+                id='team1-filter',
+                options=[{'label': i, 'value': i} for i in teams],
+                value='',
+                className='team1-filter',
+                placeholder="Select Team 1"
+            ),
+            dcc.Dropdown(
+                id='team2-filter',
+                options=[{'label': i, 'value': i} for i in teams],
+                value='',
+                className='team2-filter',
+                placeholder="Select Team 2"
+            ),
+        ], className='filters'),
+        html.Div(id='comparison-content'),
+        html.Div(id='stats-row-container'),
+        html.Div(id='other-stats-row-container'),
+        html.Div(id='wickets-stats-row-container'),
+        html.Div(id='wins-row-container'),
+        html.Div(id='batting-stats-row-container'),
+        html.Div(id='bowling-stats-row-container'),
+        html.Div(id='strike-rate-row-container'),
+        html.Div(id='bowling-economy-row-container')
+    ])
 
 
 @callback(
@@ -73,25 +76,32 @@ def update_team1_options(selected_team2):
     Input('team2-filter', 'value'),
     Input('season-filter', 'value')
 )
+@season_cached()
 def update_comparison_content(team1, team2, seasons):
+    matches_df, deliveries_df, ipl_df = get_data()
     if not team1 or not team2:
         # Only show the warning message if one of the teams is not selected
         return html.Div("Select both teams to compare.", className="compare-msg"), None, None, None, None, None, None, None, None
 
-    # Compute all figures and tables in a dictionary for maintainability
-    outputs = {}
-    outputs['team1_df'] = get_team_stats(ipl_df, team1, seasons)
-    outputs['team2_df'] = get_team_stats(ipl_df, team2, seasons)
-    outputs['basic_stats'], outputs['batting_stats'], outputs['bowling_stats'] = get_teams_stats_figs(ipl_df, team1, team2, seasons)
-    outputs['team_wins'] = get_team_wins_fig(matches_df, team1, team2)
-    outputs['head_to_head'] = get_head_to_head_win_stats(matches_df, team1, team2, seasons)
-    outputs['powerplay_overs_batting_stats'], outputs['death_overs_batting_stats'] = get_powerplay_death_batting_stats(ipl_df, team1, team2)
-    outputs['powerplay_overs_bowling_stats'], outputs['death_overs_bowling_stats'] = get_powerplay_death_bowling_stats(ipl_df, team1, team2)
-    outputs['top_scorer_top_bowler_stats'] = get_top_scorer_top_bowler_stats(ipl_df, team1, team2, seasons)
-    outputs['boundary_count'] = get_boundary_count(ipl_df, team1, team2, seasons)
-    outputs['wicket_taken_stats'], outputs['wicket_lost_stats'] = get_dismissal_type_distribution(ipl_df, team1, team2, seasons)
-    outputs['strike_rate_stats'] = get_batting_strike_rate(ipl_df, team1, team2)
-    outputs['bowling_economy_stats'] = get_bowling_economy(ipl_df, team1, team2)
+    # Compute all figures and tables concurrently; the normalized charts reuse both teams' tables
+    outputs = run_producers('teams_comparison.update_comparison_content', {
+        'team1_df': lambda: get_team_stats(ipl_df, team1, seasons),
+        'team2_df': lambda: get_team_stats(ipl_df, team2, seasons),
+        'stats_figs': (lambda team1_df, team2_df: get_teams_stats_figs(ipl_df, team1, team2, seasons, team_stats=(team1_df, team2_df)), ['team1_df', 'team2_df']),
+        'team_wins': lambda: get_team_wins_fig(matches_df, team1, team2),
+        'head_to_head': lambda: get_head_to_head_win_stats(matches_df, team1, team2, seasons),
+        'powerplay_death_batting_stats': lambda: get_powerplay_death_batting_stats(ipl_df, team1, team2),
+        'powerplay_death_bowling_stats': lambda: get_powerplay_death_bowling_stats(ipl_df, team1, team2),
+        'top_scorer_top_bowler_stats': lambda: get_top_scorer_top_bowler_stats(ipl_df, team1, team2, seasons),
+        'boundary_count': lambda: get_boundary_count(ipl_df, team1, team2, seasons),
+        'dismissal_type_distribution': lambda: get_dismissal_type_distribution(ipl_df, team1, team2, seasons),
+        'strike_rate_stats': lambda: get_batting_strike_rate(ipl_df, team1, team2),
+        'bowling_economy_stats': lambda: get_bowling_economy(ipl_df, team1, team2)
+    })
+    outputs['basic_stats'], outputs['batting_stats'], outputs['bowling_stats'] = outputs['stats_figs']
+    outputs['powerplay_overs_batting_stats'], outputs['death_overs_batting_stats'] = outputs['powerplay_death_batting_stats']
+    outputs['powerplay_overs_bowling_stats'], outputs['death_overs_bowling_stats'] = outputs['powerplay_death_bowling_stats']
+    outputs['wicket_taken_stats'], outputs['wicket_lost_stats'] = outputs['dismissal_type_distribution']
 
     # Tables
     comparison_tables = html.Div([
@@ -0,0 +1,19 @@
+"""
+Run the tests on a synthetic dataset rather than the files in data/.
+utils.data_loader loads its data when imported, so the dataset is generated (once, under the
+git-ignored data/synthetic/) and selected here, before any test module imports it.
+"""
+import os
+
+from utils.synthetic_data import write_dataset
+
+TEST_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'synthetic', 'tests')
+MATCHES_CSV = os.path.join(TEST_DATA_DIR, 'matches.csv')
+DELIVERIES_CSV = os.path.join(TEST_DATA_DIR, 'deliveries.csv')
+
+if not (os.path.exists(MATCHES_CSV) and os.path.exists(DELIVERIES_CSV)):
+    write_dataset(TEST_DATA_DIR, scale=0.3, seed=0)
+os.environ['IPL_MATCHES_CSV'] = MATCHES_CSV
+os.environ['IPL_DELIVERIES_CSV'] = DELIVERIES_CSV
+# Keep the tests away from the data cache in data/cache/
+os.environ['IPL_DATA_CACHE'] = '0'
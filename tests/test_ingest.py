@@ -0,0 +1,88 @@
+"""
+Adding a finished match with ingest_match() gives the same store as loading the full data.
+"""
+import pandas as pd
+import pytest
+
+from utils import aggregates, data_loader
+
+
+def _write(tmp_path, name, matches, deliveries):
+    directory = tmp_path / name
+    directory.mkdir()
+    matches.to_csv(directory / 'matches.csv', index=False)
+    deliveries.to_csv(directory / 'deliveries.csv', index=False)
+    return str(directory / 'matches.csv'), str(directory / 'deliveries.csv')
+
+
+def _assert_store_frame_equal(actual, expected):
+    # assert_frame_equal boxes categorical values one by one, which takes seconds on the ball data
+    pd.testing.assert_series_equal(actual.dtypes, expected.dtypes)
+    assert actual.equals(expected)
+
+
+def _assert_tables_equal(actual, expected):
+    assert actual.keys() == expected.keys()
+    for name in expected:
+        if isinstance(expected[name], pd.Series):
+            pd.testing.assert_series_equal(actual[name], expected[name])
+        else:
+            pd.testing.assert_frame_equal(actual[name], expected[name])
+
+
+@pytest.mark.parametrize('new_names', [False, True], ids=['known-names', 'new-names'])
+def test_ingest_matches_full_load(tmp_path, monkeypatch, new_names):
+    matches = pd.read_csv(data_loader.MATCHES_CSV)
+    deliveries = pd.read_csv(data_loader.DELIVERIES_CSV)
+    match_id = matches['id'].iloc[-1]
+    in_match = deliveries['match_id'] == match_id
+    if new_names:
+        # A batter, a bowler and a venue first seen in the added match; the names sort before every
+        # stored one, so the shared categories are renumbered
+        batter = deliveries.loc[in_match, 'batter'].iloc[0]
+        bowler = deliveries.loc[in_match, 'bowler'].iloc[0]
+        for col in ('batter', 'non_striker', 'player_dismissed'):
+            deliveries.loc[in_match & (deliveries[col] == batter), col] = 'AA New Batter'
+        deliveries.loc[in_match & (deliveries['bowler'] == bowler), 'bowler'] = 'AA New Bowler'
+        matches.loc[matches['id'] == match_id, 'venue'] = 'AA New Ground'
+
+    full_csvs = _write(tmp_path, 'full', matches, deliveries)
+    partial_csvs = _write(tmp_path, 'partial', matches[matches['id'] != match_id], deliveries[~in_match])
+    match = pd.read_csv(full_csvs[0]).query('id == @match_id').reset_index(drop=True)
+    match_deliveries = pd.read_csv(full_csvs[1]).query('match_id == @match_id').reset_index(drop=True)
+
+    # A running app: the store without the match, with its aggregates and player lists built
+    store = data_loader.load_data(matches_csv=partial_csvs[0], deliveries_csv=partial_csvs[1])
+    totals = data_loader.player_totals(store[1])
+    monkeypatch.setattr(data_loader, '_data_store', store)
+    monkeypatch.setattr(data_loader, '_data_store_version', 0)
+    monkeypatch.setattr(data_loader, '_player_totals', totals)
+    for players, ranked in zip(('BATSMANS', 'BOWLERS', 'ALL_ROUNDERS'), data_loader.rank_players(totals)):
+        monkeypatch.setattr(data_loader, players, ranked)
+    season = int(match['season'].iloc[0])
+    aggregates.season_cube(store[2])
+    aggregates.player_team_index(store[2])
+    aggregates.player_profiles(store[2], [season])
+
+    if new_names:
+        assert 'AA New Batter' not in store[1]['batter'].cat.categories
+    assert data_loader.ingest_match(match, match_deliveries) == 1
+    matches_df, deliveries_df, ipl_df = data_loader.get_data()
+    full_matches, full_deliveries, full_ipl = data_loader.load_data(matches_csv=full_csvs[0], deliveries_csv=full_csvs[1])
+
+    _assert_store_frame_equal(matches_df, full_matches)
+    _assert_store_frame_equal(deliveries_df, full_deliveries)
+    _assert_store_frame_equal(ipl_df, full_ipl)
+    # The aggregates were carried over from the old store, not rebuilt
+    assert aggregates._memoized(aggregates._cubes, ipl_df) is not None
+    assert aggregates._memoized(aggregates._profiles, ipl_df) is not None
+    _assert_tables_equal(aggregates.season_cube(ipl_df), aggregates.build_cube(full_ipl))
+    full_profiles = aggregates.build_player_profiles(full_ipl)
+    _assert_tables_equal(aggregates._memoized(aggregates._profiles, ipl_df)['tables'], full_profiles)
+    for seasons in (None, [season]):
+        _assert_tables_equal(aggregates.player_profiles(ipl_df, seasons), aggregates._combine_profiles(full_profiles, seasons))
+    assert aggregates.player_team_index(ipl_df) == aggregates.build_player_team_index(full_ipl)
+    assert (data_loader.BATSMANS, data_loader.BOWLERS, data_loader.ALL_ROUNDERS) == data_loader.top_players(full_deliveries)
+
+    with pytest.raises(ValueError):
+        data_loader.ingest_match(match, match_deliveries)
@@ -0,0 +1,87 @@
+"""
+Player lookups through the per-player row index (utils.aggregates.player_rows and the Player
+Insights helpers built on it).
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import aggregates, data_loader
+from utils.star_schema import MATCH_INDEX, select_rows
+
+# Players that only bowl or only bat; their names sort after every generated one, so their
+# category codes do not fit in int8
+BOWLERS_ONLY = ['Zz Bowler One', 'Zz Bowler Two']
+BATTERS_ONLY = ['Zz Batter One', 'Zz Batter Two']
+
+
+@pytest.fixture(scope='module')
+def ipl(tmp_path_factory):
+    matches = pd.read_csv(data_loader.MATCHES_CSV)
+    deliveries = pd.read_csv(data_loader.DELIVERIES_CSV)
+    first_match = deliveries['match_id'] == matches['id'].iloc[0]
+    for name, inning in zip(BOWLERS_ONLY, (1, 2)):
+        deliveries.loc[first_match & (deliveries['inning'] == inning), 'bowler'] = name
+    for name, over in zip(BATTERS_ONLY, (0, 1)):
+        deliveries.loc[first_match & (deliveries['over'] == over), 'batter'] = name
+    directory = tmp_path_factory.mktemp('players')
+    matches.to_csv(directory / 'matches.csv', index=False)
+    deliveries.to_csv(directory / 'deliveries.csv', index=False)
+    return data_loader.load_data(matches_csv=str(directory / 'matches.csv'), deliveries_csv=str(directory / 'deliveries.csv'))[2]
+
+
+def _mask_rows(ipl, players, roles, seasons=None, columns=None):
+    # The boolean-mask filtering the row index replaces
+    players = [players] if isinstance(players, str) else [player for player in players if player]
+    mask = np.zeros(len(ipl), dtype=bool)
+    for role in roles:
+        mask |= ipl[role].isin(players).to_numpy()
+    if columns is not None:
+        columns = list(columns) + [MATCH_INDEX]
+    return select_rows(ipl, seasons, pd.Series(mask, index=ipl.index), columns)
+
+
+@pytest.mark.parametrize('roles', [('batter',), ('bowler',), ('batter', 'fielder'), ('batter', 'bowler', 'fielder')])
+@pytest.mark.parametrize('seasons', [None, [2010, 2024]])
+def test_player_rows_match_mask_filtering(ipl, roles, seasons):
+    known = list(ipl['batter'].value_counts().index[:2])
+    selections = [
+        known[0],
+        known,
+        # A known player without rows in the role, an unknown name and an empty slot
+        known[:1] + BOWLERS_ONLY[:1] + BATTERS_ONLY[:1] + ['Not A Player', None],
+        BOWLERS_ONLY + BATTERS_ONLY,
+        ['Not A Player']
+    ]
+    for players in selections:
+        expected = _mask_rows(ipl, players, roles)
+        positions = aggregates.player_positions(ipl, players, roles)
+        np.testing.assert_array_equal(positions, np.flatnonzero(ipl.index.isin(expected.index)))
+        for columns in (None, ['batter', 'batsman_runs']):
+            pd.testing.assert_frame_equal(
+                aggregates.player_rows(ipl, players, roles, seasons, columns),
+                _mask_rows(ipl, players, roles, seasons, columns)
+            )
+
+
+def test_players_without_rows_in_role(ipl):
+    assert set(BOWLERS_ONLY) <= set(ipl['batter'].cat.categories)
+    positions = aggregates.player_positions(ipl, BOWLERS_ONLY, ('batter', 'fielder'))
+    assert positions.size == 0
+    assert aggregates.player_rows(ipl, BOWLERS_ONLY).empty
+    assert len(data_loader.get_batter_runs(ipl, *BOWLERS_ONLY).data) == 0
+
+
+@pytest.mark.parametrize('helper', [
+    data_loader.get_batter_runs_against_other_teams,
+    data_loader.get_batter_runs_at_each_venue,
+    data_loader.get_bowler_wickets_against_other_teams,
+    data_loader.get_bowler_wickets_at_each_venue
+])
+def test_comparison_helpers_without_rows(ipl, helper):
+    # Known players that have no rows in the helper's role, and a name that is not in the data
+    role = 'bowler' if 'bowler' in helper.__name__ else 'batter'
+    absent = [name for name in ipl[role].cat.categories if name not in set(ipl[role])]
+    assert absent and ipl[role].cat.categories.get_loc(absent[-1]) > np.iinfo('int8').max
+    for players in ((absent[-1], absent[0]), (absent[-1], 'Not A Player')):
+        assert len(helper(ipl, *players).data) == 0
@@ -0,0 +1,21 @@
+"""
+Parity of the DuckDB query backend with the pandas one on a small synthetic dataset.
+"""
+import pytest
+
+pytest.importorskip('duckdb')
+
+# utils.data_loader reads data/ when imported; import it before the test leaves the repo root
+from utils import data_loader, stats_export  # noqa: F401
+from utils.sql_backend import parity
+from utils.synthetic_data import write_dataset
+
+
+def test_parity_with_pandas(tmp_path, monkeypatch):
+    matches_csv, deliveries_csv = write_dataset(str(tmp_path / 'synthetic'), scale=0.3, seed=1)
+    # The database, the Feather cache and the stats export are written relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(stats_export, 'EXPORT_DIR', str(tmp_path / 'exports'))
+    count, differences = parity(matches_csv, deliveries_csv)
+    assert count > 0
+    assert differences == []
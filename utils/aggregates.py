@@ -0,0 +1,714 @@
+"""
+Per-season aggregate cube over the deliveries fact table.
+
+The season-filtered helpers used to slice the ball-level frame and group it again on every
+callback. build_cube() does that grouping once: each table below is keyed by season (plus team,
+player and phase where it applies) and holds additive measures, so a selection of seasons is
+answered by summing the matching rows of a small table instead of scanning every ball.
+
+    batting      (season, batting_team, batter, phase)  balls, legal_balls, runs, batsman_runs,
+                 legal_batsman_runs, wickets, fours, sixes, four_run_balls, six_run_balls,
+                 scoring_balls
+    bowling      (season, bowling_team, bowler, phase)  balls, legal_balls, runs, wickets,
+                 dismissals, credited_balls, credited_runs, credited_wickets
+    dismissals   (season, bowling_team, dismissal_kind) dismissals
+    overs        (season, over)                         runs
+    team_matches (season, batting_team)                 matches
+    teams        (season, team)                         batting_runs, batting_balls, wickets_lost,
+                 bowling_runs, bowling_balls, wickets_taken, matches, batting_matches, wins,
+                 toss_wins, bat_first_wins, field_first_wins
+
+Measures that cannot be summed across seasons (lowest innings total, best figures in a match,
+most expensive over) are kept as per-season event tables that are filtered and ranked instead:
+
+    innings          (season, match_id, batting_team)              runs
+    bowling_figures  (season, match_id, bowler)                    runs, wickets
+    over_runs        (season, match_id, inning, bowler, over)      runs_conceded
+
+The cube of a fact table is built on first use and kept for as long as that frame is alive;
+fact tables are treated as read-only, as everywhere else in the app. The player -> season -> team
+index used to colour Player Insights charts (player_team_index()) and the per-player row index
+(player_row_index()) are kept the same way. When a match is ingested, refresh_season() carries
+them over to the extended table by rebuilding only the rows of the match's season.
+"""
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from utils.metrics import count_cache, instrument
+from utils.star_schema import MATCH_INDEX, match_column, select_rows, with_match_columns
+
+PHASES = ['powerplay', 'middle', 'death']
+VALID_DISMISSALS = ['bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket']
+
+MEASURES = {
+    'batting': [
+        'balls', 'legal_balls', 'runs', 'batsman_runs', 'legal_batsman_runs', 'wickets',
+        'fours', 'sixes', 'four_run_balls', 'six_run_balls', 'scoring_balls'
+    ],
+    'bowling': [
+        'balls', 'legal_balls', 'runs', 'wickets', 'dismissals',
+        'credited_balls', 'credited_runs', 'credited_wickets'
+    ],
+    'dismissals': ['dismissals'],
+    'overs': ['runs'],
+    'team_matches': ['matches'],
+    'teams': [
+        'batting_runs', 'batting_balls', 'wickets_lost', 'bowling_runs', 'bowling_balls', 'wickets_taken',
+        'matches', 'batting_matches', 'wins', 'toss_wins', 'bat_first_wins', 'field_first_wins'
+    ]
+}
+
+# Key columns of each cube table, in the order build_cube() groups them
+CUBE_KEYS = {
+    'batting': ['season', 'batting_team', 'batter', 'phase'],
+    'bowling': ['season', 'bowling_team', 'bowler', 'phase'],
+    'dismissals': ['season', 'bowling_team', 'dismissal_kind'],
+    'overs': ['season', 'over'],
+    'team_matches': ['season', 'batting_team'],
+    'teams': ['season', 'team'],
+    'innings': ['match_id', 'batting_team'],
+    'bowling_figures': ['match_id', 'bowler'],
+    'over_runs': ['match_id', 'inning', 'bowler', 'over']
+}
+
+_cubes = {}
+_player_teams = {}
+_player_rows = {}
+_profiles = {}
+# Fact tables whose cube and profiles come from another backend (see attach_backend())
+_backends = {}
+_memo_lock = threading.RLock()
+
+# Team column of each player role
+PLAYER_ROLES = {'batter': 'batting_team', 'bowler': 'bowling_team'}
+# Season selections whose combined player profiles are kept per fact table
+PROFILE_SELECTIONS = 32
+# Player columns covered by the row index
+PLAYER_COLUMNS = ['batter', 'bowler', 'fielder']
+
+def over_phase(over):
+    """
+    Map over numbers (0-based) to match phases: powerplay (0-5), middle (6-14) and death (15+).
+    Args:
+        over (Series): Over numbers
+    Returns:
+        Categorical: Phase of each over, with categories in PHASES order
+    """
+    over = np.asarray(over)
+    codes = np.select([over < 6, over < 15], [0, 1], 2).astype('int8')
+    return pd.Categorical.from_codes(codes, categories=PHASES)
+
+def _ball_measures(ipl):
+    season = match_column(ipl, 'season').to_numpy()
+    total_runs = ipl['total_runs'].to_numpy().astype('int64')
+    batsman_runs = ipl['batsman_runs'].to_numpy().astype('int64')
+    is_wicket = ipl['is_wicket'].to_numpy().astype('int64')
+    legal = (~ipl['extras_type'].isin(['wides', 'noballs'])).to_numpy()
+    valid = ipl['dismissal_kind'].isin(VALID_DISMISSALS).to_numpy()
+    # get_top_bowlers leaves out balls ending in a run out or retirement altogether
+    credited = valid | ipl['dismissal_kind'].isna().to_numpy()
+    return pd.DataFrame({
+        'season': season,
+        'batting_team': ipl['batting_team'].array,
+        'bowling_team': ipl['bowling_team'].array,
+        'batter': ipl['batter'].array,
+        'bowler': ipl['bowler'].array,
+        'phase': over_phase(ipl['over']),
+        'balls': 1,
+        'legal_balls': legal.astype('int64'),
+        'runs': total_runs,
+        'batsman_runs': batsman_runs,
+        'legal_batsman_runs': np.where(legal, batsman_runs, 0),
+        'wickets': is_wicket,
+        'fours': (batsman_runs == 4).astype('int64'),
+        'sixes': (batsman_runs == 6).astype('int64'),
+        'four_run_balls': (total_runs == 4).astype('int64'),
+        'six_run_balls': (total_runs == 6).astype('int64'),
+        'scoring_balls': (total_runs != 0).astype('int64'),
+        'dismissals': valid.astype('int64'),
+        'credited_balls': credited.astype('int64'),
+        'credited_runs': np.where(credited, total_runs, 0),
+        'credited_wickets': np.where(credited, is_wicket, 0)
+    })
+
+def _event_tables(ipl):
+    work = ipl.assign(
+        season=match_column(ipl, 'season'),
+        winner=match_column(ipl, 'winner'),
+        target_overs=match_column(ipl, 'target_overs')
+    )
+    # Lowest total: completed 20-over innings only, as in get_lowest_total
+    completed = work[work['winner'].notna() & (work['target_overs'] == 20) & work['inning'].isin([1, 2])]
+    innings = completed.groupby(['match_id', 'batting_team'], observed=True).agg(
+        season=('season', 'first'),
+        runs=('total_runs', 'sum')
+    ).reset_index()
+
+    runs = work.groupby(['match_id', 'bowler'], observed=True).agg(
+        season=('season', 'first'),
+        runs=('total_runs', 'sum')
+    ).reset_index()
+    wickets = work[work['dismissal_kind'].isin(VALID_DISMISSALS)].groupby(['match_id', 'bowler'], observed=True)['is_wicket'].sum().reset_index(name='wickets')
+    bowling_figures = pd.merge(runs, wickets, on=['match_id', 'bowler'], how='left')
+    bowling_figures['wickets'] = bowling_figures['wickets'].fillna(0)
+
+    over_runs = work.groupby(['match_id', 'inning', 'bowler', 'over'], observed=True).agg(
+        season=('season', 'first'),
+        runs_conceded=('total_runs', 'sum')
+    ).reset_index()
+    return {'innings': innings, 'bowling_figures': bowling_figures, 'over_runs': over_runs}
+
+def _team_seasons(ipl):
+    season = match_column(ipl, 'season').to_numpy()
+    sides = []
+    team_matches = []
+    for side, team_column, wickets in (('batting', 'batting_team', 'wickets_lost'), ('bowling', 'bowling_team', 'wickets_taken')):
+        sides.append(ipl.groupby([season, team_column], observed=True).agg(**{
+            f'{side}_runs': ('total_runs', 'sum'),
+            f'{side}_balls': ('total_runs', 'size'),
+            wickets: ('is_wicket', 'sum')
+        }).rename_axis(['season', 'team']))
+        # One row per match the team batted (or bowled) in, with the match result
+        first_balls = select_rows(ipl, mask=~ipl.duplicated(subset=['match_id', team_column]), columns=['match_id', team_column])
+        first_balls = with_match_columns(first_balls, ['season', 'winner', 'toss_winner', 'toss_decision'])
+        team_matches.append(first_balls.rename(columns={team_column: 'team'}).assign(batted=side == 'batting'))
+    team_matches = pd.concat(team_matches, ignore_index=True)
+    batting_matches = team_matches[team_matches['batted']].groupby(['season', 'team'], observed=True).size().rename('batting_matches')
+    team_matches = team_matches.drop_duplicates(subset=['match_id', 'team'])
+
+    team = team_matches['team'].to_numpy()
+    won = team_matches['winner'].to_numpy() == team
+    toss_won = team_matches['toss_winner'].to_numpy() == team
+    chose_bat = (team_matches['toss_decision'] == 'bat').to_numpy()
+    results = pd.DataFrame({
+        'season': team_matches['season'].to_numpy(),
+        'team': team,
+        'matches': 1,
+        'wins': won.astype('int64'),
+        'toss_wins': toss_won.astype('int64'),
+        # Won the toss, chose to bat (or field) and won the match
+        'bat_first_wins': (toss_won & chose_bat & won).astype('int64'),
+        'field_first_wins': (toss_won & ~chose_bat & won).astype('int64')
+    }).groupby(['season', 'team']).sum()
+
+    teams = pd.concat(sides + [batting_matches, results], axis=1).fillna(0).astype('int64')
+    return teams[MEASURES['teams']].rename_axis(['season', 'team']).reset_index()
+
+def build_cube(ipl):
+    """
+    Aggregate a deliveries fact table into the per-season cube.
+    Args:
+        ipl (DataFrame): Deliveries fact table (or a merged ball-by-ball frame with a season column)
+    Returns:
+        dict: {table name: DataFrame}, see the module docstring for keys and measures
+    """
+    balls = _ball_measures(ipl)
+    cube = {
+        'batting': balls.groupby(['season', 'batting_team', 'batter', 'phase'], observed=True)[MEASURES['batting']].sum().reset_index(),
+        'bowling': balls.groupby(['season', 'bowling_team', 'bowler', 'phase'], observed=True)[MEASURES['bowling']].sum().reset_index(),
+        'overs': ipl.groupby([balls['season'].to_numpy(), 'over'], observed=True)['total_runs'].sum().astype('int64').rename_axis(['season', 'over']).reset_index(name='runs'),
+        'team_matches': ipl.groupby([balls['season'].to_numpy(), 'batting_team'], observed=True)['match_id'].nunique().rename_axis(['season', 'batting_team']).reset_index(name='matches')
+    }
+    dismissed = ipl[ipl['dismissal_kind'].isin(VALID_DISMISSALS)]
+    cube['dismissals'] = dismissed.groupby([match_column(dismissed, 'season'), 'bowling_team', 'dismissal_kind'], observed=True).size().reset_index(name='dismissals')
+    cube['teams'] = _team_seasons(ipl)
+    cube.update(_event_tables(ipl))
+    return cube
+
+def _memoized(store, ipl):
+    entry = store.get(id(ipl))
+    return entry[1] if entry is not None and entry[0]() is ipl else None
+
+def _seed(store, ipl, value):
+    key = id(ipl)
+    # Drop the result together with its frame
+    ref = weakref.ref(ipl, lambda _, key=key: store.pop(key, None))
+    store[key] = (ref, value)
+    return value
+
+def _frame_memo(store, ipl, build, name):
+    value = _memoized(store, ipl)
+    count_cache(name, value is not None)
+    if value is None:
+        with _memo_lock:
+            value = _memoized(store, ipl)
+            if value is None:
+                value = _seed(store, ipl, build(ipl))
+    return value
+
+def attach_backend(ipl, builders):
+    """
+    Build the cube and player profiles of a fact table with another backend (e.g. utils.sql_backend).
+    Args:
+        ipl (DataFrame): Deliveries fact table
+        builders (dict): {'cube': callable, 'profiles': callable}, each taking the fact table and
+            returning the tables build_cube() and build_player_profiles() would return
+    """
+    _seed(_backends, ipl, builders)
+
+def _builder(ipl, name, default):
+    builders = _memoized(_backends, ipl)
+    return builders[name] if builders is not None else default
+
+def season_cube(ipl):
+    """
+    Return the cube of a fact table, building it on first use.
+    Args:
+        ipl (DataFrame): Deliveries fact table
+    Returns:
+        dict: {table name: DataFrame} from build_cube()
+    """
+    return _frame_memo(_cubes, ipl, _builder(ipl, 'cube', build_cube), 'season_cube')
+
+def build_player_team_index(ipl):
+    """
+    Map every batter and bowler to the team they played for in each season.
+    A player's team in a season is the team of the first ball they faced (or bowled) that season.
+    Args:
+        ipl (DataFrame): Deliveries fact table
+    Returns:
+        dict: {role: {player: {season: team}}} for the roles in PLAYER_ROLES, seasons in ascending order
+    """
+    season = match_column(ipl, 'season').to_numpy()
+    index = {}
+    for role, team_column in PLAYER_ROLES.items():
+        first_balls = pd.DataFrame({
+            'player': ipl[role].to_numpy(),
+            'season': season,
+            'team': ipl[team_column].to_numpy()
+        }).drop_duplicates(subset=['player', 'season']).dropna(subset=['player'])
+        first_balls = first_balls.sort_values(by=['player', 'season'], kind='stable')
+        players = {}
+        for player, player_season, team in first_balls.itertuples(index=False):
+            players.setdefault(player, {})[player_season] = team
+        index[role] = players
+    return index
+
+def player_team_index(ipl):
+    """
+    Return the player -> season -> team index of a fact table, building it on first use.
+    Args:
+        ipl (DataFrame): Deliveries fact table
+    Returns:
+        dict: {role: {player: {season: team}}} from build_player_team_index()
+    """
+    return _frame_memo(_player_teams, ipl, build_player_team_index, 'player_team_index')
+
+def cube_rows(ipl, table, seasons=None):
+    """
+    Rows of one cube table for the selected seasons.
+    Args:
+        ipl (DataFrame): Deliveries fact table
+        table (str): Cube table name (e.g. 'batting', 'bowling', 'innings')
+        seasons (list, optional): Seasons to keep (all seasons if empty)
+    Returns:
+        DataFrame: Matching rows of the table
+    """
+    rows = season_cube(ipl)[table]
+    return rows[rows['season'].isin(seasons)] if seasons else rows
+
+def cube_totals(ipl, table, by=None, seasons=None):
+    """
+    Sum the measures of one cube table over the selected seasons.
+    Args:
+        ipl (DataFrame): Deliveries fact table
+        table (str): Cube table name with additive measures (see MEASURES)
+        by (str or list, optional): Key columns to group by; None for grand totals
+        seasons (list, optional): Seasons to sum over (all seasons if empty)
+    Returns:
+        DataFrame: Summed measures indexed by `by`
+        Series: Grand totals when by is None
+    """
+    rows = cube_rows(ipl, table, seasons)
+    if by is None:
+        return rows[MEASURES[table]].sum()
+    return rows.groupby(by, observed=True)[MEASURES[table]].sum()
+
+def bowling_summary(ipl, seasons=None):
+    """
+    Compute every aggregate the Bowling tab needs for a season selection in one pass.
+    The season filter is applied once per cube table, and the bowler, team and season-team
+    roll-ups are all derived from a single grouping of the filtered bowling rows.
+    Args:
+        ipl (DataFrame): Deliveries fact table
+        seasons (list, optional): Seasons to summarize (all seasons if empty)
+    Returns:
+        dict: {
+            'totals': Series of bowling measures,
+            'by_bowler', 'by_team', 'by_season_team': DataFrames of bowling measures,
+            'dismissal_kinds': Series of dismissals per kind,
+            'bowling_figures': per-match figures rows,
+            'over_runs': per-over runs rows
+        }
+    """
+    measures = MEASURES['bowling']
+    by_season_team_bowler = cube_rows(ipl, 'bowling', seasons).groupby(['season', 'bowling_team', 'bowler'], observed=True)[measures].sum()
+    return {
+        'totals': by_season_team_bowler.sum(),
+        'by_bowler': by_season_team_bowler.groupby(level='bowler', observed=True).sum(),
+        'by_team': by_season_team_bowler.groupby(level='bowling_team', observed=True).sum(),
+        'by_season_team': by_season_team_bowler.groupby(level=['season', 'bowling_team'], observed=True).sum(),
+        'dismissal_kinds': cube_rows(ipl, 'dismissals', seasons).groupby('dismissal_kind', observed=True)['dismissals'].sum(),
+        'bowling_figures': cube_rows(ipl, 'bowling_figures', seasons),
+        'over_runs': cube_rows(ipl, 'over_runs', seasons)
+    }
+
+def batting_summary(ipl, seasons=None):
+    """
+    Compute every aggregate the Batting tab needs for a season selection in one pass.
+    The season filter is applied once per cube table, and the batter and team roll-ups are
+    derived from a single grouping of the filtered batting rows.
+    Args:
+        ipl (DataFrame): Deliveries fact table
+        seasons (list, optional): Seasons to summarize (all seasons if empty)
+    Returns:
+        dict: {
+            'totals': Series of batting measures,
+            'by_batter', 'by_team': DataFrames of batting measures,
+            'team_matches': Series of matches batted per team,
+            'runs_by_over': Series of runs per over,
+            'innings': completed 20-over innings totals rows
+        }
+    """
+    measures = MEASURES['batting']
+    by_season_team_batter = cube_rows(ipl, 'batting', seasons).groupby(['season', 'batting_team', 'batter'], observed=True)[measures].sum()
+    return {
+        'totals': by_season_team_batter.sum(),
+        'by_batter': by_season_team_batter.groupby(level='batter', observed=True).sum(),
+        'by_team': by_season_team_batter.groupby(level='batting_team', observed=True).sum(),
+        'team_matches': cube_rows(ipl, 'team_matches', seasons).groupby('batting_team', observed=True)['matches'].sum(),
+        'runs_by_over': cube_rows(ipl, 'overs', seasons).groupby('over', observed=True)['runs'].sum(),
+        'innings': cube_rows(ipl, 'innings', seasons)
+    }
+
+def build_player_row_index(ipl):
+    """
+    Index the rows of every player in each player column.
+    Row positions are grouped by player (and kept in table order within a player), with offsets
+    into that array, so a player's rows are one contiguous slice instead of a scan of the table.
+    Args:
+        ipl (DataFrame): Deliveries fact table
+    Returns:
+        dict: {column: (player numbers, positions, offsets)} where the rows of the player
+            numbered k are positions[offsets[k]:offsets[k + 1]]
+    """
+    index = {}
+    for column in PLAYER_COLUMNS:
+        if isinstance(ipl[column].dtype, pd.CategoricalDtype):
+            codes = ipl[column].cat.codes.to_numpy()
+            players = ipl[column].cat.categories
+        else:
+            codes, players = pd.factorize(ipl[column])
+        positions = np.argsort(codes, kind='stable').astype('int32')
+        # Rows without a player sort first and are left out
+        positions = positions[np.count_nonzero(codes < 0):]
+        offsets = np.zeros(len(players) + 1, dtype='int64')
+        np.cumsum(np.bincount(codes[codes >= 0], minlength=len(players)), out=offsets[1:])
+        index[column] = (dict(zip(players, range(len(players)))), positions, offsets)
+    return index
+
+def player_row_index(ipl):
+    """
+    Return the per-player row index of a fact table, building it on first use.
+    Args:
+        ipl (DataFrame): Deliveries fact table
+    Returns:
+        dict: {column: (player numbers, positions, offsets)} from build_player_row_index()
+    """
+    return _frame_memo(_player_rows, ipl, build_player_row_index, 'player_row_index')
+
+def player_positions(ipl, players, roles=('batter',)):
+    """
+    Row positions where any of the players appears in any of the given roles.
+    Args:
+        ipl (DataFrame): Deliveries fact table
+        players (str or list): Player name(s); None entries are ignored
+        roles (tuple, optional): Player columns to look in, from PLAYER_COLUMNS
+    Returns:
+        ndarray: Ascending row positions
+    """
+    players = [players] if isinstance(players, str) else [player for player in players if player]
+    index = player_row_index(ipl)
+    slices = []
+    for role in roles:
+        numbers, positions, offsets = index[role]
+        for player in players:
+            k = numbers.get(player)
+            if k is not None:
+                slices.append(positions[offsets[k]:offsets[k + 1]])
+    if not slices:
+        return np.empty(0, dtype='int32')
+    if len(slices) == 1:
+        return slices[0]
+    # A ball can list the same player in several roles
+    merged = np.sort(np.concatenate(slices))
+    if merged.size == 0:
+        return merged
+    return merged[np.concatenate(([True], merged[1:] != merged[:-1]))]
+
+def player_rows(ipl, players, roles=('batter',), seasons=None, columns=None):
+    """
+    Rows of a fact table where any of the players appears, read through the player row index.
+    Args:
+        ipl (DataFrame): Deliveries fact table
+        players (str or list): Player name(s); None entries are ignored
+        roles (tuple, optional): Player columns to look in, from PLAYER_COLUMNS
+        seasons (list, optional): Seasons to keep (all seasons if empty)
+        columns (list, optional): Columns to keep; MATCH_INDEX is kept too
+    Returns:
+        DataFrame: The players' rows, in table order
+    """
+    positions = player_positions(ipl, players, roles)
+    if columns is None:
+        columns = ipl.columns
+    elif MATCH_INDEX in ipl.columns and MATCH_INDEX not in columns:
+        columns = list(columns) + [MATCH_INDEX]
+    # Gather column by column; a row-wise take goes through the block manager and is several times slower
+    rows = pd.DataFrame(
+        {column: ipl[column].array.take(positions) for column in columns},
+        index=ipl.index[positions]
+    ).__finalize__(ipl)
+    return select_rows(rows, seasons)
+
+def _best_figures(figures, by):
+    # Most wickets, then fewest runs, for each group of per-match (or per-season best) figures
+    best = figures.sort_values(by=['wickets', 'runs'], ascending=[False, True], kind='stable')
+    best = best.groupby(by, observed=True)[['wickets', 'runs']].first()
+    return best.astype('int64').rename(columns={'wickets': 'best_wickets', 'runs': 'best_runs'})
+
+def build_player_profiles(ipl):
+    """
+    Aggregate every player's batting and bowling record per season in one pass over the balls.
+    Counts are additive across seasons (a match belongs to one season); best_score, best_wickets and
+    best_runs are per-season bests.
+    Args:
+        ipl (DataFrame): Deliveries fact table
+    Returns:
+        dict: {
+            'batting': DataFrame indexed by (season, player) with matches, innings, runs, balls,
+                dismissals, fours, sixes, fifties, hundreds, best_score, player_of_the_match,
+            'batting_dismissals': Series of times out per (season, player, dismissal_kind),
+            'bowling': DataFrame indexed by (season, player) with matches, innings, wickets, runs,
+                balls, four_wicket_hauls, five_wicket_hauls, maiden_overs, best_wickets, best_runs,
+            'bowling_dismissals': Series of wickets per (season, player, dismissal_kind)
+        }
+    """
+    season = match_column(ipl, 'season').to_numpy()
+
+    # Matches a player took part in as batter, bowler or fielder
+    appearances = pd.concat([
+        pd.DataFrame({'season': season, 'player': ipl[column].to_numpy(), 'match_id': ipl['match_id'].to_numpy()})
+        for column in PLAYER_COLUMNS
+    ]).dropna(subset=['player']).drop_duplicates()
+    matches = appearances.groupby(['season', 'player'], observed=True).size()
+
+    batsman_runs = ipl['batsman_runs'].to_numpy().astype('int64')
+    balls = pd.DataFrame({
+        'season': season,
+        'player': ipl['batter'].to_numpy(),
+        'match_id': ipl['match_id'].to_numpy(),
+        'inning': ipl['inning'].to_numpy(),
+        'runs': batsman_runs,
+        'dismissals': ipl['player_dismissed'].notna().to_numpy().astype('int64'),
+        'fours': (batsman_runs == 4).astype('int64'),
+        'sixes': (batsman_runs == 6).astype('int64'),
+        'player_of_the_match': (match_column(ipl, 'player_of_match') == ipl['batter']).to_numpy()
+    })
+    per_match = balls.groupby(['season', 'player', 'match_id'], observed=True).agg(
+        innings=('inning', 'nunique'),
+        runs=('runs', 'sum'),
+        balls=('runs', 'size'),
+        dismissals=('dismissals', 'sum'),
+        fours=('fours', 'sum'),
+        sixes=('sixes', 'sum'),
+        player_of_the_match=('player_of_the_match', 'any')
+    )
+    per_match['fifties'] = per_match['runs'].between(50, 99)
+    per_match['hundreds'] = per_match['runs'] >= 100
+    batting = per_match.groupby(level=['season', 'player'], observed=True).agg(
+        innings=('innings', 'sum'),
+        runs=('runs', 'sum'),
+        balls=('balls', 'sum'),
+        dismissals=('dismissals', 'sum'),
+        fours=('fours', 'sum'),
+        sixes=('sixes', 'sum'),
+        fifties=('fifties', 'sum'),
+        hundreds=('hundreds', 'sum'),
+        best_score=('runs', 'max'),
+        player_of_the_match=('player_of_the_match', 'sum')
+    )
+    batting.insert(0, 'matches', matches.reindex(batting.index).to_numpy())
+    batting_dismissals = (
+        balls.assign(dismissal_kind=ipl['dismissal_kind'].to_numpy())
+        .groupby(['season', 'player', 'dismissal_kind'], observed=True).size()
+    )
+
+    # Bowling counts only balls that end without a run out or retirement, as get_bowler_stats always has
+    credited = (ipl['dismissal_kind'].isin(VALID_DISMISSALS) | ipl['dismissal_kind'].isna()).to_numpy()
+    deliveries = pd.DataFrame({
+        'season': season,
+        'player': ipl['bowler'].to_numpy(),
+        'match_id': ipl['match_id'].to_numpy(),
+        'inning': ipl['inning'].to_numpy(),
+        'over': ipl['over'].to_numpy(),
+        'credited': credited.astype('int64'),
+        'wickets': np.where(credited, ipl['is_wicket'].to_numpy(), 0).astype('int64'),
+        'runs': np.where(credited, ipl['total_runs'].to_numpy(), 0).astype('int64'),
+        'dismissal_kind': ipl['dismissal_kind'].to_numpy()
+    })
+    per_over = deliveries.groupby(['season', 'player', 'match_id', 'inning', 'over'], observed=True).agg(
+        credited=('credited', 'sum'),
+        wickets=('wickets', 'sum'),
+        runs=('runs', 'sum')
+    )
+    # An over is a maiden when its credited balls conceded nothing; per (match, over) as in get_bowler_stats
+    over_runs = per_over[per_over['credited'] > 0].groupby(level=['season', 'player', 'match_id', 'over'], observed=True)['runs'].sum()
+    per_inning = per_over.groupby(level=['season', 'player', 'match_id', 'inning'], observed=True)[['credited', 'wickets', 'runs']].sum()
+    per_match = per_inning.groupby(level=['season', 'player', 'match_id'], observed=True).agg(
+        innings=('credited', 'size'),
+        credited=('credited', 'sum'),
+        wickets=('wickets', 'sum'),
+        runs=('runs', 'sum')
+    )
+    per_match['four_wicket_hauls'] = per_match['wickets'] == 4
+    per_match['five_wicket_hauls'] = per_match['wickets'] == 5
+    bowling = per_match.groupby(level=['season', 'player'], observed=True).agg(
+        matches=('innings', 'size'),
+        innings=('innings', 'sum'),
+        wickets=('wickets', 'sum'),
+        runs=('runs', 'sum'),
+        balls=('credited', 'sum'),
+        four_wicket_hauls=('four_wicket_hauls', 'sum'),
+        five_wicket_hauls=('five_wicket_hauls', 'sum')
+    )
+    bowling['maiden_overs'] = (over_runs == 0).groupby(level=['season', 'player'], observed=True).sum().reindex(bowling.index, fill_value=0)
+    best = _best_figures(season_cube(ipl)['bowling_figures'], ['season', 'bowler']).rename_axis(['season', 'player'])
+    bowling = bowling.join(best)
+    bowling_dismissals = deliveries[deliveries['credited'] == 1].groupby(['season', 'player', 'dismissal_kind'], observed=True).size()
+    return {
+        'batting': batting,
+        'batting_dismissals': batting_dismissals,
+        'bowling': bowling,
+        'bowling_dismissals': bowling_dismissals
+    }
+
+def _combine_profiles(tables, seasons):
+    # Sum the per-season tables over the selection and derive the rates
+    def season_rows(table):
+        return table[table.index.get_level_values('season').isin(seasons)] if seasons else table
+
+    def most_common_dismissal(kinds):
+        kinds = season_rows(kinds).groupby(level=['player', 'dismissal_kind'], observed=True).sum()
+        kinds = kinds[kinds > 0]
+        return kinds.groupby(level='player', observed=True).idxmax().str[1] if not kinds.empty else pd.Series(dtype=object)
+
+    rows = season_rows(tables['batting'])
+    batting = rows.drop(columns='best_score').groupby(level='player', observed=True).sum()
+    batting['best_score'] = rows['best_score'].groupby(level='player', observed=True).max()
+    batting['strike_rate'] = (batting['runs'] / batting['balls'] * 100).where(batting['balls'] > 0, 0)
+    batting['average'] = (batting['runs'] / batting['dismissals']).where(batting['dismissals'] > 0, batting['runs'])
+    batting['dismissal_type_often'] = most_common_dismissal(tables['batting_dismissals'])
+
+    rows = season_rows(tables['bowling'])
+    bowling = rows.drop(columns=['best_wickets', 'best_runs']).groupby(level='player', observed=True).sum()
+    bowling = bowling.join(_best_figures(
+        rows[['best_wickets', 'best_runs']].rename(columns={'best_wickets': 'wickets', 'best_runs': 'runs'}).reset_index(),
+        'player'
+    ))
+    bowling['overs'] = bowling['balls'] / 6
+    bowling['average'] = (bowling['runs'] / bowling['wickets']).where(bowling['wickets'] > 0, bowling['runs'])
+    bowling['economy'] = (bowling['runs'] / bowling['overs']).where(bowling['overs'] > 0, 0)
+    bowling['strike_rate'] = (bowling['balls'] / bowling['wickets']).where(bowling['wickets'] > 0, 0)
+    bowling['dismissal_type_often'] = most_common_dismissal(tables['bowling_dismissals'])
+    return {'batting': batting, 'bowling': bowling}
+
+def player_profiles(ipl, seasons=None):
+    """
+    Career profile of every player over the selected seasons, for KPI lookups and leaderboards.
+    Args:
+        ipl (DataFrame): Deliveries fact table
+        seasons (list, optional): Seasons to cover (whole career if empty)
+    Returns:
+        dict: {
+            'batting': DataFrame indexed by player with the counts of build_player_profiles() plus
+                strike_rate, average and dismissal_type_often (shared, treat as read-only),
+            'bowling': DataFrame indexed by player with the counts of build_player_profiles() plus
+                overs, average, economy, strike_rate and dismissal_type_often
+        }
+    """
+    build = _builder(ipl, 'profiles', build_player_profiles)
+    profiles = _frame_memo(_profiles, ipl, lambda ipl: {'tables': build(ipl), 'selections': OrderedDict()}, 'player_profiles')
+    key = tuple(sorted(set(seasons))) if seasons else ()
+    with _memo_lock:
+        if key in profiles['selections']:
+            profiles['selections'].move_to_end(key)
+            count_cache('player_profiles.selections', True)
+            return profiles['selections'][key]
+    count_cache('player_profiles.selections', False)
+    result = _combine_profiles(profiles['tables'], seasons)
+    with _memo_lock:
+        profiles['selections'][key] = result
+        while len(profiles['selections']) > PROFILE_SELECTIONS:
+            profiles['selections'].popitem(last=False)
+    return result
+
+def _splice_rows(old, fresh, season, keys):
+    # Replace one season's rows of a cube table, in the order a full build would give
+    old = old[old['season'] != season]
+    for column in fresh.columns:
+        if isinstance(fresh[column].dtype, pd.CategoricalDtype) and old[column].dtype != fresh[column].dtype:
+            # Recode by value onto the (possibly extended) categories of the new table
+            old = old.assign(**{column: old[column].astype(fresh[column].dtype)})
+    return pd.concat([old, fresh], ignore_index=True).sort_values(by=keys, kind='stable', ignore_index=True)
+
+def _splice_index(old, fresh, season):
+    # Replace one season's rows of a table indexed by (season, player, ...)
+    old = old[old.index.get_level_values('season') != season]
+    return pd.concat([old, fresh]).sort_index(kind='stable')
+
+def refresh_season(old_ipl, new_ipl, season):
+    """
+    Carry the aggregates built for a fact table over to a table that extends it with one season's rows.
+    Only the rows of that season are aggregated again and spliced into the existing tables, since
+    every table is keyed by season. Aggregates never built for old_ipl are left to be built on
+    first use; the per-player row index is rebuilt, as new players can renumber the categories.
+    Args:
+        old_ipl (DataFrame): Fact table the aggregates were built for
+        new_ipl (DataFrame): old_ipl's balls plus new balls, all from `season`
+        season (int): Season of the new balls
+    """
+    season_rows = select_rows(new_ipl, [season])
+    with _memo_lock:
+        cube = _memoized(_cubes, old_ipl)
+        if cube is not None:
+            # Profiles of the season below read the same cube
+            fresh = _seed(_cubes, season_rows, build_cube(season_rows))
+            _seed(_cubes, new_ipl, {name: _splice_rows(table, fresh[name], season, CUBE_KEYS[name]) for name, table in cube.items()})
+
+        teams = _memoized(_player_teams, old_ipl)
+        if teams is not None:
+            fresh = build_player_team_index(season_rows)
+            index = {}
+            for role, players in teams.items():
+                merged = {player: {s: team for s, team in seasons.items() if s != season} for player, seasons in players.items()}
+                for player, seasons in fresh[role].items():
+                    merged.setdefault(player, {}).update(seasons)
+                index[role] = {player: dict(sorted(seasons.items())) for player, seasons in merged.items() if seasons}
+            _seed(_player_teams, new_ipl, index)
+
+        if _memoized(_player_rows, old_ipl) is not None:
+            _seed(_player_rows, new_ipl, build_player_row_index(new_ipl))
+
+        profiles = _memoized(_profiles, old_ipl)
+        if profiles is not None:
+            fresh = build_player_profiles(season_rows)
+            tables = {name: _splice_index(table, fresh[name], season) for name, table in profiles['tables'].items()}
+            _seed(_profiles, new_ipl, {'tables': tables, 'selections': OrderedDict()})
+
+# Wrapped last so the app's modules, which import these names, get the timed versions (IPL_METRICS=1)
+instrument(sys.modules[__name__], 'aggregation', include=lambda name: True, exclude=('over_phase',))
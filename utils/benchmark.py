@@ -0,0 +1,194 @@
+"""
+Per-function benchmark of the data layer on synthetic datasets of growing size.
+
+For each scale (multiples of the IPL volume, see utils.synthetic_data) the dataset is generated
+once under --data-dir and reused by later runs. The benchmark then times load_data(),
+top_players(), the aggregate builds the helpers share (cube, player indexes, profiles) and every
+public get_* function of utils/data_loader.py on the full dataset. Aggregates are built before
+the get_* calls, so their timings are the steady state a running app sees; each is the median of
+--repeat runs. Throughput is balls per second, and peak memory is the most a second call held
+above its starting allocation under tracemalloc (as in utils.memory_profile).
+
+The last column gives how the time grows with the data between the two largest scales: about 1
+is linear, and calls above SUPER_LINEAR are flagged. Run with:
+
+    python -m utils.benchmark --scales 1 10 100 --out benchmark.csv
+"""
+import argparse
+import inspect
+import math
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from utils import aggregates, data_loader, stats_export
+from utils.synthetic_data import write_dataset
+
+# Growth exponent above which a call is flagged, and the time below which growth is noise
+SUPER_LINEAR = 1.2
+MIN_SECONDS = 0.01
+
+def _timed(call, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+def _traced_peak(call):
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        call()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return round((peak - baseline) / 1024 ** 2, 2)
+
+def dataset_paths(data_dir, scale, seed=0):
+    """
+    Synthetic dataset of a scale, generating it on first use.
+    Args:
+        data_dir (str): Directory holding one x<scale> subdirectory per dataset
+        scale (float): Volume relative to the IPL data
+        seed (int, optional): Random seed of a newly generated dataset
+    Returns:
+        tuple: (matches path, deliveries path)
+    """
+    out_dir = os.path.join(data_dir, f'x{scale:g}')
+    paths = (os.path.join(out_dir, 'matches.csv'), os.path.join(out_dir, 'deliveries.csv'))
+    if not all(os.path.exists(path) for path in paths):
+        paths = write_dataset(out_dir, scale, seed)
+    return paths
+
+def function_calls(matches_df, deliveries_df, ipl_df, seasons=None):
+    """
+    Zero-argument calls of every public get_* function of utils/data_loader.py on one dataset.
+    Arguments are filled in by parameter name: the two IPL teams with most matches, the top run scorers
+    for batting helpers and the top wicket-takers for bowling helpers, and n=10.
+    Args:
+        matches_df (DataFrame): Matches dimension
+        deliveries_df (DataFrame): Ball-by-ball data
+        ipl_df (DataFrame): Fact table
+        seasons (list, optional): Season filter passed to the helpers that take one (none by default)
+    Returns:
+        dict: {function name: zero-argument callable}
+    """
+    # Team charts colour their traces from TEAM_COLORS, so use teams that have a colour
+    teams = pd.concat([matches_df['team1'], matches_df['team2']]).astype(str).value_counts().index
+    teams = teams[teams.isin(list(data_loader.TEAM_COLORS))]
+    batsmen, bowlers, _ = data_loader.top_players(deliveries_df)
+    arguments = {'ipl': ipl_df, 'matches': matches_df, 'n': 10, 'team_name': teams[0], 'team1': teams[0], 'team2': teams[1]}
+    calls = {}
+    for name, function in inspect.getmembers(data_loader, inspect.isfunction):
+        if not name.startswith('get_') or name == 'get_data' or function.__module__ != data_loader.__name__:
+            continue
+        players = bowlers if 'bowler' in name else batsmen
+        named = dict(arguments, player=players[0], player1=players[0], player2=players[1])
+        required = [
+            parameter.name for parameter in inspect.signature(function).parameters.values()
+            if parameter.default is inspect.Parameter.empty
+        ]
+        if all(parameter in named for parameter in required):
+            kwargs = {parameter: named[parameter] for parameter in required}
+            if seasons and 'seasons' in inspect.signature(function).parameters:
+                kwargs['seasons'] = seasons
+            calls[name] = lambda function=function, kwargs=kwargs: function(**kwargs)
+    return calls
+
+def benchmark_scale(matches_csv, deliveries_csv, repeat=3, memory=True):
+    """
+    Time every benchmarked call on one dataset.
+    Args:
+        matches_csv (str): Matches file of the dataset
+        deliveries_csv (str): Deliveries file of the dataset
+        repeat (int, optional): Runs per call; the median is reported
+        memory (bool, optional): Also measure peak memory (one more traced run per call)
+    Returns:
+        DataFrame: Columns [call, balls, seconds, balls_per_second, peak_mb]
+    """
+    load = lambda: data_loader.load_data(matches_csv=matches_csv, deliveries_csv=deliveries_csv)
+    start = time.perf_counter()
+    matches_df, deliveries_df, ipl_df = load()
+    timings = {'load_data': time.perf_counter() - start}
+    calls = {
+        'top_players': lambda: data_loader.top_players(deliveries_df),
+        'aggregates.build_cube': lambda: aggregates.build_cube(ipl_df),
+        'aggregates.build_player_team_index': lambda: aggregates.build_player_team_index(ipl_df),
+        'aggregates.build_player_row_index': lambda: aggregates.build_player_row_index(ipl_df),
+        'aggregates.build_player_profiles': lambda: aggregates.build_player_profiles(ipl_df)
+    }
+    for label, call in calls.items():
+        timings[label] = _timed(call, repeat)
+    # Steady state: the helpers below read the memoized aggregates
+    aggregates.season_cube(ipl_df)
+    aggregates.player_team_index(ipl_df)
+    aggregates.player_row_index(ipl_df)
+    aggregates.player_profiles(ipl_df)
+    getters = function_calls(matches_df, deliveries_df, ipl_df)
+    for label, call in getters.items():
+        call()
+        timings[label] = _timed(call, repeat)
+
+    balls = len(deliveries_df)
+    rows = []
+    for label, seconds in timings.items():
+        call = load if label == 'load_data' else calls.get(label) or getters[label]
+        rows.append({
+            'call': label,
+            'balls': balls,
+            'seconds': round(seconds, 5),
+            'balls_per_second': round(balls / seconds) if seconds else None,
+            'peak_mb': _traced_peak(call) if memory else None
+        })
+    return pd.DataFrame(rows)
+
+def growth(results):
+    """
+    Growth exponent of each call's time between the two largest scales (1 = linear).
+    Args:
+        results (DataFrame): Concatenated benchmark_scale() results with a scale column
+    Returns:
+        DataFrame: One row per call with its seconds per scale, growth and super_linear flag
+    """
+    table = results.pivot_table(index='call', columns='scale', values='seconds', sort=False)
+    balls = results.groupby('scale')['balls'].first()
+    if len(balls) < 2:
+        return table.reset_index()
+    small, large = sorted(balls.index)[-2:]
+    ratio = math.log(balls[large] / balls[small])
+    table['growth'] = [
+        round(math.log(row[large] / row[small]) / ratio, 2) if row[large] >= MIN_SECONDS and row[small] > 0 else None
+        for _, row in table.iterrows()
+    ]
+    table['super_linear'] = table['growth'] > SUPER_LINEAR
+    return table.reset_index()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the data layer on synthetic datasets')
+    parser.add_argument('--scales', type=float, nargs='+', default=[1, 10, 100], help='Dataset sizes relative to the IPL data')
+    parser.add_argument('--data-dir', default=os.path.join('data', 'synthetic'), help='Where generated datasets are kept')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per call')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the peak memory runs')
+    parser.add_argument('--out', help='CSV file for the per-scale results')
+    args = parser.parse_args()
+
+    # Player Insights helpers queue rows for the stats export; keep them out of the real one
+    stats_export.EXPORT_DIR = tempfile.mkdtemp(prefix='ipl-benchmark-')
+    results = []
+    for scale in args.scales:
+        matches_csv, deliveries_csv = dataset_paths(args.data_dir, scale)
+        result = benchmark_scale(matches_csv, deliveries_csv, args.repeat, memory=not args.no_memory)
+        result.insert(0, 'scale', scale)
+        results.append(result)
+        print(f'scale {scale:g}: {result["balls"].iloc[0]} balls')
+        print(result.drop(columns=['scale', 'balls']).to_string(index=False), end='\n\n')
+    results = pd.concat(results, ignore_index=True)
+    if args.out:
+        results.to_csv(args.out, index=False)
+    print(growth(results).to_string(index=False))
@@ -0,0 +1,133 @@
+"""
+Bounded, memoized cache for season-filtered Dash callbacks.
+
+Tab callbacks rebuild every figure for each season selection, but users keep coming back to a
+few selections (all seasons, the latest season). season_cached() keys a callback's results on
+its name, its arguments with list arguments normalized to sorted, de-duplicated tuples (so
+[2019, 2008, 2019] and [2008, 2019] share an entry and None matches []), and the version of the
+loaded dataset. Finished Plotly figures are stored as plain figure dicts, so a repeat selection
+returns without touching the data or rebuilding a figure.
+
+Entries are evicted least-recently-used once a cache holds `maxsize` entries, and are recomputed
+once they are older than `max_age` seconds. Sizes default to IPL_CALLBACK_CACHE_SIZE (64; 0
+disables caching) and IPL_CALLBACK_CACHE_TTL (3600 seconds).
+"""
+import functools
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+
+DEFAULT_MAXSIZE = int(os.environ.get('IPL_CALLBACK_CACHE_SIZE', '64'))
+DEFAULT_MAX_AGE = float(os.environ.get('IPL_CALLBACK_CACHE_TTL', '3600'))
+
+_caches = {}
+
+def normalize_arg(value):
+    """
+    Normalize a callback argument for use in a cache key.
+    Args:
+        value: Callback argument (a dropdown value or list of values)
+    Returns:
+        Hashable value; lists, tuples and sets become sorted, de-duplicated tuples and None becomes ()
+    """
+    if value is None:
+        return ()
+    if isinstance(value, (list, tuple, set)):
+        return tuple(sorted(set(value)))
+    return value
+
+def _freeze_output(value):
+    # Keep the finished figure JSON rather than the Figure object and its validators
+    if isinstance(value, go.Figure):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return tuple(_freeze_output(item) for item in value)
+    return value
+
+def season_cached(maxsize=None, max_age=None, version=None):
+    """
+    Decorate a season-filtered callback with a bounded LRU cache of its outputs.
+    Args:
+        maxsize (int, optional): Maximum number of cached selections (default DEFAULT_MAXSIZE, 0 disables)
+        max_age (float, optional): Seconds before an entry is recomputed (default DEFAULT_MAX_AGE)
+        version (callable, optional): Returns the current dataset version; entries of another
+            version are never served (default utils.data_loader.data_version)
+    Returns:
+        callable: Decorator; the wrapped function gains cache_info() and cache_clear()
+    """
+    maxsize = DEFAULT_MAXSIZE if maxsize is None else maxsize
+    max_age = DEFAULT_MAX_AGE if max_age is None else max_age
+
+    def decorator(func):
+        name = f'{func.__module__}.{func.__qualname__}'
+        entries = OrderedDict()
+        stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        lock = threading.Lock()
+
+        def current_version():
+            if version is not None:
+                return version()
+            from utils.data_loader import data_version
+            return data_version()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if maxsize <= 0:
+                return func(*args, **kwargs)
+            key = (
+                current_version(),
+                tuple(normalize_arg(arg) for arg in args),
+                tuple(sorted((k, normalize_arg(v)) for k, v in kwargs.items()))
+            )
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(key)
+                if entry is not None and now - entry[0] <= max_age:
+                    entries.move_to_end(key)
+                    stats['hits'] += 1
+                    return entry[1]
+                stats['misses'] += 1
+            result = _freeze_output(func(*args, **kwargs))
+            with lock:
+                entries[key] = (time.monotonic(), result)
+                entries.move_to_end(key)
+                # Drop expired entries and entries of older dataset versions, then the least recently used
+                for stale_key in [k for k, (stored, _) in entries.items() if k[0] != key[0] or now - stored > max_age]:
+                    del entries[stale_key]
+                    stats['evictions'] += 1
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+                    stats['evictions'] += 1
+            return result
+
+        def cache_info():
+            with lock:
+                return dict(stats, size=len(entries), maxsize=maxsize, max_age=max_age)
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        _caches[name] = wrapper
+        return wrapper
+    return decorator
+
+def cache_stats():
+    """
+    Hit/miss counters of every season-cached callback.
+    Returns:
+        dict: {callback name: {'hits', 'misses', 'evictions', 'size', 'maxsize', 'max_age'}}
+    """
+    return {name: wrapper.cache_info() for name, wrapper in _caches.items()}
+
+def clear_caches():
+    """
+    Drop the cached outputs of every season-cached callback.
+    """
+    for wrapper in _caches.values():
+        wrapper.cache_clear()
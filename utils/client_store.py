@@ -0,0 +1,109 @@
+"""
+Per-season aggregates shipped to the browser for client-side season filtering.
+
+With IPL_CLIENTSIDE_FILTER=1 the app layout carries one dcc.Store (STORE_ID) holding the small
+per-season tables below, sent once when the page loads. The season filter of the Batting tab,
+and the dismissal mix, wicket-taker and total KPIs of the Bowling tab, are then answered by
+clientside callbacks (assets/clientside_filter.js) that sum the selected seasons' rows and
+restyle the figures the server rendered for all seasons, without a server round trip. Outputs
+that need ball-level data (best figures, hat-tricks, most expensive overs, ...) stay on the
+server.
+
+Every table is columnar: 'season' holds positions in 'seasons', and player, team and dismissal
+columns hold positions in the matching name list, so the payload stays small (about 50 KB of
+JSON for 17 seasons).
+
+    seasons        season list; per season: matches, highest_chase, lowest_total, runs,
+                   four_run_balls, six_run_balls, scoring_balls, wickets
+    overs          (season, over)   runs
+    teams          (season, team)   runs, balls, legal_batsman_runs, legal_balls, matches
+    batters        (season, batter) runs
+    bowlers        (season, bowler) wickets, balls (credited measures, as get_top_bowlers)
+    dismissals     (season, kind)   dismissals
+"""
+import os
+
+import pandas as pd
+from dash import dcc
+
+from utils.aggregates import season_cube
+
+CLIENTSIDE_FILTER = os.environ.get('IPL_CLIENTSIDE_FILTER', '0') == '1'
+STORE_ID = 'season-store'
+
+def _columns(frame, seasons, names=None):
+    table = {'season': frame['season'].map({season: pos for pos, season in enumerate(seasons)}).tolist()}
+    for column in frame.columns.drop('season'):
+        if names is not None and column in names:
+            table[column] = frame[column].map({name: pos for pos, name in enumerate(names[column])}).astype('int64').tolist()
+        else:
+            table[column] = frame[column].astype('int64').tolist()
+    return table
+
+def _observed(frame, column):
+    # Names in category order, as the server-side groupbys (observed=True) list them
+    values = frame[column]
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        present = set(values)
+        return [name for name in values.cat.categories if name in present]
+    return sorted(values.unique())
+
+def build_season_store(ipl, matches):
+    """
+    Build the per-season payload of the client-side season filter.
+    Args:
+        ipl (DataFrame): Deliveries fact table
+        matches (DataFrame): Match-level data
+    Returns:
+        dict: JSON-serializable tables, see the module docstring
+    """
+    cube = season_cube(ipl)
+    seasons = sorted(int(season) for season in matches['season'].unique())
+
+    batting = cube['batting'].groupby('season')[['runs', 'four_run_balls', 'six_run_balls', 'scoring_balls']].sum()
+    per_season = pd.DataFrame({
+        'matches': matches.groupby('season').size(),
+        'highest_chase': matches[matches['result'] == 'wickets'].groupby('season')['target_runs'].max(),
+        'lowest_total': cube['innings'].groupby('season')['runs'].min()
+    }).join(batting).join(cube['bowling'].groupby('season')['wickets'].sum()).reindex(seasons)
+    # Seasons without a chase or a completed innings are sent as null
+    season_totals = {
+        column: [None if pd.isna(value) else int(value) for value in per_season[column]]
+        for column in per_season.columns
+    }
+
+    teams = cube['batting'].groupby(['season', 'batting_team'], observed=True)[['runs', 'balls', 'legal_batsman_runs', 'legal_balls']].sum()
+    teams['matches'] = cube['team_matches'].set_index(['season', 'batting_team'])['matches']
+    teams = teams.fillna(0).reset_index().rename(columns={'batting_team': 'team'})
+    batters = cube['batting'].groupby(['season', 'batter'], observed=True)['batsman_runs'].sum().reset_index(name='runs')
+    bowlers = cube['bowling'].groupby(['season', 'bowler'], observed=True)[['credited_wickets', 'credited_balls']].sum()
+    bowlers = bowlers[bowlers['credited_balls'] > 0].rename(columns={'credited_wickets': 'wickets', 'credited_balls': 'balls'}).reset_index()
+    dismissals = cube['dismissals'].groupby(['season', 'dismissal_kind'], observed=True)['dismissals'].sum().reset_index().rename(columns={'dismissal_kind': 'kind'})
+
+    names = {
+        'team': _observed(teams, 'team'),
+        'batter': _observed(batters, 'batter'),
+        'bowler': _observed(bowlers, 'bowler'),
+        'kind': _observed(dismissals, 'kind')
+    }
+    return {
+        'seasons': seasons,
+        **season_totals,
+        'names': names,
+        'overs': _columns(cube['overs'], seasons),
+        'teams': _columns(teams, seasons, names),
+        'batters': _columns(batters, seasons, names),
+        'bowlers': _columns(bowlers, seasons, names),
+        'dismissals': _columns(dismissals, seasons, names)
+    }
+
+def season_store(ipl, matches):
+    """
+    The dcc.Store carrying the per-season payload, for the app layout.
+    Args:
+        ipl (DataFrame): Deliveries fact table
+        matches (DataFrame): Match-level data
+    Returns:
+        dcc.Store: Store with id STORE_ID
+    """
+    return dcc.Store(id=STORE_ID, data=build_season_store(ipl, matches))
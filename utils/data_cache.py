@@ -0,0 +1,206 @@
+"""
+Columnar (Feather) cache for the normalized IPL data.
+
+load_data() parses the raw CSVs, normalizes venue/team names and links every delivery to
+its match on every process start. The cache stores the result of that work in Feather files
+keyed by a fingerprint of the source CSVs and mapping tables, so later starts can read the
+columnar files directly and only fall back to the CSVs when the fingerprint changes.
+
+With memory_map=True the frames are instead stored as one NumPy file per column, with string
+columns dictionary-encoded into integer codes. Those files are opened read-only with mmap, so
+every worker process of a multi-worker server maps the same pages and the OS page cache holds
+a single physical copy of the dataset.
+
+Build the cache ahead of a deploy with:
+    python -m utils.data_cache [--mmap]
+"""
+import glob
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+
+CACHE_DIR = os.path.join('data', 'cache')
+CACHE_FRAMES = ('matches', 'deliveries')
+
+def source_fingerprint(paths, *mappings):
+    """
+    Hash the raw source files and mapping tables that the normalized data is derived from.
+    Args:
+        paths (list): Source CSV file paths
+        *mappings (dict): Mapping tables applied during normalization (e.g. VENUE_MAP, TEAM_MAP)
+    Returns:
+        str: Short hex digest identifying this exact set of inputs
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    for mapping in mappings:
+        digest.update(json.dumps(mapping, sort_keys=True).encode('utf-8'))
+    digest.update(json.dumps(CACHE_FRAMES).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+def cache_path(key, name):
+    """
+    Path of one cached frame for a given fingerprint.
+    Args:
+        key (str): Source fingerprint
+        name (str): Frame name (matches or deliveries)
+    Returns:
+        str: Feather file path
+    """
+    return os.path.join(CACHE_DIR, f'{name}-{key}.feather')
+
+def mmap_dir(key):
+    """
+    Directory of the memory-mapped store for a given fingerprint.
+    Args:
+        key (str): Source fingerprint
+    Returns:
+        str: Directory path
+    """
+    return os.path.join(CACHE_DIR, f'mmap-{key}')
+
+def _read_frame(path):
+    frame = pd.read_feather(path)
+    # Feather hands back None for missing strings where read_csv gives NaN
+    for col in frame.columns[frame.dtypes == object]:
+        frame[col] = frame[col].fillna(np.nan)
+    return frame
+
+def read_cache(key, memory_map=False):
+    """
+    Read the cached frames for a fingerprint.
+    Args:
+        key (str): Source fingerprint
+        memory_map (bool, optional): Map the NumPy column store read-only instead of reading Feather files
+    Returns:
+        tuple: (matches_df, deliveries_df), or None if the cache is missing or unreadable
+    """
+    if memory_map:
+        return _read_mmap_store(key)
+    paths = [cache_path(key, name) for name in CACHE_FRAMES]
+    if not all(os.path.exists(path) for path in paths):
+        return None
+    try:
+        return tuple(_read_frame(path) for path in paths)
+    except (ImportError, OSError, ValueError):
+        # pyarrow not installed or a corrupt file: fall back to the CSVs
+        return None
+
+def write_cache(key, frames, memory_map=False):
+    """
+    Write the normalized frames for a fingerprint and drop caches of older fingerprints.
+    Each file is written to a temporary path first and moved into place, so concurrent
+    readers never see a partially written file.
+    Args:
+        key (str): Source fingerprint
+        frames (tuple): (matches_df, deliveries_df)
+        memory_map (bool, optional): Write the memory-mappable NumPy column store instead of Feather files
+    Returns:
+        bool: True if the cache was written
+    """
+    if memory_map:
+        return _write_mmap_store(key, frames)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        for name, frame in zip(CACHE_FRAMES, frames):
+            path = cache_path(key, name)
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            frame.to_feather(tmp_path)
+            os.replace(tmp_path, path)
+    except (ImportError, OSError, ValueError):
+        return False
+    current = {cache_path(key, name) for name in CACHE_FRAMES}
+    for path in glob.glob(os.path.join(CACHE_DIR, '*.feather')):
+        if path not in current:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    return True
+
+def _write_mmap_frame(frame, frame_dir):
+    os.makedirs(frame_dir)
+    columns = []
+    for i, col in enumerate(frame.columns):
+        series = frame[col]
+        if isinstance(series.dtype, pd.CategoricalDtype) or series.dtype == object:
+            # Dictionary-encode strings: codes are mappable, the (small) categories go in the manifest
+            categorical = pd.Categorical(series)
+            values = categorical.codes
+            columns.append({'name': col, 'kind': 'category', 'categories': categorical.categories.tolist()})
+        else:
+            values = series.to_numpy()
+            columns.append({'name': col, 'kind': 'values'})
+        np.save(os.path.join(frame_dir, f'{i}.npy'), np.ascontiguousarray(values), allow_pickle=False)
+    with open(os.path.join(frame_dir, 'manifest.json'), 'w') as f:
+        json.dump({'columns': columns}, f)
+
+def _write_mmap_store(key, frames):
+    store_dir = mmap_dir(key)
+    if os.path.isdir(store_dir):
+        return True
+    tmp_dir = f'{store_dir}.{os.getpid()}.tmp'
+    try:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        for name, frame in zip(CACHE_FRAMES, frames):
+            _write_mmap_frame(frame, os.path.join(tmp_dir, name))
+        os.rename(tmp_dir, store_dir)
+    except OSError:
+        # Another worker won the race (or the disk is read-only); its store is just as good
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return os.path.isdir(store_dir)
+    for path in glob.glob(os.path.join(CACHE_DIR, 'mmap-*')):
+        if path != store_dir and not path.endswith('.tmp'):
+            # Workers still mapping an old store keep their pages until they exit
+            shutil.rmtree(path, ignore_errors=True)
+    return True
+
+def _read_mmap_frame(frame_dir):
+    with open(os.path.join(frame_dir, 'manifest.json')) as f:
+        manifest = json.load(f)
+    data = {}
+    for i, column in enumerate(manifest['columns']):
+        values = np.load(os.path.join(frame_dir, f'{i}.npy'), mmap_mode='r', allow_pickle=False)
+        if column['kind'] == 'category':
+            values = pd.Categorical.from_codes(values, column['categories'])
+        data[column['name']] = values
+    # copy=False keeps every column backed by its read-only mapping
+    return pd.DataFrame(data, copy=False)
+
+def _read_mmap_store(key):
+    store_dir = mmap_dir(key)
+    if not os.path.isdir(store_dir):
+        return None
+    try:
+        return tuple(_read_mmap_frame(os.path.join(store_dir, name)) for name in CACHE_FRAMES)
+    except (OSError, ValueError, KeyError):
+        return None
+
+def build_cache(memory_map=False):
+    """
+    Load the CSVs, normalize and link them, and write the columnar cache.
+    Args:
+        memory_map (bool, optional): Build the memory-mapped NumPy store instead of Feather files
+    Returns:
+        str: Fingerprint the cache was written under
+    """
+    from utils.data_loader import MATCHES_CSV, DELIVERIES_CSV, VENUE_MAP, TEAM_MAP, load_data
+    from utils.data_schema import SCHEMA
+    key = source_fingerprint([MATCHES_CSV, DELIVERIES_CSV], VENUE_MAP, TEAM_MAP, SCHEMA)
+    if memory_map:
+        shutil.rmtree(mmap_dir(key), ignore_errors=True)
+    matches_df, deliveries_df, _ = load_data(use_cache=False)
+    if not write_cache(key, (matches_df, deliveries_df), memory_map=memory_map):
+        raise RuntimeError('Could not write the data cache (is pyarrow installed?)')
+    return key
+
+if __name__ == '__main__':
+    print(f"Wrote data cache {build_cache(memory_map='--mmap' in sys.argv[1:])} to {CACHE_DIR}")
@@ -3,6 +3,17 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import colorsys
+import os
+import sys
+import threading
+from utils.data_cache import source_fingerprint, read_cache, write_cache
+from utils.data_schema import SCHEMA, build_dtypes, extend_dtypes, apply_schema
+from utils.star_schema import MATCH_INDEX, match_positions, link_matches, with_match_columns, select_rows
+from utils.sql_backend import attach_database
+from utils.aggregates import batting_summary, bowling_summary, cube_totals, player_team_index, player_rows, player_profiles, refresh_season
+from utils.streaks import find_streaks
+from utils.stats_export import export_row
+from utils.metrics import instrument
 
 def hex_to_rgb(hex_color):
     hex_color = hex_color.lstrip('#')
@@ -52,6 +63,16 @@ TEAM_MAP = {
     'Gujarat Lions': 'Gujarat Titans'
 }
 
+# Set IPL_MATCHES_CSV / IPL_DELIVERIES_CSV to serve other files, e.g. a synthetic dataset
+MATCHES_CSV = os.environ.get('IPL_MATCHES_CSV', os.path.join('data', 'matches.csv'))
+DELIVERIES_CSV = os.environ.get('IPL_DELIVERIES_CSV', os.path.join('data', 'deliveries.csv'))
+# Set IPL_DATA_CACHE=0 to always parse the raw CSVs
+USE_DATA_CACHE = os.environ.get('IPL_DATA_CACHE', '1') != '0'
+# Set IPL_DATA_MMAP=1 to share one memory-mapped copy of the data between worker processes
+USE_DATA_MMAP = os.environ.get('IPL_DATA_MMAP', '0') == '1'
+# Backend of the full-table aggregates: pandas, or duckdb (see utils.sql_backend)
+QUERY_BACKEND = os.environ.get('IPL_QUERY_BACKEND', 'pandas')
+
 TEAM_COLORS = {
     'Sunrisers Hyderabad': '#FF6F00',
     'Rajasthan Royals': '#EA1C81',
@@ -82,46 +103,85 @@ TEAM_SHORT_NAMES = {
     'Rising Pune Supergiants': "RPS"
 }
 
-def player_played_team_each_season(df, player):
-    marker_colors = []
-    played_teams = []
-    df = df[df['batter'] == player]
-    for season in df['season'].unique():
-        season_matches_row = df[df['season'] == season]
-        if not season_matches_row.empty:
-            team_name = season_matches_row['batting_team'].iloc[0]
-            if team_name in TEAM_COLORS:
-                marker_colors.append(TEAM_COLORS[team_name])
-                played_teams.append(team_name)
-            else:
-                marker_colors.append('#888888')  
-        else:
-            marker_colors.append('#888888')
+# KPI name -> player_profiles() column
+BATSMAN_STATS = {
+    'total_matches': 'matches',
+    'total_innings': 'innings',
+    'total_runs': 'runs',
+    'batting_strike_rate': 'strike_rate',
+    'dismissals': 'dismissals',
+    'batting_average': 'average',
+    'total_fours': 'fours',
+    'total_sixes': 'sixes',
+    'fifties': 'fifties',
+    'hundreds': 'hundreds',
+    'best_score': 'best_score',
+    'dismissal_type_often': 'dismissal_type_often',
+    'player_of_the_match': 'player_of_the_match'
+}
+BOWLER_STATS = {
+    'total_matches': 'matches',
+    'total_innings': 'innings',
+    'total_wickets': 'wickets',
+    'run_conceded': 'runs',
+    'balls_bowled': 'balls',
+    'total_overs': 'overs',
+    'bowling_average': 'average',
+    'economy_rate': 'economy',
+    'bowling_strike_rate': 'strike_rate',
+    'best_bowling_figures': None,
+    'four_wicket_hauls': 'four_wicket_hauls',
+    'five_wicket_hauls': 'five_wicket_hauls',
+    'dismissal_type_often': 'dismissal_type_often',
+    'maiden_overs': 'maiden_overs'
+}
+
+def player_played_team_each_season(df, player, role='batter'):
+    """
+    Teams a player played for in each season they batted (or bowled) in, with the team colours.
+    Args:
+        df (DataFrame): Deliveries fact table
+        player (str): Player name
+        role (str, optional): 'batter' or 'bowler'
+    Returns:
+        tuple: (played_teams, marker_colors) lists in ascending season order
+    """
+    played_teams = list(player_team_index(df)[role].get(player, {}).values())
+    marker_colors = [TEAM_COLORS.get(team, '#888888') for team in played_teams]
     return played_teams, marker_colors
 
-def player_last_played_team(df, player):
-    df = df[df['batter'] == player]
-    if df.empty:
-        return '#888888'
-    last_season = df['season'].max()
-    last_season_rows = df[df['season'] == last_season]
-    if last_season_rows.empty:
+def player_last_played_team(df, player, role='batter'):
+    """
+    Colour of the team a player played for in their latest season.
+    Args:
+        df (DataFrame): Deliveries fact table
+        player (str): Player name
+        role (str, optional): 'batter' or 'bowler'
+    Returns:
+        str: Team colour, grey if the player never batted (or bowled)
+    """
+    season_teams = player_team_index(df)[role].get(player)
+    if not season_teams:
         return '#888888'
-    team = last_season_rows['batting_team'].iloc[0]
+    team = season_teams[max(season_teams)]
     return TEAM_COLORS.get(team, '#888888')
 
-def top_players():
-    deliveries_df = pd.read_csv('data/deliveries.csv')
-    deliveries_df.columns = deliveries_df.columns.str.strip().str.lower()
-
+def player_totals(deliveries_df):
+    """
+    Career batting and bowling totals of every player, the input of rank_players().
+    Args:
+        deliveries_df (DataFrame): Ball-by-ball data
+    Returns:
+        DataFrame: Columns [player, runs_scored, balls_faced, balls_bowled, wickets], sorted by player
+    """
     # Batting Stats
-    batting_stats = deliveries_df.groupby('batter').agg(
+    batting_stats = deliveries_df.groupby('batter', observed=True).agg(
         runs_scored=('batsman_runs', 'sum'),
         balls_faced=('batter', 'count')
     ).reset_index().rename(columns={'batter': 'player'})
 
     # Bowling Stats
-    bowling_stats = deliveries_df[deliveries_df['bowler'].notnull()].groupby('bowler').agg(
+    bowling_stats = deliveries_df[deliveries_df['bowler'].notnull()].groupby('bowler', observed=True).agg(
         balls_bowled=('bowler', 'count'),
         wickets=('dismissal_kind', lambda x: x.isin([
             'caught', 'bowled', 'lbw', 'stumped', 'caught and bowled', 'hit wicket'
@@ -129,8 +189,18 @@ def top_players():
     ).reset_index().rename(columns={'bowler': 'player'})
 
     # Merge
-    player_stats = pd.merge(batting_stats, bowling_stats, on='player', how='outer').fillna(0)
+    player_stats = pd.merge(batting_stats, bowling_stats, on='player', how='outer')
+    player_stats = player_stats.fillna({'runs_scored': 0, 'balls_faced': 0, 'balls_bowled': 0, 'wickets': 0})
+    return player_stats
 
+def rank_players(player_stats):
+    """
+    Rank players into top batsmen, bowlers and all-rounders from their career totals.
+    Args:
+        player_stats (DataFrame): Totals from player_totals()
+    Returns:
+        tuple: (batsmen, bowlers, allrounders) lists of player names
+    """
     # Classify and Rank
     batsmen_df = player_stats[(player_stats['runs_scored'] > 1000) | (player_stats['balls_faced'] > 500)].copy()
     bowlers_df = player_stats[(player_stats['wickets'] > 50) | (player_stats['balls_bowled'] > 300)].copy()
@@ -147,31 +217,169 @@ def top_players():
 
     return batsmen_df['player'].tolist(), bowlers_df['player'].tolist(), allrounders_df['player'].tolist()
 
-BATSMANS, BOWLERS, ALL_ROUNDERS = top_players()
+def top_players(deliveries_df):
+    """
+    Rank players from ball-by-ball data into top batsmen, bowlers and all-rounders.
+    Args:
+        deliveries_df (DataFrame): Ball-by-ball data
+    Returns:
+        tuple: (batsmen, bowlers, allrounders) lists of player names
+    """
+    return rank_players(player_totals(deliveries_df))
 
-def load_data():
+def load_data(use_cache=False, memory_map=False, compact=True, matches_csv=None, deliveries_csv=None, query_backend='pandas'):
     """
     Load IPL match and delivery data from CSV files, normalize venue and team names, and merge for analysis.
+    Args:
+        use_cache (bool, optional): Read the normalized frames from the columnar cache when it matches
+            the current CSVs and mapping tables, and refresh the cache after a CSV load
+        memory_map (bool, optional): With use_cache, map the read-only NumPy column store shared by all
+            worker processes instead of reading private Feather copies
+        compact (bool, optional): Apply the compact schema from utils.data_schema (shared categoricals
+            for player/team/venue names, smallest integer types for counters)
+        matches_csv (str, optional): Matches file to read instead of MATCHES_CSV (e.g. a synthetic dataset)
+        deliveries_csv (str, optional): Deliveries file to read instead of DELIVERIES_CSV
+        query_backend (str, optional): 'duckdb' builds the season cube and player profiles with SQL on
+            an embedded database file written next to the data cache (utils.sql_backend); 'pandas'
+            builds them in memory
     Returns:
-        matches_df (DataFrame): Match-level data
-        deliveries_df (DataFrame): Ball-by-ball data
-        ipl_df (DataFrame): Merged ball-by-ball with match info
-    """
-    # Load raw CSV data
-    matches_df = pd.read_csv('data/matches.csv')
-    deliveries_df = pd.read_csv('data/deliveries.csv')
+        matches_df (DataFrame): Match-level data (the matches dimension)
+        deliveries_df (DataFrame): Ball-by-ball data with a match_idx column pointing into matches_df
+        ipl_df (DataFrame): Ball-by-ball fact table linked to matches_df; match attributes such as
+            season or venue are read through utils.star_schema instead of being merged onto every ball
+    """
+    matches_csv = matches_csv or MATCHES_CSV
+    deliveries_csv = deliveries_csv or DELIVERIES_CSV
+    cached = None
+    if use_cache:
+        cache_key = source_fingerprint([matches_csv, deliveries_csv], VENUE_MAP, TEAM_MAP, SCHEMA if compact else {})
+        cached = read_cache(cache_key, memory_map=memory_map)
+
+    if cached is None:
+        # Load raw CSV data
+        matches_df = pd.read_csv(matches_csv)
+        deliveries_df = pd.read_csv(deliveries_csv)
+
+        # Normalize venue names in matches
+        matches_df['venue'] = matches_df['venue'].replace(VENUE_MAP)
+
+        # Normalize team names in both matches and deliveries
+        deliveries_df.replace(TEAM_MAP, inplace=True)
+        matches_df.replace(TEAM_MAP, inplace=True)
+
+        if compact:
+            dtypes = build_dtypes(matches_df, deliveries_df)
+            matches_df = apply_schema(matches_df, dtypes)
+            deliveries_df = apply_schema(deliveries_df, dtypes)
+
+        # Point every ball at its match row instead of merging the match info onto it
+        deliveries_df[MATCH_INDEX] = match_positions(matches_df, deliveries_df)
+
+        if use_cache and write_cache(cache_key, (matches_df, deliveries_df), memory_map=memory_map) and memory_map:
+            # Serve the shared mapping rather than this process's private copy
+            cached = read_cache(cache_key, memory_map=True)
+
+    if cached is not None:
+        matches_df, deliveries_df = cached
+    ipl_df = link_matches(matches_df, deliveries_df)
+    if query_backend == 'duckdb':
+        # The database holds strings rather than codes, so the compact schema does not change it
+        database_key = source_fingerprint([matches_csv, deliveries_csv], VENUE_MAP, TEAM_MAP)
+        attach_database(ipl_df, matches_df, deliveries_df, database_key)
+    return matches_df, deliveries_df, ipl_df
+
+_data_store = None
+_data_store_version = 0
+_data_store_lock = threading.Lock()
 
-    # Normalize venue names in matches
-    matches_df['venue'] = matches_df['venue'].replace(VENUE_MAP)
+def get_data():
+    """
+    Return the process-wide IPL data store, loading it on first use.
+    Every tab shares the same DataFrames, so callers must treat them as read-only.
+    Returns:
+        tuple: (matches_df, deliveries_df, ipl_df) as returned by load_data()
+    """
+    global _data_store, _data_store_version
+    if _data_store is None:
+        with _data_store_lock:
+            if _data_store is None:
+                _data_store = load_data(use_cache=USE_DATA_CACHE, memory_map=USE_DATA_MMAP, query_backend=QUERY_BACKEND)
+                _data_store_version += 1
+    return _data_store
 
-    # Normalize team names in both matches and deliveries
-    deliveries_df.replace(TEAM_MAP, inplace=True)
-    matches_df.replace(TEAM_MAP, inplace=True)
+def data_version():
+    """
+    Version of the dataset held by the data store.
+    It changes whenever the store is (re)loaded or a match is ingested, so caches of derived results
+    can tell stale entries apart.
+    Returns:
+        int: Version number
+    """
+    get_data()
+    return _data_store_version
 
-    # Merge ball-by-ball data with match info
-    ipl_df = deliveries_df.merge(matches_df, left_on='match_id', right_on='id')
+def _recode(frame, dtypes):
+    changed = {col: dtype for col, dtype in dtypes.items() if col in frame.columns and frame[col].dtype != dtype}
+    return frame.astype(changed) if changed else frame
 
-    return matches_df, deliveries_df, ipl_df
+def ingest_match(match, deliveries):
+    """
+    Append one finished match to the data store without reloading the CSVs.
+    Only the new rows are normalized (TEAM_MAP/VENUE_MAP) and converted to the store's schema. The
+    aggregates built so far are updated for the match's season only, the player lists are re-ranked
+    from running totals, and the data version is bumped so cached callback results and tab layouts
+    are rebuilt. Callers holding the previous frames keep a consistent (older) dataset.
+    Args:
+        match (DataFrame): The match's row, with the columns of matches.csv as read_csv loads them
+        deliveries (DataFrame): The match's balls, with the columns of deliveries.csv
+    Returns:
+        int: Data version that includes the match
+    """
+    global _data_store, _data_store_version, _player_totals
+    get_data()
+    with _data_store_lock:
+        matches_df, deliveries_df, ipl_df = _data_store
+        if len(match) != 1:
+            raise ValueError(f'Expected one match row, got {len(match)}')
+        match_id = match['id'].iloc[0]
+        if matches_df['id'].isin([match_id]).any():
+            raise ValueError(f'Match {match_id} is already loaded')
+        if not deliveries['match_id'].eq(match_id).all():
+            raise ValueError(f'Deliveries of other matches given with match {match_id}')
+
+        # Normalize venue and team names of the new rows, as load_data() does for the CSVs; columns
+        # that are all NaN in a single match keep the dtype read_csv gave them
+        with pd.option_context('future.no_silent_downcasting', True):
+            match = match.assign(venue=match['venue'].replace(VENUE_MAP)).replace(TEAM_MAP)
+            deliveries = deliveries.replace(TEAM_MAP)
+
+        store_dtypes = {
+            col: dtype for frame in (matches_df, deliveries_df)
+            for col, dtype in frame.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)
+        }
+        if store_dtypes:
+            # New names are added to the sorted shared categories, which renumbers the stored codes
+            dtypes = extend_dtypes(store_dtypes, match, deliveries)
+            matches_df, deliveries_df = _recode(matches_df, dtypes), _recode(deliveries_df, dtypes)
+            match, deliveries = apply_schema(match, dtypes), apply_schema(deliveries, dtypes)
+
+        matches_df = pd.concat([matches_df, match], ignore_index=True)
+        deliveries = deliveries.assign(**{MATCH_INDEX: match_positions(matches_df, deliveries)})
+        deliveries_df = pd.concat([deliveries_df, deliveries], ignore_index=True)
+        new_ipl = link_matches(matches_df, deliveries_df)
+        refresh_season(ipl_df, new_ipl, match['season'].iloc[0])
+
+        # Running career totals; the lists are updated in place for modules that imported them
+        _player_totals = pd.concat([_player_totals, player_totals(deliveries)]).groupby('player', observed=True).sum().reset_index()
+        for players, ranked in zip((BATSMANS, BOWLERS, ALL_ROUNDERS), rank_players(_player_totals)):
+            players[:] = ranked
+
+        _data_store = (matches_df, deliveries_df, new_ipl)
+        _data_store_version += 1
+        return _data_store_version
+
+_player_totals = player_totals(get_data()[1])
+BATSMANS, BOWLERS, ALL_ROUNDERS = rank_players(_player_totals)
 
 def update_layout(fig):
     """
@@ -272,7 +480,7 @@ def get_matches_won(matches):
         go.Figure: Pie chart of win type distribution
     """
     win_type_df = matches[matches['result'].isin(['runs', 'wickets'])]
-    win_type_df = win_type_df.groupby('result').size().reset_index(name='count')
+    win_type_df = win_type_df.groupby('result', observed=True).size().reset_index(name='count')
     win_type_df.replace({'runs': 'Batting First', 'wickets': 'Fielding First'}, inplace=True)
     pie_trace = go.Pie(
         labels=win_type_df['result'],
@@ -295,7 +503,7 @@ def get_toss_decision(matches):
     Returns:
         go.Figure: Pie chart of toss decisions
     """
-    toss_decision_counts = matches.groupby('toss_decision').size().reset_index(name='count')
+    toss_decision_counts = matches.groupby('toss_decision', observed=True).size().reset_index(name='count')
     labels = ['Batting', 'Fielding']
     pie_trace = go.Pie(
         labels=labels,
@@ -319,7 +527,7 @@ def get_team_wins(matches):
     Returns:
         go.Figure: Bar chart of team wins
     """
-    team_win_counts = matches.groupby('winner').size().reset_index(name='total_wins').sort_values(by='total_wins')
+    team_win_counts = matches.groupby('winner', observed=True).size().reset_index(name='total_wins').sort_values(by='total_wins')
     bar_trace = go.Bar(
         x=team_win_counts['total_wins'],
         y=team_win_counts['winner'],
@@ -330,21 +538,24 @@ def get_team_wins(matches):
     fig.update_layout(title='Most Wins by Team', xaxis=dict(showticklabels=False))
     return update_layout(fig)
 
-def get_top_scorers(ipl, n, seasons=None):
+def get_top_scorers(ipl, n, seasons=None, summary=None):
     """
     Plot top N batsmen by total runs as a horizontal bar chart or return top batsman as string.
     Args:
         ipl (DataFrame): Ball-by-ball data merged with match info
         n (int): Number of top batsmen to show
         seasons (list, optional): Filter by seasons
+        summary (dict, optional): batting_summary() of the same seasons, shared between the Batting tab's charts
     Returns:
         str: If n==1, returns formatted string for top batsman
         go.Figure: Otherwise, returns bar chart
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    batsman_run_stats = filtered_ipl_df.groupby('batter')['batsman_runs'].sum().reset_index(name='Total Runs')
+    if summary is None:
+        summary = batting_summary(ipl, seasons)
+    batsman_run_stats = summary['by_batter']['batsman_runs'].reset_index(name='Total Runs')
     batsman_run_stats.rename(columns={'batter': 'Batsman'}, inplace=True)
-    top_batsmen_df = batsman_run_stats.sort_values(by='Total Runs', ascending=False).head(n)[::-1]
+    # Ties are listed by name, as the client-side filter lists them
+    top_batsmen_df = batsman_run_stats.sort_values(by=['Total Runs', 'Batsman'], ascending=[False, True], kind='stable').head(n)[::-1]
     if n == 1:
         top_batsman = top_batsmen_df['Batsman'].values[0]
         top_runs = top_batsmen_df['Total Runs'].values[0]
@@ -359,32 +570,33 @@ def get_top_scorers(ipl, n, seasons=None):
     fig.update_layout(title=dict(text='Top Scorers'), xaxis=dict(showticklabels=False))
     return update_layout(fig)
 
-def get_top_bowlers(ipl, n, seasons=None):
+def get_top_bowlers(ipl, n, seasons=None, summary=None):
     """
     Plot top N bowlers by wickets and by economy (min 100 overs).
     Args:
         ipl (DataFrame): Ball-by-ball data merged with match info
         n (int): Number of top bowlers to show
         seasons (list, optional): Filter by seasons
+        summary (dict, optional): bowling_summary() of the same seasons, shared between the Bowling tab's charts
     Returns:
         str: If n==1, returns formatted string for top bowler
         tuple(go.Figure, go.Figure): Bar charts for wickets and economy
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    valid_dismissals = ['bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket']
-    filtered_ipl_df = filtered_ipl_df[filtered_ipl_df['dismissal_kind'].isin(valid_dismissals) | filtered_ipl_df['dismissal_kind'].isnull()]
-    legal_deliveries_df = filtered_ipl_df[~filtered_ipl_df['extra_runs'].isin(['wides', 'noballs'])]
-    bowler_agg_stats = legal_deliveries_df.groupby('bowler').agg(
-        total_runs_conceded=('total_runs', 'sum'),
-        total_wickets_taken=('is_wicket', 'sum'),
-        total_balls_bowled=('ball', 'count')
-    ).reset_index()
+    if summary is None:
+        summary = bowling_summary(ipl, seasons)
+    # Credited measures leave out balls ending in a run out or retirement
+    by_bowler = summary['by_bowler']
+    bowler_agg_stats = by_bowler[by_bowler['credited_balls'] > 0][['credited_runs', 'credited_wickets', 'credited_balls']].rename(columns={
+        'credited_runs': 'total_runs_conceded',
+        'credited_wickets': 'total_wickets_taken',
+        'credited_balls': 'total_balls_bowled'
+    }).reset_index()
 
     bowler_agg_stats['total_overs_bowled'] = bowler_agg_stats['total_balls_bowled'] / 6
     bowler_agg_stats['economy'] = bowler_agg_stats['total_runs_conceded'] / bowler_agg_stats['total_overs_bowled']
     
     # Top Bowlers by Wickets
-    top_wicket_bowlers_df = bowler_agg_stats.sort_values(by='total_wickets_taken', ascending=False).head(n)[::-1]
+    top_wicket_bowlers_df = bowler_agg_stats.sort_values(by=['total_wickets_taken', 'bowler'], ascending=[False, True], kind='stable').head(n)[::-1]
     if n == 1:
         top_bowler = top_wicket_bowlers_df['bowler'].values[0]
         top_wickets = top_wicket_bowlers_df['total_wickets_taken'].values[0]
@@ -410,30 +622,34 @@ def get_top_bowlers(ipl, n, seasons=None):
     fig_economy.update_layout(title=dict(text='Top Bowlers by Economy (Min 100 Overs)'), xaxis=dict(showticklabels=False))
     return update_layout(fig_wickets), update_layout(fig_economy)
 
-def get_total_runs(ipl, seasons=None):
+def get_total_runs(ipl, seasons=None, summary=None):
     """
     Calculate total runs scored, optionally filtered by season.
     Args:
         ipl (DataFrame): Ball-by-ball data
         seasons (list, optional): Filter by seasons
+        summary (dict, optional): batting_summary() of the same seasons, shared between the Batting tab's charts
     Returns:
         int: Total runs
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    total_runs_scored = filtered_ipl_df['total_runs'].sum()
+    if summary is None:
+        summary = batting_summary(ipl, seasons)
+    total_runs_scored = summary['totals']['runs']
     return int(total_runs_scored)
 
-def get_total_wickets(ipl, seasons=None):
+def get_total_wickets(ipl, seasons=None, summary=None):
     """
     Calculate total wickets taken, optionally filtered by season.
     Args:
         ipl (DataFrame): Ball-by-ball data
         seasons (list, optional): Filter by seasons
+        summary (dict, optional): bowling_summary() of the same seasons, shared between the Bowling tab's charts
     Returns:
         int: Total wickets
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    total_wickets_taken = filtered_ipl_df['is_wicket'].sum()
+    if summary is None:
+        summary = bowling_summary(ipl, seasons)
+    total_wickets_taken = summary['totals']['wickets']
     return int(total_wickets_taken)
 
 def get_total_matches(matches, seasons=None):
@@ -446,26 +662,34 @@ def get_total_matches(matches, seasons=None):
         int: Total matches
     """
     if seasons:
-        filtered_matches_df = matches[matches['season'].isin(seasons)].copy()
-        total_matches_played = filtered_matches_df['id'].size
+        total_matches_played = int(matches['season'].isin(seasons).sum())
         return total_matches_played
     else:
         total_matches_played = matches['id'].size
         return total_matches_played
 
-def get_runs_distribution(ipl, seasons=None):
+def get_runs_distribution(ipl, seasons=None, summary=None):
     """
     Plot pie chart of runs distribution (4s, 6s, other).
     Args:
         ipl (DataFrame): Ball-by-ball data
         seasons (list, optional): Filter by seasons
+        summary (dict, optional): batting_summary() of the same seasons, shared between the Batting tab's charts
     Returns:
         go.Figure: Pie chart of runs distribution
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    filtered_ipl_df = filtered_ipl_df[filtered_ipl_df['total_runs'] != 0]
-    filtered_ipl_df['run_type'] = filtered_ipl_df['total_runs'].apply(lambda runs: '4s' if runs == 4 else ('6s' if runs == 6 else 'Other'))
-    run_type_stats_df = filtered_ipl_df.groupby('run_type').size().reset_index(name='count')
+    if summary is None:
+        summary = batting_summary(ipl, seasons)
+    totals = summary['totals']
+    run_type_stats_df = pd.DataFrame({
+        'run_type': ['4s', '6s', 'Other'],
+        'count': [
+            totals['four_run_balls'],
+            totals['six_run_balls'],
+            totals['scoring_balls'] - totals['four_run_balls'] - totals['six_run_balls']
+        ]
+    })
+    run_type_stats_df = run_type_stats_df[run_type_stats_df['count'] > 0]
     pie_trace = go.Pie(
         labels=run_type_stats_df['run_type'],
         values=run_type_stats_df['count'],
@@ -480,17 +704,19 @@ def get_runs_distribution(ipl, seasons=None):
     fig.update_layout(legend=dict(title='Runs Distribution'), title='Overall Runs Distribution')
     return update_layout(fig)
 
-def get_runs_distribution_per_over(ipl, seasons=None):
+def get_runs_distribution_per_over(ipl, seasons=None, summary=None):
     """
     Plot line chart of runs scored per over, with phase regions and annotations.
     Args:
         ipl (DataFrame): Ball-by-ball data
         seasons (list, optional): Filter by seasons
+        summary (dict, optional): batting_summary() of the same seasons, shared between the Batting tab's charts
     Returns:
         go.Figure: Line chart of runs per over
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    runs_by_over = filtered_ipl_df.groupby('over')['total_runs'].sum()
+    if summary is None:
+        summary = batting_summary(ipl, seasons)
+    runs_by_over = summary['runs_by_over']
     line_trace = go.Scatter(
         x=runs_by_over.index + 1,
         y=runs_by_over.values,
@@ -512,20 +738,19 @@ def get_runs_distribution_per_over(ipl, seasons=None):
     fig.update_layout(title='Runs Distribution by Over', xaxis=dict(categoryorder='array', categoryarray=list(map(str, range(1, 21))), tickmode='array', tickvals=list(map(str, range(1, 21)))))
     return update_layout(fig)
 
-def get_batting_runrate_by_team(ipl, seasons=None):
+def get_batting_runrate_by_team(ipl, seasons=None, summary=None):
     """
     Generate a line chart of average batting run rate (runs per over) for each team.
     Args:
         ipl (DataFrame): Ball-by-ball IPL data
         seasons (list, optional): List of seasons to filter by
+        summary (dict, optional): batting_summary() of the same seasons, shared between the Batting tab's charts
     Returns:
         go.Figure: Plotly line chart of run rate by team
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    team_runrate_df = filtered_ipl_df.groupby('batting_team').agg(
-        total_runs=('total_runs', 'sum'),
-        total_balls=('ball', 'count')
-    ).reset_index()
+    if summary is None:
+        summary = batting_summary(ipl, seasons)
+    team_runrate_df = summary['by_team'][['runs', 'balls']].rename(columns={'runs': 'total_runs', 'balls': 'total_balls'}).reset_index()
     team_runrate_df['overs'] = team_runrate_df['total_balls'] / 6
     team_runrate_df['run_rate'] = team_runrate_df['total_runs'] / team_runrate_df['overs']
     team_runrate_df = team_runrate_df.round({'overs': 2, 'run_rate': 2})
@@ -542,21 +767,21 @@ def get_batting_runrate_by_team(ipl, seasons=None):
     fig.update_layout(title='Batting Run Rate by Team')
     return update_layout(fig)
 
-def get_batting_average_by_team(ipl, seasons=None):
+def get_batting_average_by_team(ipl, seasons=None, summary=None):
     """
     Generate a line chart of average runs scored per match for each team.
     Args:
         ipl (DataFrame): Ball-by-ball IPL data
         seasons (list, optional): List of seasons to filter by
+        summary (dict, optional): batting_summary() of the same seasons, shared between the Batting tab's charts
     Returns:
         go.Figure: Plotly line chart of batting average by team
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    # Aggregate total runs and number of matches played by each team
-    team_avg_df = filtered_ipl_df.groupby('batting_team').agg(
-        total_runs=('total_runs', 'sum')
-    )
-    team_avg_df['num_matches'] = filtered_ipl_df.groupby('batting_team')['match_id'].nunique()
+    if summary is None:
+        summary = batting_summary(ipl, seasons)
+    # Total runs and number of matches played by each team
+    team_avg_df = summary['by_team'][['runs']].rename(columns={'runs': 'total_runs'})
+    team_avg_df['num_matches'] = summary['team_matches']
     team_avg_df['average_runs'] = team_avg_df['total_runs'] / team_avg_df['num_matches']
     team_avg_df = team_avg_df.round({'average_runs': 2}).reset_index()
     # Create line chart
@@ -582,43 +807,44 @@ def get_highest_run_chase(matches, seasons=None):
     Returns:
         int: Highest run chase value
     """
-    filtered_matches_df = matches[matches['season'].isin(seasons)].copy() if seasons else matches.copy()
-    chasing_wins_df = filtered_matches_df[filtered_matches_df['result'] == 'wickets']
+    chasing_mask = matches['result'] == 'wickets'
+    if seasons:
+        chasing_mask &= matches['season'].isin(seasons)
+    chasing_wins_df = matches.loc[chasing_mask, ['target_runs']]
     highest_chase_row = chasing_wins_df.sort_values(by='target_runs', ascending=False).iloc[0]
     return int(highest_chase_row['target_runs'])
 
-def get_lowest_total(ipl, seasons=None):
+def get_lowest_total(ipl, seasons=None, summary=None):
     """
     Get the lowest total runs scored in a completed 20-over innings, optionally filtered by season.
     Args:
         ipl (DataFrame): Ball-by-ball IPL data
         seasons (list, optional): List of seasons to filter by
+        summary (dict, optional): batting_summary() of the same seasons, shared between the Batting tab's charts
     Returns:
         int: Lowest total runs in a completed 20-over innings
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    completed_df = filtered_ipl_df.dropna(subset=['winner'])  # Only consider completed 20-over innings (both innings)
-    completed_20_df = completed_df[(completed_df['target_overs'] == 20) & (completed_df['inning'].isin([1, 2]))]
-    lowest_total_df = completed_20_df.groupby(['match_id', 'batting_team'])['total_runs'].sum().reset_index(name='lowest_total')
+    # Innings totals of completed 20-over matches (both innings)
+    if summary is None:
+        summary = batting_summary(ipl, seasons)
+    lowest_total_df = summary['innings'].rename(columns={'runs': 'lowest_total'})
     return int(lowest_total_df.sort_values(by='lowest_total').iloc[0]['lowest_total'])
 
-def get_batting_strike_rate_by_team(ipl, seasons=None):
+def get_batting_strike_rate_by_team(ipl, seasons=None, summary=None):
     """
     Generate a line chart of batting strike rate (runs per 100 balls) for each team.
     Args:
         ipl (DataFrame): Ball-by-ball IPL data
         seasons (list, optional): List of seasons to filter by
+        summary (dict, optional): batting_summary() of the same seasons, shared between the Batting tab's charts
     Returns:
         go.Figure: Plotly line chart of batting strike rate by team
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    # Filter legal deliveries (exclude wides and no-balls)
-    legal_deliveries_df = filtered_ipl_df[~filtered_ipl_df['extras_type'].isin(['wides', 'noballs'])]
-    # Aggregate total runs and balls faced per team
-    team_runs = legal_deliveries_df.groupby('batting_team')['batsman_runs'].sum()
-    balls_faced = legal_deliveries_df.groupby('batting_team').size()
-    strike_rate_df = pd.concat([team_runs, balls_faced], axis=1)
-    strike_rate_df.columns = ['total_runs', 'balls_faced']
+    # Aggregate total runs and balls faced per team on legal deliveries (no wides or no-balls)
+    if summary is None:
+        summary = batting_summary(ipl, seasons)
+    by_team = summary['by_team']
+    strike_rate_df = by_team[by_team['legal_balls'] > 0][['legal_batsman_runs', 'legal_balls']].rename(columns={'legal_batsman_runs': 'total_runs', 'legal_balls': 'balls_faced'})
     strike_rate_df['strike_rate'] = (strike_rate_df['total_runs'] / strike_rate_df['balls_faced']) * 100
     # Create line chart trace
     line_trace = go.Scatter(
@@ -633,33 +859,25 @@ def get_batting_strike_rate_by_team(ipl, seasons=None):
     fig.update_layout(title='Batting Strike Rate by Team')
     return update_layout(fig)
 
-def get_best_bowling_figures(ipl, seasons=None, player=None):
+def get_best_bowling_figures(ipl, seasons=None, player=None, summary=None):
     """
     Get the best bowling figures (most wickets, least runs) in a match, optionally filtered by season and/or player.
     Args:
         ipl (DataFrame): Ball-by-ball IPL data
         seasons (list, optional): List of seasons to filter by
         player (str, optional): Player name to get best figures for
+        summary (dict, optional): bowling_summary() of the same seasons, shared between the Bowling tab's charts
     Returns:
         str: Best bowling figures in format 'Bowler (wickets/runs)'
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    # Only valid dismissals for wickets
-    valid_dismissals = [
-        'bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket'
-    ]
-    wickets_df = filtered_ipl_df[filtered_ipl_df['dismissal_kind'].isin(valid_dismissals)].copy()
+    if summary is None:
+        summary = bowling_summary(ipl, seasons)
+    # Runs and valid-dismissal wickets of each bowler in each match
+    figures_df = summary['bowling_figures']
     # If player is specified, filter for that bowler
     if player:
-        filtered_ipl_df = filtered_ipl_df[filtered_ipl_df['bowler'] == player]
-        wickets_df = wickets_df[wickets_df['bowler'] == player]
-    # Group runs and wickets by match and bowler
-    runs_per_bowler_match = filtered_ipl_df.groupby(['match_id', 'bowler'])['total_runs'].sum().reset_index()
-    wickets_per_bowler_match = wickets_df.groupby(['match_id', 'bowler'])['is_wicket'].sum().reset_index()
-    # Merge runs and wickets
-    figures_df = pd.merge(runs_per_bowler_match, wickets_per_bowler_match, on=['match_id', 'bowler'], how='left')
-    figures_df['is_wicket'] = figures_df['is_wicket'].fillna(0)
-    figures_df.rename(columns={'is_wicket': 'total_wickets'}, inplace=True)
+        figures_df = figures_df[figures_df['bowler'] == player]
+    figures_df = figures_df.rename(columns={'runs': 'total_runs', 'wickets': 'total_wickets'})
     # Sort by wickets (desc), then runs (asc)
     figures_df = figures_df.sort_values(by=['total_wickets', 'total_runs'], ascending=[False, True])
     if not figures_df.empty:
@@ -670,21 +888,21 @@ def get_best_bowling_figures(ipl, seasons=None, player=None):
         return f"{bowler_name} ({wickets}/{runs})"
     return "-"
 
-def get_most_expensive_overs(ipl, n, seasons=None):
+def get_most_expensive_overs(ipl, n, seasons=None, summary=None):
     """
     Generate a horizontal bar chart of the most expensive overs (most runs conceded) in IPL.
     Args:
         ipl (DataFrame): Ball-by-ball IPL data
         n (int): Number of top expensive overs to show
         seasons (list, optional): List of seasons to filter by
+        summary (dict, optional): bowling_summary() of the same seasons, shared between the Bowling tab's charts
     Returns:
         go.Figure: Bar chart of most expensive overs
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    # Group by match, innings, bowler, and over
-    over_stats_df = filtered_ipl_df.groupby(['match_id', 'inning', 'bowler', 'over']).agg(
-        runs_conceded=('total_runs', 'sum')
-    ).reset_index()
+    if summary is None:
+        summary = bowling_summary(ipl, seasons)
+    # Runs conceded per match, innings, bowler, and over
+    over_stats_df = summary['over_runs']
     # Sort by most runs in a single over
     top_expensive_overs_df = over_stats_df.sort_values(by='runs_conceded', ascending=False).head(n)[::-1]
     
@@ -699,22 +917,20 @@ def get_most_expensive_overs(ipl, n, seasons=None):
     fig.update_layout(title=dict(text='Most Runs Conceded in a Single Over'))
     return update_layout(fig)
 
-def get_dismissal_kind(ipl, seasons=None):
+def get_dismissal_kind(ipl, seasons=None, summary=None):
     """
     Generate a pie chart of dismissal kinds (bowled, caught, etc.) in IPL.
     Args:
         ipl (DataFrame): Ball-by-ball IPL data
         seasons (list, optional): List of seasons to filter by
+        summary (dict, optional): bowling_summary() of the same seasons, shared between the Bowling tab's charts
     Returns:
         go.Figure: Pie chart of dismissal kinds
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
+    if summary is None:
+        summary = bowling_summary(ipl, seasons)
     labels = ['Bowled', 'Caught', 'LBW', 'Stumped', 'Caught and Bowled', 'Hit Wicket']
-    valid_dismissals = [
-        'bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket'
-    ]
-    dismissals_df = filtered_ipl_df[filtered_ipl_df['dismissal_kind'].isin(valid_dismissals)]
-    dismissals_count_df = dismissals_df.groupby(['dismissal_kind']).size().reset_index(name='count')
+    dismissals_count_df = summary['dismissal_kinds'].reset_index(name='count')
     
     pie_trace = go.Pie(
             labels=labels,
@@ -737,26 +953,17 @@ def get_most_number_of_hattricks(ipl, seasons=None):
     Returns:
         str: Bowler and number of hat-tricks
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
     valid_dismissals = [
         'bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket'
     ]
     # Only legal deliveries (no extras)
-    legal_deliveries_df = filtered_ipl_df[filtered_ipl_df['extras_type'].isna()]
+    legal_deliveries_df = select_rows(ipl, seasons, ipl['extras_type'].isna(), ['match_id', 'bowler', 'over', 'ball', 'dismissal_kind'])
     # Mark legal wickets
-    legal_deliveries_df = legal_deliveries_df.copy()
-    legal_deliveries_df['is_wicket'] = legal_deliveries_df['dismissal_kind'].isin(valid_dismissals).astype(int)
-    # Sort by match, bowler, and ball order
-    legal_deliveries_df = legal_deliveries_df.sort_values(by=['match_id', 'bowler', 'over', 'ball'])
-    # Rolling sum over 3 balls for each bowler per match
-    def find_hattricks(df):
-        df['hat_sum'] = df['is_wicket'].rolling(window=3).sum()
-        return df
-    legal_deliveries_df = legal_deliveries_df.groupby(['match_id', 'bowler']).apply(find_hattricks, include_groups=False)
-    # Filter rows where rolling sum is 3 => hat-trick detected
-    hat_tricks_df = legal_deliveries_df[legal_deliveries_df['hat_sum'] == 3]
+    legal_deliveries_df = legal_deliveries_df.assign(is_wicket=legal_deliveries_df['dismissal_kind'].isin(valid_dismissals).astype(int))
+    # Balls ending a run of 3 consecutive wickets by a bowler in a match => hat-trick detected
+    hat_tricks_df = find_streaks(legal_deliveries_df, 'is_wicket', by=['match_id', 'bowler'], order=['over', 'ball'], length=3)
     # Count number of hat-tricks per bowler
-    hattrick_counts_df = hat_tricks_df.groupby('bowler').size().reset_index(name='hat_tricks')
+    hattrick_counts_df = hat_tricks_df.groupby('bowler', observed=True).size().reset_index(name='hat_tricks')
     # Sort in descending order to get most hat-tricks
     hattrick_counts_df = hattrick_counts_df.sort_values(by='hat_tricks', ascending=False)
     if not hattrick_counts_df.empty:
@@ -768,21 +975,20 @@ def get_most_number_of_hattricks(ipl, seasons=None):
         return f"{bowler_name} ({hat_tricks} Hattrick)"
     return "-"
 
-def get_bowling_average_by_team(ipl, seasons=None):
+def get_bowling_average_by_team(ipl, seasons=None, summary=None):
     """
     Generate a line chart of bowling average (runs per wicket) for each team.
     Args:
         ipl (DataFrame): Ball-by-ball IPL data
         seasons (list, optional): List of seasons to filter by
+        summary (dict, optional): bowling_summary() of the same seasons, shared between the Bowling tab's charts
     Returns:
         go.Figure: Plotly line chart of bowling average by team
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    # Aggregate total runs conceded and wickets taken by each team
-    team_bowl_avg_df = filtered_ipl_df.groupby('bowling_team').agg(
-        total_runs=('total_runs', 'sum'),
-        total_wickets=('is_wicket', 'sum')
-    ).reset_index()
+    if summary is None:
+        summary = bowling_summary(ipl, seasons)
+    # Total runs conceded and wickets taken by each team
+    team_bowl_avg_df = summary['by_team'][['runs', 'wickets']].rename(columns={'runs': 'total_runs', 'wickets': 'total_wickets'}).reset_index()
     team_bowl_avg_df['average'] = team_bowl_avg_df['total_runs'] / team_bowl_avg_df['total_wickets']
     # Create line chart trace
     line_trace = go.Scatter(
@@ -797,28 +1003,21 @@ def get_bowling_average_by_team(ipl, seasons=None):
     fig.update_layout(title='Bowling Average by Team')
     return update_layout(fig)
 
-def get_bowling_strike_rate_by_team(ipl, seasons=None):
+def get_bowling_strike_rate_by_team(ipl, seasons=None, summary=None):
     """
     Generate a line chart of bowling strike rate (balls per wicket) for each team.
     Args:
         ipl (DataFrame): Ball-by-ball IPL data
         seasons (list, optional): List of seasons to filter by
+        summary (dict, optional): bowling_summary() of the same seasons, shared between the Bowling tab's charts
     Returns:
         go.Figure: Plotly line chart of bowling strike rate by team
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    # Filter legal deliveries (exclude wides and no-balls)
-    legal_deliveries_df = filtered_ipl_df[~filtered_ipl_df['extras_type'].isin(['wides', 'noballs'])]
-    # Count legal balls bowled per team
-    balls_bowled = legal_deliveries_df.groupby('bowling_team').size()
-    # Valid dismissals that count for bowlers
-    valid_dismissals = ['bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket']
-    wickets_df = filtered_ipl_df[filtered_ipl_df['dismissal_kind'].isin(valid_dismissals)]
-    wickets_by_team = wickets_df.groupby('bowling_team').size()
-    # Combine and compute strike rate
-    strike_rate_df = pd.concat([balls_bowled, wickets_by_team], axis=1)
-    strike_rate_df.columns = ['total_balls', 'total_wickets']
-    strike_rate_df = strike_rate_df.fillna(0)
+    if summary is None:
+        summary = bowling_summary(ipl, seasons)
+    # Legal balls bowled (no wides or no-balls) and dismissals credited to bowlers, per team
+    by_team = summary['by_team']
+    strike_rate_df = by_team[(by_team['legal_balls'] > 0) | (by_team['dismissals'] > 0)][['legal_balls', 'dismissals']].rename(columns={'legal_balls': 'total_balls', 'dismissals': 'total_wickets'})
     strike_rate_df['strike_rate'] = (strike_rate_df['total_balls'] / strike_rate_df['total_wickets']).replace([float('inf'), -float('inf')], 0)
     # Create line chart trace
     line_trace = go.Scatter(
@@ -833,21 +1032,20 @@ def get_bowling_strike_rate_by_team(ipl, seasons=None):
     fig.update_layout(title='Bowling Strike Rate by Team')
     return update_layout(fig)
 
-def get_bowling_economy_by_team(ipl, seasons=None):
+def get_bowling_economy_by_team(ipl, seasons=None, summary=None):
     """
     Generate a line chart of bowling economy (runs per over) for each team.
     Args:
         ipl (DataFrame): Ball-by-ball IPL data
         seasons (list, optional): List of seasons to filter by
+        summary (dict, optional): bowling_summary() of the same seasons, shared between the Bowling tab's charts
     Returns:
         go.Figure: Plotly line chart of bowling economy by team
     """
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    # Aggregate total runs conceded and balls bowled by each team
-    team_economy_df = filtered_ipl_df.groupby('bowling_team').agg(
-        total_runs=('total_runs', 'sum'),
-        total_balls=('ball', 'size')
-    ).reset_index()
+    if summary is None:
+        summary = bowling_summary(ipl, seasons)
+    # Total runs conceded and balls bowled by each team
+    team_economy_df = summary['by_team'][['runs', 'balls']].rename(columns={'runs': 'total_runs', 'balls': 'total_balls'}).reset_index()
     team_economy_df['overs'] = team_economy_df['total_balls'] / 6
     team_economy_df['economy'] = team_economy_df['total_runs'] / team_economy_df['overs']
     # Create line chart trace
@@ -863,65 +1061,68 @@ def get_bowling_economy_by_team(ipl, seasons=None):
     fig.update_layout(title='Bowling Economy by Team')
     return update_layout(fig)
 
-def get_best_team_economy(ipl, seasons=None):
+def get_best_team_economy(ipl, seasons=None, summary=None):
     """
     Returns a str of best (lowest) team economy.
     Args:
         ipl (DataFrame): Ball-by-ball IPL data
         seasons (list, optional): List of seasons to filter by
+        summary (dict, optional): bowling_summary() of the same seasons, shared between the Bowling tab's charts
     Returns:
         dict: {season: (team, value)}
     """
-    filtered_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    grouped = filtered_df.groupby(['season', 'bowling_team']).agg(total_runs=('total_runs', 'sum'), total_balls=('ball', 'size')).reset_index()
+    if summary is None:
+        summary = bowling_summary(ipl, seasons)
+    grouped = summary['by_season_team'][['runs', 'balls']].rename(columns={'runs': 'total_runs', 'balls': 'total_balls'}).reset_index()
     grouped['overs'] = grouped['total_balls'] / 6
     grouped['economy'] = grouped['total_runs'] / grouped['overs']
     idx = grouped['economy'].idxmin()
     best = grouped.loc[idx, ['bowling_team', 'economy']]
-    return f"{TEAM_SHORT_NAMES[best[0]]} ({round(float(best[1]), 2)})"
+    return f"{TEAM_SHORT_NAMES.get(best[0], best[0])} ({round(float(best[1]), 2)})"
 
-def get_best_team_strike_rate(ipl, seasons=None):
+def get_best_team_strike_rate(ipl, seasons=None, summary=None):
     """
     Returns a str of best (lowest) team strike rate.
     Args:
         ipl (DataFrame): Ball-by-ball IPL data
         seasons (list, optional): List of seasons to filter by
+        summary (dict, optional): bowling_summary() of the same seasons, shared between the Bowling tab's charts
     Returns:
         dict: {season: (team, value)}
     """
-    filtered_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    legal_deliveries = filtered_df[~filtered_df['extras_type'].isin(['wides', 'noballs'])]
-    balls_bowled = legal_deliveries.groupby(['season', 'bowling_team']).size().rename('total_balls')
-    valid_dismissals = ['bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket']
-    wickets_df = filtered_df[filtered_df['dismissal_kind'].isin(valid_dismissals)]
-    wickets_by_team = wickets_df.groupby(['season', 'bowling_team']).size().rename('total_wickets')
-    sr_df = pd.concat([balls_bowled, wickets_by_team], axis=1).fillna(0)
+    if summary is None:
+        summary = bowling_summary(ipl, seasons)
+    by_season_team = summary['by_season_team']
+    sr_df = by_season_team[(by_season_team['legal_balls'] > 0) | (by_season_team['dismissals'] > 0)][['legal_balls', 'dismissals']].rename(columns={'legal_balls': 'total_balls', 'dismissals': 'total_wickets'})
     sr_df['strike_rate'] = (sr_df['total_balls'] / sr_df['total_wickets']).replace([float('inf'), -float('inf')], 0)
     sr_df = sr_df.reset_index()
     idx = sr_df['strike_rate'].idxmin()
     best = sr_df.loc[idx, ['bowling_team', 'strike_rate']]
-    return f"{TEAM_SHORT_NAMES[best[0]]} ({round(float(best[1]), 2)})"
+    return f"{TEAM_SHORT_NAMES.get(best[0], best[0])} ({round(float(best[1]), 2)})"
 
 
-def get_best_team_average(ipl, seasons=None):
+def get_best_team_average(ipl, seasons=None, summary=None):
     """
     Returns a str of best (lowest) team bowling average.
     Args:
         ipl (DataFrame): Ball-by-ball IPL data
         seasons (list, optional): List of seasons to filter by
+        summary (dict, optional): bowling_summary() of the same seasons, shared between the Bowling tab's charts
     Returns:
         dict: {season: (team, value)}
     """
-    filtered_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    grouped = filtered_df.groupby('bowling_team').agg(total_runs=('total_runs', 'sum'), total_wickets=('is_wicket', 'sum')).reset_index()
+    if summary is None:
+        summary = bowling_summary(ipl, seasons)
+    grouped = summary['by_team'][['runs', 'wickets']].rename(columns={'runs': 'total_runs', 'wickets': 'total_wickets'}).reset_index()
     grouped['average'] = grouped['total_runs'] / grouped['total_wickets']
     idx = grouped['average'].idxmin()
     best = grouped.loc[idx, ['bowling_team', 'average']]
-    return f"{TEAM_SHORT_NAMES[best[0]]} ({round(float(best[1]), 2)})"
+    return f"{TEAM_SHORT_NAMES.get(best[0], best[0])} ({round(float(best[1]), 2)})"
 
 def get_team_stats(ipl, team_name, seasons=None):
     """
     Calculate and return a DataFrame of key batting and bowling stats for a given team.
+    The stats are derived from the team's rows of the team x season matrix in the aggregate cube.
     Args:
         ipl (DataFrame): Ball-by-ball IPL data
         team_name (str): Team name to analyze
@@ -929,58 +1130,41 @@ def get_team_stats(ipl, team_name, seasons=None):
     Returns:
         DataFrame: Stats with columns [Stat, Batting, Bowling]
     """
-    # Filter IPL data by selected seasons
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
+    # Sum the team's seasons; a team that did not play in the selection gets zeros
+    totals = cube_totals(ipl, 'teams', by='team', seasons=seasons).reindex([team_name], fill_value=0).iloc[0]
 
     # Total matches played by the team (batting or bowling)
-    total_matches = filtered_ipl_df[
-        (filtered_ipl_df['batting_team'] == team_name) |
-        (filtered_ipl_df['bowling_team'] == team_name)
-    ]['match_id'].nunique()
+    total_matches = totals['matches']
 
     # Batting stats
-    batting_df = filtered_ipl_df[filtered_ipl_df['batting_team'] == team_name]
-    batting_total_runs = batting_df['total_runs'].sum()
-    batting_matches = batting_df['match_id'].nunique()
+    batting_total_runs = totals['batting_runs']
+    batting_matches = totals['batting_matches']
     # Batting average: runs per match
     batting_average = round(batting_total_runs / batting_matches, 2) if batting_matches else 0
-    wickets_lost = batting_df['is_wicket'].sum()
-    # Only legal balls (exclude wides/noballs)
-    legal_balls = batting_df[~batting_df['extra_runs'].isin(['wides', 'noballs'])].shape[0]
+    wickets_lost = totals['wickets_lost']
+    legal_balls = totals['batting_balls']
     total_overs = legal_balls / 6 if legal_balls else 0
     batting_run_rate = round(batting_total_runs / total_overs, 2) if total_overs else 0
     batting_strike_rate = round((batting_total_runs / legal_balls) * 100, 2) if legal_balls else 0
 
     # Bowling stats
-    bowling_df = filtered_ipl_df[filtered_ipl_df['bowling_team'] == team_name]
-    bowling_total_runs = bowling_df['total_runs'].sum()
-    wickets_taken = bowling_df['is_wicket'].sum()
-    legal_balls_bowled = bowling_df[~bowling_df['extra_runs'].isin(['wides', 'noballs'])].shape[0]
+    bowling_total_runs = totals['bowling_runs']
+    wickets_taken = totals['wickets_taken']
+    legal_balls_bowled = totals['bowling_balls']
     bowling_overs = legal_balls_bowled / 6 if legal_balls_bowled else 0
     bowling_economy = round(bowling_total_runs / bowling_overs, 2) if bowling_overs else 0
     bowling_average = round(bowling_total_runs / wickets_taken, 2) if wickets_taken else 0
     bowling_strike_rate = round(legal_balls_bowled / wickets_taken, 2) if wickets_taken else 0
 
-    # Match results for win/toss stats
-    match_results_df = filtered_ipl_df.drop_duplicates(subset='match_id')[['match_id', 'winner', 'toss_winner', 'toss_decision']]
-    team_wins = match_results_df[match_results_df['winner'] == team_name].shape[0]
+    # Win/toss stats
+    team_wins = totals['wins']
     win_percentage = round((team_wins / total_matches) * 100, 2) if total_matches else 0
-
-    # Toss stats
-    toss_wins = match_results_df[match_results_df['toss_winner'] == team_name].shape[0]
+    toss_wins = totals['toss_wins']
     toss_win_percentage = round((toss_wins / total_matches) * 100, 2) if total_matches else 0
 
     # Batting First & Bowling First Win %
-    batted_first_wins = match_results_df[
-        (match_results_df['toss_winner'] == team_name) &
-        (match_results_df['toss_decision'] == 'bat') &
-        (match_results_df['winner'] == team_name)
-    ].shape[0]
-    bowled_first_wins = match_results_df[
-        (match_results_df['toss_winner'] == team_name) &
-        (match_results_df['toss_decision'] == 'field') &
-        (match_results_df['winner'] == team_name)
-    ].shape[0]
+    batted_first_wins = totals['bat_first_wins']
+    bowled_first_wins = totals['field_first_wins']
     batting_first_win_percentage = round((batted_first_wins / toss_wins) * 100, 2) if toss_wins else 0
     bowling_first_win_percentage = round((bowled_first_wins / toss_wins) * 100, 2) if toss_wins else 0
 
@@ -1004,7 +1188,7 @@ def get_team_stats(ipl, team_name, seasons=None):
     stats_df = pd.DataFrame(stats, columns=["Stat", "Batting", "Bowling"])
     return stats_df
 
-def get_teams_stats_figs(ipl, team1, team2, seasons=None):
+def get_teams_stats_figs(ipl, team1, team2, seasons=None, team_stats=None):
     """
     Generate three DataFrames for team comparison:
     1. Basic stats (Total Matches, Win %, Toss Win %)
@@ -1025,12 +1209,14 @@ def get_teams_stats_figs(ipl, team1, team2, seasons=None):
         team1 (str): First team name
         team2 (str): Second team name
         seasons (list, optional): List of seasons to filter by
+        team_stats (tuple, optional): get_team_stats() results of (team1, team2), if already computed
     Returns:
         tuple: (basic_stats_fig, batting_stats_fig, bowling_stats_fig)
     """
     # Get stats DataFrames for both teams
-    team1_stats_df = get_team_stats(ipl, team1, seasons)
-    team2_stats_df = get_team_stats(ipl, team2, seasons)
+    if team_stats is None:
+        team_stats = (get_team_stats(ipl, team1, seasons), get_team_stats(ipl, team2, seasons))
+    team1_stats_df, team2_stats_df = team_stats
 
     # Select basic stats
     basic_stats_list = ["Total Matches", "Win %", "Toss Win %"]
@@ -1118,9 +1304,9 @@ def get_team_wins_fig(matches, team1, team2):
     # Filter matches where either team is the winner
     filtered_matches_df = matches[matches['winner'].isin([team1, team2])]
     # Group by season and winner, count wins
-    team_wins_df = filtered_matches_df.groupby(['season', 'winner']).size().reset_index(name='Wins')
+    team_wins_df = filtered_matches_df.groupby(['season', 'winner'], observed=True).size().reset_index(name='Wins')
     # Pivot to get seasons as index, teams as columns
-    team_wins_pivot_df = team_wins_df.pivot_table(index='season', columns='winner', values='Wins', fill_value=0)
+    team_wins_pivot_df = team_wins_df.pivot_table(index='season', columns='winner', values='Wins', fill_value=0, observed=True)
 
     # Create line chart for each team
     fig = go.Figure()
@@ -1151,12 +1337,13 @@ def get_head_to_head_win_stats(matches, team1, team2, seasons=None):
     Returns:
         go.Figure: Plotly pie chart of head-to-head wins
     """
-    # Filter matches by selected seasons
-    filtered_matches_df = matches[matches['season'].isin(seasons)].copy() if seasons else matches.copy()
-    # Only matches where both teams played
-    head_to_head_df = filtered_matches_df[(filtered_matches_df['team1'].isin([team1, team2])) & (filtered_matches_df['team2'].isin([team1, team2]))]
+    # Only matches where both teams played, in the selected seasons
+    head_to_head_mask = matches['team1'].isin([team1, team2]) & matches['team2'].isin([team1, team2])
+    if seasons:
+        head_to_head_mask &= matches['season'].isin(seasons)
+    head_to_head_df = matches.loc[head_to_head_mask, ['winner']]
     # Group by winner and count wins
-    win_stats_df = head_to_head_df.groupby('winner').size().reset_index(name='count')
+    win_stats_df = head_to_head_df.groupby('winner', observed=True).size().reset_index(name='count')
     # Assign colors for pie chart
     color_map = {team1: TEAM_COLORS[team1], team2: TEAM_COLORS[team2]}
     colors = [color_map.get(team, '#888') for team in win_stats_df['winner']]
@@ -1188,15 +1375,15 @@ def get_powerplay_death_batting_stats(ipl, team1, team2):
         tuple: (powerplay_fig, death_fig)
     """
     # Filter IPL data for selected teams
-    filtered_ipl_df = ipl[ipl['batting_team'].isin([team1, team2])]
+    filtered_ipl_df = with_match_columns(select_rows(ipl, mask=ipl['batting_team'].isin([team1, team2]), columns=['batting_team', 'over', 'total_runs']), ['season'])
 
     # Powerplay overs (0-5)
     powerplay_df = filtered_ipl_df[filtered_ipl_df['over'].isin([0, 1, 2, 3, 4, 5])]
-    powerplay_stats_df = powerplay_df.groupby(['season', 'batting_team'])['total_runs'].sum().reset_index(name='total_runs')
+    powerplay_stats_df = powerplay_df.groupby(['season', 'batting_team'], observed=True)['total_runs'].sum().reset_index(name='total_runs')
 
     # Death overs (15-19)
     death_df = filtered_ipl_df[filtered_ipl_df['over'].isin([15, 16, 17, 18, 19])]
-    death_stats_df = death_df.groupby(['season', 'batting_team'])['total_runs'].sum().reset_index(name='total_runs')
+    death_stats_df = death_df.groupby(['season', 'batting_team'], observed=True)['total_runs'].sum().reset_index(name='total_runs')
 
     # Create Powerplay line chart
     powerplay_fig = go.Figure()
@@ -1246,15 +1433,15 @@ def get_powerplay_death_bowling_stats(ipl, team1, team2):
         tuple: (powerplay_fig, death_fig)
     """
     # Filter IPL data for selected teams
-    filtered_ipl_df = ipl[ipl['bowling_team'].isin([team1, team2])]
+    filtered_ipl_df = with_match_columns(select_rows(ipl, mask=ipl['bowling_team'].isin([team1, team2]), columns=['bowling_team', 'over', 'is_wicket']), ['season'])
 
     # Powerplay overs (0-5)
     powerplay_df = filtered_ipl_df[filtered_ipl_df['over'].isin([0, 1, 2, 3, 4, 5])]
-    powerplay_stats_df = powerplay_df.groupby(['season', 'bowling_team'])['is_wicket'].sum().reset_index(name='total_wickets')
+    powerplay_stats_df = powerplay_df.groupby(['season', 'bowling_team'], observed=True)['is_wicket'].sum().reset_index(name='total_wickets')
 
     # Death overs (15-19)
     death_df = filtered_ipl_df[filtered_ipl_df['over'].isin([15, 16, 17, 18, 19])]
-    death_stats_df = death_df.groupby(['season', 'bowling_team'])['is_wicket'].sum().reset_index(name='total_wickets')
+    death_stats_df = death_df.groupby(['season', 'bowling_team'], observed=True)['is_wicket'].sum().reset_index(name='total_wickets')
 
     # Create Powerplay line chart
     powerplay_fig = go.Figure()
@@ -1315,20 +1502,20 @@ def get_top_scorer_top_bowler_stats(ipl, team1, team2, seasons=None):
         go.Figure: Plotly grouped bar chart
     """
     # Filter IPL data for head-to-head matches and selected seasons
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    filtered_ipl_df = filtered_ipl_df[
-        (filtered_ipl_df['batting_team'].isin([team1, team2])) |
-        (filtered_ipl_df['bowling_team'].isin([team1, team2]))
-    ]
+    filtered_ipl_df = select_rows(
+        ipl, seasons,
+        ipl['batting_team'].isin([team1, team2]) | ipl['bowling_team'].isin([team1, team2]),
+        ['batting_team', 'batter', 'batsman_runs', 'bowling_team', 'bowler', 'dismissal_kind', 'is_wicket']
+    )
 
     # Top scorer per team
     scorer_stats_df = (
-        filtered_ipl_df.groupby(['batting_team', 'batter'])['batsman_runs']
+        filtered_ipl_df.groupby(['batting_team', 'batter'], observed=True)['batsman_runs']
         .sum()
         .reset_index()
     )
     top_scorers_df = scorer_stats_df.loc[
-        scorer_stats_df.groupby('batting_team')['batsman_runs'].idxmax()
+        scorer_stats_df.groupby('batting_team', observed=True)['batsman_runs'].idxmax()
     ]
     top_scorers_df['type'] = 'Top Scorer'
     top_scorers_df.rename(columns={'batting_team': 'team', 'batter': 'Player', 'batsman_runs': 'Value'}, inplace=True)
@@ -1339,12 +1526,12 @@ def get_top_scorer_top_bowler_stats(ipl, team1, team2, seasons=None):
     ]
     wickets_df = filtered_ipl_df[filtered_ipl_df['dismissal_kind'].isin(valid_dismissals)]
     bowler_stats_df = (
-        wickets_df.groupby(['bowling_team', 'bowler'])['is_wicket']
+        wickets_df.groupby(['bowling_team', 'bowler'], observed=True)['is_wicket']
         .sum()
         .reset_index()
     )
     top_bowlers_df = bowler_stats_df.loc[
-        bowler_stats_df.groupby('bowling_team')['is_wicket'].idxmax()
+        bowler_stats_df.groupby('bowling_team', observed=True)['is_wicket'].idxmax()
     ]
     top_bowlers_df['type'] = 'Top Wicket Taker'
     top_bowlers_df.rename(columns={'bowling_team': 'team', 'bowler': 'Player', 'is_wicket': 'Value'}, inplace=True)
@@ -1384,14 +1571,14 @@ def get_boundary_count(ipl, team1, team2, seasons=None):
     Returns:
         go.Figure: Plotly bar chart of boundaries per team
     """
-    # Filter IPL data for selected seasons and teams
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    filtered_ipl_df = filtered_ipl_df[filtered_ipl_df['batting_team'].isin([team1, team2])]
-
-    # Only 4s and 6s
-    boundaries_df = filtered_ipl_df[filtered_ipl_df['total_runs'].isin([4, 6])]
+    # Only 4s and 6s hit by either team, in the selected seasons
+    boundaries_df = select_rows(
+        ipl, seasons,
+        ipl['batting_team'].isin([team1, team2]) & ipl['total_runs'].isin([4, 6]),
+        ['batting_team', 'total_runs']
+    )
     # Group by team and run type, count boundaries
-    boundaries_stats_df = boundaries_df.groupby(['batting_team', 'total_runs']).size().reset_index(name='total_boundaries')
+    boundaries_stats_df = boundaries_df.groupby(['batting_team', 'total_runs'], observed=True).size().reset_index(name='total_boundaries')
 
     # Create bar chart
     fig = go.Figure()
@@ -1419,22 +1606,23 @@ def get_dismissal_type_distribution(ipl, team1, team2, seasons=None):
     Returns:
         tuple: (wickets_taken_fig, wickets_lost_fig)
     """
-    # Filter IPL data for selected seasons
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-
-    # Only valid dismissal kinds
+    # Only valid dismissal kinds, in the selected seasons
     valid_dismissals = [
         'bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket'
     ]
-    filtered_ipl_df = filtered_ipl_df[filtered_ipl_df['dismissal_kind'].isin(valid_dismissals)]
+    filtered_ipl_df = select_rows(
+        ipl, seasons,
+        ipl['dismissal_kind'].isin(valid_dismissals),
+        ['batting_team', 'bowling_team', 'dismissal_kind', 'is_wicket']
+    )
 
     # Wickets taken by each team
     wickets_taken_df = filtered_ipl_df[filtered_ipl_df['bowling_team'].isin([team1, team2])]
-    wickets_taken_stats_df = wickets_taken_df.groupby(['bowling_team', 'dismissal_kind'])['is_wicket'].size().reset_index(name='count')
+    wickets_taken_stats_df = wickets_taken_df.groupby(['bowling_team', 'dismissal_kind'], observed=True)['is_wicket'].size().reset_index(name='count')
 
     # Wickets lost by each team
     wickets_lost_df = filtered_ipl_df[filtered_ipl_df['batting_team'].isin([team1, team2])]
-    wickets_lost_stats_df = wickets_lost_df.groupby(['batting_team', 'dismissal_kind'])['is_wicket'].size().reset_index(name='count')
+    wickets_lost_stats_df = wickets_lost_df.groupby(['batting_team', 'dismissal_kind'], observed=True)['is_wicket'].size().reset_index(name='count')
 
     # Pie chart: Wickets Taken by Team (lighter shades)
     wickets_taken_fig = make_subplots(rows=1, cols=2, specs=[[{'type': 'domain'}, {'type': 'domain'}]])
@@ -1489,12 +1677,12 @@ def get_batting_strike_rate(ipl, team1, team2):
         go.Figure: Plotly line chart of batting strike rate
     """
     # Filter IPL data for selected teams
-    filtered_ipl_df = ipl[ipl['batting_team'].isin([team1, team2])].copy()
+    filtered_ipl_df = with_match_columns(select_rows(ipl, mask=ipl['batting_team'].isin([team1, team2]), columns=['batting_team', 'batsman_runs', 'extras_type']), ['season'])
     # Filter legal deliveries (exclude wides and no-balls)
     legal_deliveries_df = filtered_ipl_df[~filtered_ipl_df['extras_type'].isin(['wides', 'noballs'])]
     # Aggregate total runs and balls faced per team per season
-    team_runs = legal_deliveries_df.groupby(['season', 'batting_team'])['batsman_runs'].sum()
-    balls_faced = legal_deliveries_df.groupby(['season', 'batting_team']).size()
+    team_runs = legal_deliveries_df.groupby(['season', 'batting_team'], observed=True)['batsman_runs'].sum()
+    balls_faced = legal_deliveries_df.groupby(['season', 'batting_team'], observed=True).size()
     strike_rate_df = pd.concat([team_runs, balls_faced], axis=1)
     strike_rate_df.columns = ['total_runs', 'balls_faced']
     strike_rate_df = strike_rate_df.reset_index()
@@ -1528,9 +1716,9 @@ def get_bowling_economy(ipl, team1, team2):
         go.Figure: Plotly line chart of bowling economy
     """
     # Filter IPL data for selected teams
-    filtered_ipl_df = ipl[ipl['bowling_team'].isin([team1, team2])].copy()
+    filtered_ipl_df = with_match_columns(select_rows(ipl, mask=ipl['bowling_team'].isin([team1, team2]), columns=['bowling_team', 'total_runs', 'ball']), ['season'])
     # Aggregate total runs and balls bowled per team per season
-    bowling_economy_df = filtered_ipl_df.groupby(['season', 'bowling_team']).agg(
+    bowling_economy_df = filtered_ipl_df.groupby(['season', 'bowling_team'], observed=True).agg(
         total_runs=('total_runs', 'sum'),
         total_balls=('ball', 'size')
     ).reset_index()
@@ -1555,104 +1743,38 @@ def get_bowling_economy(ipl, team1, team2):
     return update_layout(fig)
 
 def get_batsman_stats(ipl, player, seasons=None):
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    
-    batting_stats_df = filtered_ipl_df[filtered_ipl_df['batter'] == player]
-    
-    mask = (
-        (filtered_ipl_df['batter'] == player) |
-        (filtered_ipl_df['bowler'] == player) |
-        (filtered_ipl_df['fielder'] == player)
-    )
-    total_matches = filtered_ipl_df.loc[mask, 'match_id'].nunique()
-    total_innings = batting_stats_df[['match_id', 'inning']].drop_duplicates()
-    total_innings = len(total_innings)
-    total_runs = batting_stats_df['batsman_runs'].sum()
-    total_balls = batting_stats_df['ball'].size
-    strike_rate = (total_runs / total_balls) * 100 if total_balls > 0 else 0
-    dismissals = batting_stats_df['player_dismissed'].notnull().sum()
-    average = total_runs / dismissals if dismissals > 0 else total_runs
-    
-    total_fours = (batting_stats_df['batsman_runs'] == 4).sum()
-    total_sixes = (batting_stats_df['batsman_runs'] == 6).sum()
-    
-    match_runs = batting_stats_df.groupby('match_id')['batsman_runs'].sum()
-    fifties = (match_runs.between(50, 99)).sum()
-    hundreds = (match_runs >= 100).sum()
-
-    best_score = match_runs.max() if not match_runs.empty else 0
-    
-    dismissal_type_often = batting_stats_df.groupby('dismissal_kind').size().idxmax()
-    potm = batting_stats_df[batting_stats_df['player_of_match'] == player]
-    potm = potm['match_id'].nunique()
-    
-    return {
-        'total_matches': total_matches,
-        'total_innings': total_innings,
-        'total_runs': total_runs,
-        'batting_strike_rate': strike_rate,
-        'dismissals': dismissals,
-        'batting_average': average,
-        'total_fours': total_fours,
-        'total_sixes': total_sixes,
-        'fifties': fifties,
-        'hundreds': hundreds,
-        'best_score': best_score,
-        'dismissal_type_often': dismissal_type_often,
-        'player_of_the_match': potm
-    }
+    """
+    Career batting record of a player, read from the batch player profiles.
+    Args:
+        ipl (DataFrame): Ball-by-ball IPL data
+        player (str): Player name
+        seasons (list, optional): List of seasons to filter by
+    Returns:
+        dict: Batting KPIs of the player
+    """
+    batting_df = player_profiles(ipl, seasons)['batting']
+    if player not in batting_df.index:
+        return {**dict.fromkeys(BATSMAN_STATS, 0), 'dismissal_type_often': None}
+    profile = batting_df.loc[player]
+    return {stat: profile[column] for stat, column in BATSMAN_STATS.items()}
 
 def get_bowler_stats(ipl, player, seasons=None):
-
-    filtered_ipl_df = ipl[ipl['season'].isin(seasons)].copy() if seasons else ipl.copy()
-    bowling_stats_df = filtered_ipl_df[filtered_ipl_df['bowler'] == player]
-
-    total_matches = bowling_stats_df['match_id'].nunique()
-    total_innings = bowling_stats_df[['match_id', 'inning']].drop_duplicates().shape[0]
-    
-    valid_dismissals = ['bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket']
-    bowling_stats_df = bowling_stats_df[bowling_stats_df['dismissal_kind'].isin(valid_dismissals) | bowling_stats_df['dismissal_kind'].isnull()]
-    legal_deliveries_df = bowling_stats_df[~bowling_stats_df['extra_runs'].isin(['wides', 'noballs'])]
-
-    total_wickets = bowling_stats_df['is_wicket'].sum()
-    run_conceded = bowling_stats_df['total_runs'].sum()
-    balls_bowled = legal_deliveries_df['ball'].size
-    total_overs = balls_bowled / 6 if balls_bowled else 0
-
-    average = run_conceded / total_wickets if total_wickets else run_conceded
-    economy_rate = run_conceded / total_overs if total_overs else 0
-    strike_rate = balls_bowled / total_wickets if total_wickets else 0
-
-    best_bowling_figures = get_best_bowling_figures(ipl, seasons, player)
-
-    match_wickets_df = bowling_stats_df.groupby('match_id')['is_wicket'].sum().reset_index(name='wickets')
-    four_wicket_hauls = match_wickets_df[match_wickets_df['wickets'] == 4].shape[0]
-    five_wicket_hauls = match_wickets_df[match_wickets_df['wickets'] == 5].shape[0]
-
-    if not bowling_stats_df.empty and 'dismissal_kind' in bowling_stats_df.columns:
-        dismissal_type_often = bowling_stats_df.groupby('dismissal_kind').size().idxmax()
-    else:
-        dismissal_type_often = None
-
-    maiden_overs_df = bowling_stats_df.groupby(['match_id', 'over'])['total_runs'].sum().reset_index(name='total_runs')
-    maiden_overs = maiden_overs_df[maiden_overs_df['total_runs'] == 0].shape[0]
-
-    return {
-        'total_matches': total_matches,
-        'total_innings': total_innings,
-        'total_wickets': total_wickets,
-        'run_conceded': run_conceded,
-        'balls_bowled': balls_bowled,
-        'total_overs': total_overs,
-        'bowling_average': average,
-        'economy_rate': economy_rate,
-        'bowling_strike_rate': strike_rate,
-        'best_bowling_figures': best_bowling_figures,
-        'four_wicket_hauls': four_wicket_hauls,
-        'five_wicket_hauls': five_wicket_hauls,
-        'dismissal_type_often': dismissal_type_often,
-        'maiden_overs': maiden_overs
-    }
+    """
+    Career bowling record of a player, read from the batch player profiles.
+    Args:
+        ipl (DataFrame): Ball-by-ball IPL data
+        player (str): Player name
+        seasons (list, optional): List of seasons to filter by
+    Returns:
+        dict: Bowling KPIs of the player
+    """
+    bowling_df = player_profiles(ipl, seasons)['bowling']
+    if player not in bowling_df.index:
+        return {**dict.fromkeys(BOWLER_STATS, 0), 'best_bowling_figures': '-', 'dismissal_type_often': None}
+    profile = bowling_df.loc[player]
+    stats = {stat: profile[column] for stat, column in BOWLER_STATS.items() if column}
+    stats['best_bowling_figures'] = f"{player} ({profile['best_wickets']}/{profile['best_runs']})"
+    return {stat: stats[stat] for stat in BOWLER_STATS}
 
 def get_allrounder_stats(ipl, player, seasons=None):
     batsman_stats = get_batsman_stats(ipl, player, seasons)
@@ -1663,32 +1785,34 @@ def get_allrounder_stats(ipl, player, seasons=None):
         'bowling': bowler_stats
     }
     
-import os
 def get_player_stats(ipl, player, seasons=None):
+    """
+    Stats of a player by role, queued for the background stats export.
+    Args:
+        ipl (DataFrame): Ball-by-ball IPL data
+        player (str): Player name
+        seasons (list, optional): List of seasons to filter by
+    Returns:
+        dict: get_batsman_stats(), get_bowler_stats() or get_allrounder_stats() of the player
+    """
     if player in BATSMANS:
         stats = get_batsman_stats(ipl, player, seasons)
         stats['batsman'] = player
-        df = pd.DataFrame([stats])
-        write_header = not os.path.exists('batter_stats.csv')
-        df.to_csv('batter_stats.csv', mode='a', header=write_header, index=False)
+        export_row('batter_stats', stats)
     elif player in BOWLERS:
         stats = get_bowler_stats(ipl, player, seasons)
         stats['bowler'] = player
-        df = pd.DataFrame([stats])
-        write_header = not os.path.exists('bowler_stats.csv')
-        df.to_csv('bowler_stats.csv', mode='a', header=write_header, index=False)
+        export_row('bowler_stats', stats)
     else:
         stats = get_allrounder_stats(ipl, player, seasons)
         stats['all_rounder'] = player
-        df = pd.DataFrame([stats])
-        write_header = not os.path.exists('allrounder_stats.csv')
-        df.to_csv('allrounder_stats.csv', mode='a', header=write_header, index=False)
+        export_row('allrounder_stats', stats)
     return stats
 
 def get_batter_runs(ipl, player1, player2=None):
-    filtered_ipl_df = ipl[ipl['batter'].isin([player1, player2])] if player2 else ipl[ipl['batter'] == player1]
+    filtered_ipl_df = with_match_columns(player_rows(ipl, [player1, player2], ('batter',)), ['season'])
     player_runs_df = (
-        filtered_ipl_df.groupby(['season', 'batter'])['batsman_runs']
+        filtered_ipl_df.groupby(['season', 'batter'], observed=True)['batsman_runs']
         .sum()
         .reset_index()
     )
@@ -1696,7 +1820,7 @@ def get_batter_runs(ipl, player1, player2=None):
     fig = go.Figure()
     for player in player_runs_df['batter'].unique():
         player_df = player_runs_df[player_runs_df['batter'] == player]
-        played_teams, marker_colors = player_played_team_each_season(filtered_ipl_df, player)
+        played_teams, marker_colors = player_played_team_each_season(ipl, player)
         line_trace = go.Scatter(
             x=player_df['season'],
             y=player_df['batsman_runs'],
@@ -1718,8 +1842,8 @@ def get_batter_runs(ipl, player1, player2=None):
     return update_layout(fig)
 
 def get_batter_strike_rate_average(ipl, player1, player2=None):
-    filtered_ipl_df = ipl[ipl['batter'].isin([player1, player2])] if player2 else ipl[ipl['batter'] == player1]
-    player_average_strike_rate_df = filtered_ipl_df.groupby(['season', 'batter']).agg(
+    filtered_ipl_df = with_match_columns(player_rows(ipl, [player1, player2], ('batter',)), ['season'])
+    player_average_strike_rate_df = filtered_ipl_df.groupby(['season', 'batter'], observed=True).agg(
         total_runs=('batsman_runs', 'sum'),
         total_balls=('ball', 'size'),
         total_dismissals=('is_wicket', 'sum')
@@ -1734,7 +1858,7 @@ def get_batter_strike_rate_average(ipl, player1, player2=None):
     fig2 = go.Figure()
     for player in player_average_strike_rate_df['batter'].unique():
         player_df = player_average_strike_rate_df[player_average_strike_rate_df['batter'] == player]
-        played_teams, marker_colors = player_played_team_each_season(filtered_ipl_df, player)
+        played_teams, marker_colors = player_played_team_each_season(ipl, player)
         strike_rate_line_trace = go.Scatter(
             x=player_df['season'],
             y=player_df['strike_rate'],
@@ -1773,13 +1897,20 @@ def get_batter_strike_rate_average(ipl, player1, player2=None):
     return update_layout(fig), update_layout(fig2)
 
 
+def _player_subset(frame, column, player):
+    # Rows of one player in a grouped frame. An empty groupby result keeps the shared categories but
+    # narrower codes, so comparing it with a name can overflow; it has no rows for anyone anyway
+    if frame.empty or not player:
+        return frame.iloc[0:0]
+    return frame[frame[column] == player]
+
 def get_batter_runs_against_other_teams(ipl, player1, player2, seasons=None):
-    filtered_ipl_df = ipl[ipl['batter'].isin([player1, player2])].copy() if player2 else ipl[ipl['batter'] == player1].copy()
-    player_runs_df = filtered_ipl_df.groupby(['batter','bowling_team'])['batsman_runs'].sum().reset_index()
+    filtered_ipl_df = player_rows(ipl, [player1, player2], ('batter',), columns=['batter', 'bowling_team', 'batsman_runs'])
+    player_runs_df = filtered_ipl_df.groupby(['batter','bowling_team'], observed=True)['batsman_runs'].sum().reset_index()
     
     fig = go.Figure()
     for player in [player1, player2]:
-        player_df = player_runs_df[player_runs_df['batter'] == player]
+        player_df = _player_subset(player_runs_df, 'batter', player)
         if player_df.empty:
             continue
         bar_color = player_last_played_team(ipl, player)
@@ -1794,21 +1925,18 @@ def get_batter_runs_against_other_teams(ipl, player1, player2, seasons=None):
     return update_layout(fig)
 
 def get_batter_runs_at_each_venue(ipl, player1, player2, seasons=None):
-    if player2:
-        filtered_ipl_df = ipl[ipl['batter'].isin([player1, player2])].copy()
-        venue_runs = filtered_ipl_df.groupby('venue')['batsman_runs'].sum().reset_index()
-    else:
-        filtered_ipl_df = ipl[ipl['batter'] == player1].copy()
-        venue_runs = filtered_ipl_df.groupby('venue')['batsman_runs'].sum().reset_index()
+    filtered_ipl_df = with_match_columns(player_rows(ipl, [player1, player2], ('batter',), columns=['batter', 'batsman_runs']), ['venue'])
+    venue_runs = filtered_ipl_df.groupby('venue', observed=True)['batsman_runs'].sum().reset_index()
     
-    top_venues = venue_runs.sort_values(by='batsman_runs', ascending=False)['venue'].head(10).tolist()
-    player_runs_df = filtered_ipl_df[filtered_ipl_df['venue'].isin(top_venues)].groupby(['batter','venue'])['batsman_runs'].sum().reset_index()
+    # Venues tied on runs are taken by name
+    top_venues = venue_runs.sort_values(by=['batsman_runs', 'venue'], ascending=[False, True], kind='stable')['venue'].head(10).tolist()
+    player_runs_df = filtered_ipl_df[filtered_ipl_df['venue'].isin(top_venues)].groupby(['batter','venue'], observed=True)['batsman_runs'].sum().reset_index()
 
     fig = go.Figure()
     for player in [player1, player2]:
         if not player:
             continue
-        player_df = player_runs_df[player_runs_df['batter'] == player]
+        player_df = _player_subset(player_runs_df, 'batter', player)
         if player_df.empty:
             continue
         bar_color = player_last_played_team(ipl, player)
@@ -1827,12 +1955,12 @@ def get_batter_runs_at_each_venue(ipl, player1, player2, seasons=None):
 
 
 def get_bowler_wickets(ipl, player1, player2=None):
-    filtered_ipl_df = ipl[ipl['bowler'].isin([player1, player2])] if player2 else ipl[ipl['bowler'] == player1]
+    filtered_ipl_df = with_match_columns(player_rows(ipl, [player1, player2], ('bowler',)), ['season'])
     valid_dismissals = ['bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket']
     filtered_ipl_df = filtered_ipl_df[filtered_ipl_df['dismissal_kind'].isin(valid_dismissals) | filtered_ipl_df['dismissal_kind'].isnull()]
     
     bowler_wickets_df = (
-        filtered_ipl_df.groupby(['season', 'bowler'])['is_wicket']
+        filtered_ipl_df.groupby(['season', 'bowler'], observed=True)['is_wicket']
         .sum()
         .reset_index(name='total_wickets')
     )
@@ -1840,7 +1968,7 @@ def get_bowler_wickets(ipl, player1, player2=None):
     fig = go.Figure()
     for player in bowler_wickets_df['bowler'].unique():
         player_df = bowler_wickets_df[bowler_wickets_df['bowler'] == player]
-        played_teams, marker_colors = player_played_team_each_season(filtered_ipl_df, player)
+        played_teams, marker_colors = player_played_team_each_season(ipl, player, role='bowler')
         line_trace = go.Scatter(
             x=player_df['season'],
             y=player_df['total_wickets'],
@@ -1848,7 +1976,7 @@ def get_bowler_wickets(ipl, player1, player2=None):
             hovertemplate="Player: %{text}<br>Played Team: %{customdata}<br>Season: %{x}<br>Wickets: %{y}<extra></extra>",
             name=player,
             text=[player]*len(player_df),
-            line=dict(shape='spline', width=3, color=player_last_played_team(ipl, player)),
+            line=dict(shape='spline', width=3, color=player_last_played_team(ipl, player, role='bowler')),
             marker=dict(size=10, color=marker_colors, line=dict(width=2, color='white')),
             customdata=played_teams
         )
@@ -1862,12 +1990,12 @@ def get_bowler_wickets(ipl, player1, player2=None):
     return update_layout(fig)
 
 def get_bowler_strike_rate_average(ipl, player1, player2=None):
-    filtered_ipl_df = ipl[ipl['bowler'].isin([player1, player2])] if player2 else ipl[ipl['bowler'] == player1]
+    filtered_ipl_df = with_match_columns(player_rows(ipl, [player1, player2], ('bowler',)), ['season'])
     
     valid_dismissals = ['bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket']
     filtered_ipl_df = filtered_ipl_df[filtered_ipl_df['dismissal_kind'].isin(valid_dismissals) | filtered_ipl_df['dismissal_kind'].isnull()]
     legal_deliveries_df = filtered_ipl_df[~filtered_ipl_df['extra_runs'].isin(['wides', 'noballs'])]
-    bowler_average_strike_rate_df = legal_deliveries_df.groupby(['season','bowler']).agg(
+    bowler_average_strike_rate_df = legal_deliveries_df.groupby(['season','bowler'], observed=True).agg(
         total_runs_conceded=('total_runs', 'sum'),
         total_wickets_taken=('is_wicket', 'sum'),
         total_balls_bowled=('ball', 'count')
@@ -1880,7 +2008,7 @@ def get_bowler_strike_rate_average(ipl, player1, player2=None):
     fig2 = go.Figure()
     for player in bowler_average_strike_rate_df['bowler'].unique():
         player_df = bowler_average_strike_rate_df[bowler_average_strike_rate_df['bowler'] == player]
-        played_teams, marker_colors = player_played_team_each_season(filtered_ipl_df, player)
+        played_teams, marker_colors = player_played_team_each_season(ipl, player, role='bowler')
         strike_rate_line_trace = go.Scatter(
             x=player_df['season'],
             y=player_df['strike_rate'],
@@ -1888,7 +2016,7 @@ def get_bowler_strike_rate_average(ipl, player1, player2=None):
             hovertemplate="Player: %{text}<br>Played Team: %{customdata}<br>Season: %{x}<br>Strike_rate: %{y}<extra></extra>",
             name=player,
             text=[player]*len(player_df),
-            line=dict(shape='spline', width=3, color=player_last_played_team(ipl, player)),
+            line=dict(shape='spline', width=3, color=player_last_played_team(ipl, player, role='bowler')),
             marker=dict(size=10, color=marker_colors, line=dict(width=2, color='white')),
             customdata=played_teams
         )
@@ -1899,7 +2027,7 @@ def get_bowler_strike_rate_average(ipl, player1, player2=None):
             hovertemplate="Player: %{text}<br>Played Team: %{customdata}<br>Season: %{x}<br>Average: %{y}<extra></extra>",
             name=player,
             text=[player]*len(player_df),
-            line=dict(shape='spline', width=3, color=player_last_played_team(ipl, player)),
+            line=dict(shape='spline', width=3, color=player_last_played_team(ipl, player, role='bowler')),
             marker=dict(size=10, color=marker_colors, line=dict(width=2, color='white')),
             customdata=played_teams
         )
@@ -1919,12 +2047,12 @@ def get_bowler_strike_rate_average(ipl, player1, player2=None):
     return update_layout(fig), update_layout(fig2)
 
 def get_bowler_economy(ipl, player1, player2=None):
-    filtered_ipl_df = ipl[ipl['bowler'].isin([player1, player2])] if player2 else ipl[ipl['bowler'] == player1]
+    filtered_ipl_df = with_match_columns(player_rows(ipl, [player1, player2], ('bowler',)), ['season'])
     
     valid_dismissals = ['bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket']
     filtered_ipl_df = filtered_ipl_df[filtered_ipl_df['dismissal_kind'].isin(valid_dismissals) | filtered_ipl_df['dismissal_kind'].isnull()]
     legal_deliveries_df = filtered_ipl_df[~filtered_ipl_df['extra_runs'].isin(['wides', 'noballs'])]
-    bowler_economy_df = legal_deliveries_df.groupby(['season','bowler']).agg(
+    bowler_economy_df = legal_deliveries_df.groupby(['season','bowler'], observed=True).agg(
         total_runs_conceded=('total_runs', 'sum'),
         total_wickets_taken=('is_wicket', 'sum'),
         total_balls_bowled=('ball', 'count')
@@ -1936,7 +2064,7 @@ def get_bowler_economy(ipl, player1, player2=None):
     fig = go.Figure()
     for player in bowler_economy_df['bowler'].unique():
         player_df = bowler_economy_df[bowler_economy_df['bowler'] == player]
-        played_teams, marker_colors = player_played_team_each_season(filtered_ipl_df, player)
+        played_teams, marker_colors = player_played_team_each_season(ipl, player, role='bowler')
         economy_line_trace = go.Scatter(
             x=player_df['season'],
             y=player_df['economy'],
@@ -1944,7 +2072,7 @@ def get_bowler_economy(ipl, player1, player2=None):
             hovertemplate="Player: %{text}<br>Played Team: %{customdata}<br>Season: %{x}<br>Economy: %{y}<extra></extra>",
             name=player,
             text=[player]*len(player_df),
-            line=dict(shape='spline', width=3, color=player_last_played_team(ipl, player)),
+            line=dict(shape='spline', width=3, color=player_last_played_team(ipl, player, role='bowler')),
             marker=dict(size=10, color=marker_colors, line=dict(width=2, color='white')),
             customdata=played_teams
         )
@@ -1959,17 +2087,17 @@ def get_bowler_economy(ipl, player1, player2=None):
 
 
 def get_bowler_wickets_against_other_teams(ipl, player1, player2, seasons=None):
-    filtered_ipl_df = ipl[ipl['bowler'].isin([player1, player2])].copy() if player2 else ipl[ipl['bowler'] == player1].copy()
     valid_dismissals = ['bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket']
+    filtered_ipl_df = player_rows(ipl, [player1, player2], ('bowler',), columns=['bowler', 'batting_team', 'is_wicket', 'dismissal_kind'])
     filtered_ipl_df = filtered_ipl_df[filtered_ipl_df['dismissal_kind'].isin(valid_dismissals)]
-    bowler_wickets_df = filtered_ipl_df.groupby(['bowler','batting_team'])['is_wicket'].sum().reset_index(name='total_wickets')
+    bowler_wickets_df = filtered_ipl_df.groupby(['bowler','batting_team'], observed=True)['is_wicket'].sum().reset_index(name='total_wickets')
     
     fig = go.Figure()
     for player in [player1, player2]:
-        player_df = bowler_wickets_df[bowler_wickets_df['bowler'] == player]
+        player_df = _player_subset(bowler_wickets_df, 'bowler', player)
         if player_df.empty:
             continue
-        bar_color = player_last_played_team(ipl, player)
+        bar_color = player_last_played_team(ipl, player, role='bowler')
         fig.add_trace(go.Bar(
             x=player_df['batting_team'],
             y=player_df['total_wickets'],
@@ -1983,26 +2111,21 @@ def get_bowler_wickets_against_other_teams(ipl, player1, player2, seasons=None):
 def get_bowler_wickets_at_each_venue(ipl, player1, player2, seasons=None):
     valid_dismissals = ['bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket']
     
-    if player2:
-        filtered_ipl_df = ipl[ipl['bowler'].isin([player1, player2])].copy()
-        filtered_ipl_df = filtered_ipl_df[filtered_ipl_df['dismissal_kind'].isin(valid_dismissals)]
-        venue_wickets = filtered_ipl_df.groupby('venue')['is_wicket'].sum().reset_index(name='total_wickets')
-    else:
-        filtered_ipl_df = ipl[ipl['bowler'] == player1].copy()
-        filtered_ipl_df = filtered_ipl_df[filtered_ipl_df['dismissal_kind'].isin(valid_dismissals)]
-        venue_wickets = filtered_ipl_df.groupby('venue')['is_wicket'].sum().reset_index(name='total_wickets')
+    filtered_ipl_df = player_rows(ipl, [player1, player2], ('bowler',), columns=['bowler', 'is_wicket', 'dismissal_kind'])
+    filtered_ipl_df = with_match_columns(filtered_ipl_df[filtered_ipl_df['dismissal_kind'].isin(valid_dismissals)], ['venue'])
+    venue_wickets = filtered_ipl_df.groupby('venue', observed=True)['is_wicket'].sum().reset_index(name='total_wickets')
     
-    top_venues = venue_wickets.sort_values(by='total_wickets', ascending=False)['venue'].head(10).tolist()
-    bowler_wickets_df = filtered_ipl_df[filtered_ipl_df['venue'].isin(top_venues)].groupby(['bowler','venue'])['is_wicket'].sum().reset_index(name='total_wickets')
+    top_venues = venue_wickets.sort_values(by=['total_wickets', 'venue'], ascending=[False, True], kind='stable')['venue'].head(10).tolist()
+    bowler_wickets_df = filtered_ipl_df[filtered_ipl_df['venue'].isin(top_venues)].groupby(['bowler','venue'], observed=True)['is_wicket'].sum().reset_index(name='total_wickets')
 
     fig = go.Figure()
     for player in [player1, player2]:
         if not player:
             continue
-        player_df = bowler_wickets_df[bowler_wickets_df['bowler'] == player]
+        player_df = _player_subset(bowler_wickets_df, 'bowler', player)
         if player_df.empty:
             continue
-        bar_color = player_last_played_team(ipl, player)
+        bar_color = player_last_played_team(ipl, player, role='bowler')
         short_names = player_df['venue'].apply(lambda v: VENUE_MAP.get(v, v.split(',')[0][:18] + ("..." if len(v.split(',')[0]) > 18 else "")))
         fig.add_trace(go.Bar(
             x=short_names,
@@ -2014,4 +2137,10 @@ def get_bowler_wickets_at_each_venue(ipl, player1, player2, seasons=None):
     fig.update_layout(
         title='Wickets by Player at Each Venue (Top 10)', showlegend=False
     )
-    return update_layout(fig)
\ No newline at end of file
+    return update_layout(fig)
+
+# Timed get_* and player_* helpers for /metrics, with IPL_METRICS=1 (see utils.metrics)
+instrument(
+    sys.modules[__name__], 'data_loader',
+    include=lambda name: name.startswith(('get_', 'player_')), exclude=('get_data', 'get_lighter_shades')
+)
\ No newline at end of file
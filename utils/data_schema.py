@@ -0,0 +1,126 @@
+"""
+Compact dtype schema for the IPL match and delivery data.
+
+read_csv loads every name column (players, teams, venues, dismissal kinds) as Python strings,
+and the merge with matches repeats them on every ball. apply_schema() turns them into
+categoricals that share one global dictionary per kind (all player columns use the same
+player categories, all team columns the same team categories), so groupby/isin work on small
+integer codes and merges keep the compact dtype. Integer counters (over, ball, inning, runs,
+is_wicket, ids, season) are downcast to the smallest integer type that holds them.
+
+Print the memory report with:
+    python -m utils.data_schema
+"""
+import pandas as pd
+
+PLAYER_COLUMNS = ['batter', 'bowler', 'non_striker', 'player_dismissed', 'fielder', 'player_of_match']
+TEAM_COLUMNS = ['batting_team', 'bowling_team', 'team1', 'team2', 'toss_winner', 'winner']
+UMPIRE_COLUMNS = ['umpire1', 'umpire2']
+CATEGORY_COLUMNS = ['venue', 'city', 'extras_type', 'dismissal_kind', 'toss_decision', 'match_type']
+INTEGER_COLUMNS = [
+    'id', 'match_id', 'season', 'inning', 'over', 'ball',
+    'batsman_runs', 'extra_runs', 'total_runs', 'is_wicket'
+]
+
+# Fed into the cache fingerprint so a schema change invalidates cached frames
+SCHEMA = {
+    'players': PLAYER_COLUMNS,
+    'teams': TEAM_COLUMNS,
+    'umpires': UMPIRE_COLUMNS,
+    'categories': CATEGORY_COLUMNS,
+    'integers': INTEGER_COLUMNS
+}
+
+def _shared_dtype(frames, columns):
+    values = pd.concat([frame[col].astype(object) for frame in frames for col in columns if col in frame.columns])
+    # Sorted categories keep sort_values/groupby ordering identical to plain strings
+    return pd.CategoricalDtype(pd.Index(values.dropna().unique()).sort_values())
+
+def build_dtypes(*frames):
+    """
+    Build the categorical dtypes shared across frames.
+    Args:
+        *frames (DataFrame): Frames whose values make up the dictionaries (e.g. matches_df, deliveries_df)
+    Returns:
+        dict: {column: CategoricalDtype}, where columns of the same kind map to the same dtype
+    """
+    dtypes = {}
+    for columns in (PLAYER_COLUMNS, TEAM_COLUMNS, UMPIRE_COLUMNS):
+        shared = _shared_dtype(frames, columns)
+        dtypes.update({col: shared for col in columns})
+    for col in CATEGORY_COLUMNS:
+        dtypes[col] = _shared_dtype(frames, [col])
+    return dtypes
+
+def extend_dtypes(dtypes, *frames):
+    """
+    Add the values of new frames to existing shared categorical dtypes.
+    Categories stay sorted, so a new name can shift the codes of existing ones; columns converted
+    to a returned dtype with astype() are recoded by value.
+    Args:
+        dtypes (dict): {column: CategoricalDtype} in use, e.g. from build_dtypes()
+        *frames (DataFrame): Frames with the new rows
+    Returns:
+        dict: {column: CategoricalDtype}; unchanged dtypes are returned as the same objects
+    """
+    extended = dict(dtypes)
+    groups = [PLAYER_COLUMNS, TEAM_COLUMNS, UMPIRE_COLUMNS] + [[col] for col in CATEGORY_COLUMNS]
+    for columns in groups:
+        columns = [col for col in columns if col in dtypes]
+        if not any(col in frame.columns for frame in frames for col in columns):
+            continue
+        current = dtypes[columns[0]].categories
+        added = _shared_dtype(frames, columns).categories.difference(current)
+        if len(added):
+            shared = pd.CategoricalDtype(current.append(added).sort_values())
+            extended.update({col: shared for col in columns})
+    return extended
+
+def apply_schema(frame, dtypes):
+    """
+    Convert a frame's name columns to the shared categoricals and downcast its integer columns.
+    Args:
+        frame (DataFrame): Match-level or ball-by-ball data
+        dtypes (dict): Categorical dtypes from build_dtypes()
+    Returns:
+        DataFrame: Frame with the compact schema applied
+    """
+    conversions = {col: dtype for col, dtype in dtypes.items() if col in frame.columns}
+    frame = frame.astype(conversions)
+    for col in INTEGER_COLUMNS:
+        if col in frame.columns and pd.api.types.is_integer_dtype(frame[col]):
+            frame[col] = pd.to_numeric(frame[col], downcast='integer')
+    return frame
+
+def memory_usage_mb(frame):
+    """
+    Deep memory usage of a frame, including the Python string objects of object columns.
+    Args:
+        frame (DataFrame): Any frame
+    Returns:
+        float: Memory usage in MB
+    """
+    return frame.memory_usage(deep=True).sum() / 1024 ** 2
+
+def memory_report(before, after):
+    """
+    Compare memory usage of frames before and after applying the schema.
+    Args:
+        before (dict): {name: DataFrame} with the raw dtypes
+        after (dict): {name: DataFrame} with the compact schema
+    Returns:
+        DataFrame: Columns [Frame, Before (MB), After (MB), Reduction (x)]
+    """
+    rows = []
+    for name, frame in before.items():
+        before_mb = memory_usage_mb(frame)
+        after_mb = memory_usage_mb(after[name])
+        rows.append([name, round(before_mb, 2), round(after_mb, 2), round(before_mb / after_mb, 1) if after_mb else None])
+    return pd.DataFrame(rows, columns=['Frame', 'Before (MB)', 'After (MB)', 'Reduction (x)'])
+
+if __name__ == '__main__':
+    from utils.data_loader import load_data
+    raw = load_data(compact=False)
+    compact = load_data(compact=True)
+    names = ['matches_df', 'deliveries_df', 'ipl_df']
+    print(memory_report(dict(zip(names, raw)), dict(zip(names, compact))).to_string(index=False))
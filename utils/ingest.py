@@ -0,0 +1,44 @@
+"""
+HTTP route for adding a finished match to a running dashboard.
+
+POST /ingest/match with two CSV files, `match` (one row in the matches.csv layout) and
+`deliveries` (the match's balls in the deliveries.csv layout), and the token from
+IPL_INGEST_TOKEN in the X-Ingest-Token header. The route is only registered when the token is
+set. Ingestion updates the data store of the worker process that receives the request; the
+CSVs stay the source of truth and are read again on restart.
+
+    curl -H "X-Ingest-Token: $IPL_INGEST_TOKEN" -F match=@match.csv -F deliveries=@deliveries.csv \
+        http://localhost:8050/ingest/match
+"""
+import hmac
+import os
+
+import pandas as pd
+from flask import abort, jsonify, request
+
+from utils.data_loader import ingest_match
+
+INGEST_TOKEN = os.environ.get('IPL_INGEST_TOKEN', '')
+
+def register_routes(server):
+    """
+    Add the /ingest/match route to the Flask server behind the Dash app, if IPL_INGEST_TOKEN is set.
+    Args:
+        server (Flask): Dash app.server
+    """
+    if not INGEST_TOKEN:
+        return
+
+    @server.route('/ingest/match', methods=['POST'])
+    def ingest():
+        if not hmac.compare_digest(request.headers.get('X-Ingest-Token', ''), INGEST_TOKEN):
+            abort(403)
+        if 'match' not in request.files or 'deliveries' not in request.files:
+            abort(400, 'Expected CSV files "match" and "deliveries"')
+        match = pd.read_csv(request.files['match'])
+        deliveries = pd.read_csv(request.files['deliveries'])
+        try:
+            version = ingest_match(match, deliveries)
+        except ValueError as error:
+            abort(400, str(error))
+        return jsonify({'match_id': int(match['id'].iloc[0]), 'balls': len(deliveries), 'data_version': version})
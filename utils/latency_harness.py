@@ -0,0 +1,252 @@
+"""
+End-to-end latency of the tab callbacks under concurrent users.
+
+The harness posts Dash callback requests to the app's Flask server in-process (the same
+/_dash-update-component route the browser calls, so routing, the callback caches and JSON
+serialization are included). It covers render_content and the content callbacks of the Batting,
+Bowling, Team Comparison and Player Insights tabs, over this mix of inputs:
+
+    render_content                 every tab
+    batting/bowling update_page    all seasons, each season, and a few multi-season selections
+    update_comparison_content      all 45 team pairs, for all seasons and for the latest season
+    update_player_content          every player of BATSMANS/BOWLERS/ALL_ROUNDERS alone and
+                                   compared with the next player of the same list
+
+--users threads each take the next request from the shuffled mix until it is empty; --rounds
+repeats the mix, so later rounds show the callback caches warm (set IPL_CALLBACK_CACHE_SIZE=0 to
+measure uncached work). The report gives p50/p95/p99 latency and the response payload size per
+callback. Save it with --save-baseline and pass it as --baseline to a later run. A callback
+regresses when its p95 grows by more than --tolerance or its mean payload by more than
+--bytes-tolerance; the run then exits with status 1, so it can gate an upgrade. --callbacks limits
+the run to some of the callbacks:
+
+    python -m utils.latency_harness --users 8 --save-baseline latency_baseline.json
+    python -m utils.latency_harness --users 8 --baseline latency_baseline.json
+"""
+import argparse
+import json
+import queue
+import random
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+# Callback label -> one of its outputs, to find it among the app's callbacks
+CALLBACKS = {
+    'render_content': 'tab-content.children',
+    'batting_stats.update_page': 'total_runs.children',
+    'bowling_stats.update_page': 'total_wickets.children',
+    'teams_comparison.update_comparison_content': 'comparison-content.children',
+    'player_insights.update_player_content': 'batter-key-metrics-row-container.children'
+}
+TABS = ['overview', 'batting', 'bowling', 'team', 'player']
+
+def callback_specs(client):
+    """
+    Dependencies of the harnessed callbacks, as the app serves them to the browser.
+    Args:
+        client (FlaskClient): Test client of the app's server
+    Returns:
+        dict: {label: dependency entry}; callbacks not served (e.g. handled client-side) are left out
+    """
+    specs = {}
+    for entry in client.get('/_dash-dependencies').get_json():
+        outputs = entry['output'].strip('.').split('...')
+        for label, output in CALLBACKS.items():
+            if output in outputs and not entry.get('clientside_function'):
+                specs[label] = entry
+    return specs
+
+def request_body(spec, values):
+    """
+    Body of a /_dash-update-component request.
+    Args:
+        spec (dict): Dependency entry from callback_specs()
+        values (list): Input values, in the callback's input order
+    Returns:
+        dict: Request JSON
+    """
+    def prop(text):
+        component, name = text.rsplit('.', 1)
+        return {'id': component, 'property': name}
+
+    multi = spec['output'].startswith('..')
+    outputs = [prop(output) for output in spec['output'].strip('.').split('...')]
+    inputs = [dict(id=dep['id'], property=dep['property'], value=value) for dep, value in zip(spec['inputs'], values)]
+    return {
+        'output': spec['output'],
+        'outputs': outputs if multi else outputs[0],
+        'inputs': inputs,
+        'state': [],
+        'changedPropIds': [f"{dep['id']}.{dep['property']}" for dep in spec['inputs']]
+    }
+
+def season_sets(seasons):
+    """
+    Season selections of the mix: all seasons, each season, and a few multi-season ranges.
+    Args:
+        seasons (list): Seasons of the dataset, in order
+    Returns:
+        list: Season lists ([] is no filter)
+    """
+    seasons = [int(season) for season in seasons]
+    return [[]] + [[season] for season in seasons] + [seasons[-3:], seasons[:3], seasons[::2]]
+
+def build_workload(seasons, teams, player_lists):
+    """
+    The request mix as (callback label, input values) pairs.
+    Args:
+        seasons (list): Seasons of the dataset
+        teams (list): Teams offered by the Team Comparison tab
+        player_lists (list): Player lists offered by Player Insights (BATSMANS, BOWLERS, ALL_ROUNDERS)
+    Returns:
+        list: (label, values) pairs
+    """
+    workload = [('render_content', [tab]) for tab in TABS]
+    for selection in season_sets(seasons):
+        workload.append(('batting_stats.update_page', [selection]))
+        workload.append(('bowling_stats.update_page', [selection]))
+    latest = [int(max(seasons))]
+    for pos, team1 in enumerate(teams):
+        for team2 in teams[pos + 1:]:
+            workload.append(('teams_comparison.update_comparison_content', [team1, team2, []]))
+            workload.append(('teams_comparison.update_comparison_content', [team1, team2, latest]))
+    for players in player_lists:
+        for pos, player in enumerate(players):
+            workload.append(('player_insights.update_player_content', [player, None]))
+            if pos + 1 < len(players):
+                workload.append(('player_insights.update_player_content', [player, players[pos + 1]]))
+    return workload
+
+def run_workload(server, workload, users=4, rounds=1, seed=0):
+    """
+    Send the mix through concurrent simulated users.
+    Args:
+        server (Flask): Dash app.server
+        workload (list): (label, values) pairs from build_workload()
+        users (int, optional): Concurrent users, each a thread with its own client
+        rounds (int, optional): Times the mix is sent
+        seed (int, optional): Seed of the request order
+    Returns:
+        DataFrame: One row per request with columns [callback, round, seconds, bytes, status]
+    """
+    specs = callback_specs(server.test_client())
+    requests = [(round_, label, values) for round_ in range(rounds) for label, values in workload if label in specs]
+    random.Random(seed).shuffle(requests)
+    # Rounds run in order; the shuffle only mixes requests within a round
+    requests.sort(key=lambda request: request[0])
+    pending = queue.Queue()
+    for request in requests:
+        pending.put(request)
+    rows, rows_lock = [], threading.Lock()
+
+    def user():
+        client = server.test_client()
+        while True:
+            try:
+                round_, label, values = pending.get_nowait()
+            except queue.Empty:
+                return
+            start = time.perf_counter()
+            response = client.post('/_dash-update-component', json=request_body(specs[label], values))
+            seconds = time.perf_counter() - start
+            with rows_lock:
+                rows.append({'callback': label, 'round': round_, 'seconds': seconds, 'bytes': len(response.data), 'status': response.status_code})
+
+    threads = [threading.Thread(target=user, name=f'latency-user-{i}') for i in range(users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return pd.DataFrame(rows, columns=['callback', 'round', 'seconds', 'bytes', 'status'])
+
+def summarize(results):
+    """
+    Latency percentiles and payload sizes per callback.
+    Args:
+        results (DataFrame): Result of run_workload()
+    Returns:
+        DataFrame: Columns [callback, requests, errors, p50_ms, p95_ms, p99_ms, mean_bytes, max_bytes]
+    """
+    rows = []
+    for label, group in results.groupby('callback', sort=False):
+        ms = group['seconds'].to_numpy() * 1000
+        p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+        rows.append({
+            'callback': label,
+            'requests': len(group),
+            # 204 is a callback that prevented the update
+            'errors': int((~group['status'].isin([200, 204])).sum()),
+            'p50_ms': round(p50, 1),
+            'p95_ms': round(p95, 1),
+            'p99_ms': round(p99, 1),
+            'mean_bytes': int(group['bytes'].mean()),
+            'max_bytes': int(group['bytes'].max())
+        })
+    return pd.DataFrame(rows)
+
+def compare(summary, baseline, tolerance=0.2, bytes_tolerance=0.01):
+    """
+    Flag callbacks that got slower or heavier than a baseline summary.
+    Args:
+        summary (DataFrame): Result of summarize()
+        baseline (DataFrame): A saved summarize() result
+        tolerance (float, optional): Allowed relative growth of p95 latency
+        bytes_tolerance (float, optional): Allowed relative growth of the mean payload
+    Returns:
+        DataFrame: summary with the baseline p95/mean bytes, their changes and a regression flag
+    """
+    merged = summary.merge(
+        baseline[['callback', 'p95_ms', 'mean_bytes']].rename(columns={'p95_ms': 'baseline_p95_ms', 'mean_bytes': 'baseline_bytes'}),
+        on='callback', how='left'
+    )
+    merged['p95_change'] = (merged['p95_ms'] / merged['baseline_p95_ms'] - 1).round(3)
+    merged['bytes_change'] = (merged['mean_bytes'] / merged['baseline_bytes'] - 1).round(3)
+    merged['regression'] = (merged['p95_change'] > tolerance) | (merged['bytes_change'] > bytes_tolerance) | (merged['errors'] > 0)
+    return merged
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='End-to-end latency of the tab callbacks')
+    parser.add_argument('--users', type=int, default=4, help='Concurrent simulated users')
+    parser.add_argument('--rounds', type=int, default=1, help='Times the request mix is sent')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the request order')
+    parser.add_argument('--callbacks', nargs='+', choices=list(CALLBACKS), help='Only send requests of these callbacks')
+    parser.add_argument('--baseline', help='Summary JSON of an earlier run to compare against')
+    parser.add_argument('--save-baseline', help='Write this run\'s summary as JSON')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed relative growth of p95 latency')
+    parser.add_argument('--bytes-tolerance', type=float, default=0.01, help='Allowed relative growth of the mean payload')
+    args = parser.parse_args()
+
+    import app
+    from tabs import teams_comparison
+    from utils import stats_export
+    from utils.data_loader import get_data, BATSMANS, BOWLERS, ALL_ROUNDERS
+    # Player Insights requests queue rows for the stats export; keep them out of the real one
+    stats_export.EXPORT_DIR = tempfile.mkdtemp(prefix='ipl-latency-')
+
+    matches_df = get_data()[0]
+    workload = build_workload(sorted(matches_df['season'].unique()), teams_comparison.teams, [BATSMANS, BOWLERS, ALL_ROUNDERS])
+    if args.callbacks:
+        workload = [(label, values) for label, values in workload if label in args.callbacks]
+    start = time.perf_counter()
+    results = run_workload(app.server, workload, args.users, args.rounds, args.seed)
+    elapsed = time.perf_counter() - start
+    summary = summarize(results)
+    print(f'{len(results)} requests from {args.users} users in {elapsed:.1f}s ({len(results) / elapsed:.1f} requests/s)')
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(summary.to_dict('records'), f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            report = compare(summary, pd.DataFrame(json.load(f)), args.tolerance, args.bytes_tolerance)
+        print(report.to_string(index=False))
+        if report['regression'].any():
+            print('Regressions:', ', '.join(report.loc[report['regression'], 'callback']))
+            sys.exit(1)
+    else:
+        print(summary.to_string(index=False))
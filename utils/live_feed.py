@@ -0,0 +1,342 @@
+"""
+Live mode: follow the match in progress from a ball-by-ball feed.
+
+Set IPL_LIVE_FEED to an append-only CSV file in the deliveries.csv layout (header first, one
+ball per line). One background thread per process tails the file and folds each new ball into
+running aggregates of the live match (score per innings, batter and bowler figures), so an update
+costs as much as the balls that arrived, not a pass over the whole dataset. A ball with a new
+match_id starts a new live match. Rows that cannot be parsed are logged and skipped.
+
+A finished live match is not added to the historical data: the feed has no matches.csv row
+(venue, toss, result) to go with its balls. Add it with ingest_match() or the /ingest route.
+
+The Overview, Batting and Bowling tabs add a live panel (live_panel()) that polls every
+IPL_LIVE_INTERVAL_MS milliseconds (default 1000). The browser keeps a cursor of the balls it has
+drawn, and each poll sends only the newer balls, as a Plotly extendData update of the open
+chart; the chart is only re-rendered when a new match starts.
+
+Replay a finished match from data/deliveries.csv into a feed file to try it:
+    python -m utils.live_feed <match_id> live.csv --delay 0.5
+"""
+import argparse
+import csv
+import io
+import logging
+import os
+import threading
+import time
+
+import plotly.graph_objects as go
+from dash import Input, Output, State, callback, dcc, html, no_update
+from dash.exceptions import PreventUpdate
+
+from utils.data_loader import DELIVERIES_CSV, TEAM_MAP, update_layout
+
+LIVE_FEED = os.environ.get('IPL_LIVE_FEED', '')
+LIVE_INTERVAL_MS = int(os.environ.get('IPL_LIVE_INTERVAL_MS', '1000'))
+# Seconds between reads of the feed file
+POLL_INTERVAL = 0.2
+# Innings drawn as chart traces; super overs only count towards the score cards
+CHART_INNINGS = (1, 2)
+VALID_DISMISSALS = ('bowled', 'caught', 'lbw', 'stumped', 'caught and bowled', 'hit wicket')
+
+_live = None
+_live_lock = threading.Lock()
+_tail = None
+_tail_lock = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+def _new_match(match_id):
+    return {'match_id': match_id, 'balls': [], 'innings': {}, 'batters': {}, 'bowlers': {}}
+
+def add_balls(balls):
+    """
+    Fold new balls into the running aggregates of the live match.
+    Args:
+        balls (list): Dicts with the deliveries.csv columns, values as strings as read from the feed
+    """
+    global _live
+    with _live_lock:
+        for ball in balls:
+            try:
+                match_id = int(ball['match_id'])
+                inning = int(ball['inning'])
+                runs = int(ball['total_runs'])
+                batsman_runs = int(ball['batsman_runs'])
+                is_wicket = int(ball['is_wicket'])
+                batting_team, batter_name, bowler_name = ball['batting_team'], ball['batter'], ball['bowler']
+            except (KeyError, TypeError, ValueError):
+                # A malformed or half-written row; the rest of the feed still counts
+                logger.warning('Skipped a malformed live feed row: %r', ball)
+                continue
+            if _live is None or _live['match_id'] != match_id:
+                _live = _new_match(match_id)
+            extras_type = ball.get('extras_type') or ''
+            dismissal_kind = ball.get('dismissal_kind') or ''
+
+            innings = _live['innings'].setdefault(inning, {
+                'team': TEAM_MAP.get(batting_team, batting_team),
+                'runs': 0, 'wickets': 0, 'legal_balls': 0, 'deliveries': 0
+            })
+            innings['runs'] += runs
+            innings['wickets'] += is_wicket
+            innings['legal_balls'] += extras_type not in ('wides', 'noballs')
+            innings['deliveries'] += 1
+
+            batter = _live['batters'].setdefault(batter_name, {'runs': 0, 'balls': 0})
+            batter['runs'] += batsman_runs
+            batter['balls'] += extras_type != 'wides'
+            bowler = _live['bowlers'].setdefault(bowler_name, {'runs': 0, 'legal_balls': 0, 'wickets': 0})
+            bowler['runs'] += runs
+            bowler['legal_balls'] += extras_type not in ('wides', 'noballs')
+            bowler['wickets'] += dismissal_kind in VALID_DISMISSALS
+
+            _live['balls'].append({
+                'inning': inning,
+                'delivery': innings['deliveries'],
+                'overs': round(innings['legal_balls'] / 6, 3),
+                'runs': runs,
+                'total': innings['runs'],
+                'is_wicket': is_wicket,
+                'player_dismissed': ball.get('player_dismissed') or ''
+            })
+
+def live_since(cursor):
+    """
+    Balls of the live match that a client has not drawn yet, with the current score.
+    Args:
+        cursor (dict): {'match_id', 'balls'} of what the client has, e.g. from a previous call
+    Returns:
+        dict or None: None if nothing changed, else {
+            'cursor': cursor after these balls,
+            'reset': True if the client's balls belong to another match (draw `balls` from scratch),
+            'balls': new balls,
+            'innings': {inning: {team, runs, wickets, legal_balls, deliveries}},
+            'top_batter': (name, runs, balls) or None,
+            'top_bowler': (name, wickets, runs, legal_balls) or None
+        }
+    """
+    cursor = cursor or {'match_id': None, 'balls': 0}
+    with _live_lock:
+        if _live is None:
+            return None
+        seen = cursor['balls'] if cursor['match_id'] == _live['match_id'] else None
+        if seen == len(_live['balls']):
+            return None
+        reset = seen is None or seen > len(_live['balls'])
+        top_batter = max(_live['batters'].items(), key=lambda item: item[1]['runs'], default=None)
+        top_bowler = max(_live['bowlers'].items(), key=lambda item: (item[1]['wickets'], -item[1]['runs']), default=None)
+        return {
+            'cursor': {'match_id': _live['match_id'], 'balls': len(_live['balls'])},
+            'reset': reset,
+            'balls': _live['balls'][0 if reset else seen:],
+            'innings': {inning: dict(innings) for inning, innings in _live['innings'].items()},
+            'top_batter': top_batter and (top_batter[0], top_batter[1]['runs'], top_batter[1]['balls']),
+            'top_bowler': top_bowler and (top_bowler[0], top_bowler[1]['wickets'], top_bowler[1]['runs'], top_bowler[1]['legal_balls'])
+        }
+
+def _overs(legal_balls):
+    return f'{legal_balls // 6}.{legal_balls % 6}'
+
+def _points(kind, balls, inning):
+    # x, y (and hover text) of one innings' trace for the balls given
+    balls = [ball for ball in balls if ball['inning'] == inning]
+    if kind == 'worm':
+        return {'x': [ball['overs'] for ball in balls], 'y': [ball['total'] for ball in balls]}
+    if kind == 'runs':
+        return {'x': [ball['delivery'] for ball in balls], 'y': [ball['runs'] for ball in balls]}
+    wickets = [ball for ball in balls if ball['is_wicket']]
+    return {'x': [ball['overs'] for ball in wickets], 'y': [ball['total'] for ball in wickets], 'text': [ball['player_dismissed'] for ball in wickets]}
+
+def live_figure(kind, balls=()):
+    """
+    Chart of the live match, one trace per innings.
+    Args:
+        kind (str): 'worm' (cumulative runs by over), 'runs' (runs off each delivery) or 'wickets' (fall of wickets)
+        balls (list, optional): Balls from live_since() to draw
+    Returns:
+        go.Figure: Chart whose traces live_extension() extends
+    """
+    colors = ['deepskyblue', 'hotpink']
+    traces = []
+    for inning, color in zip(CHART_INNINGS, colors):
+        points = _points(kind, balls, inning)
+        name = f'Innings {inning}'
+        if kind == 'worm':
+            traces.append(go.Scatter(**points, name=name, mode='lines', line=dict(width=3, color=color),
+                                     hovertemplate='Overs: %{x:.1f}<br>Runs: %{y}<extra></extra>'))
+        elif kind == 'runs':
+            traces.append(go.Bar(**points, name=name, marker_color=color,
+                                 hovertemplate='Delivery: %{x}<br>Runs: %{y}<extra></extra>'))
+        else:
+            traces.append(go.Scatter(**points, name=name, mode='markers', marker=dict(size=12, color=color),
+                                     hovertemplate='%{text}<br>Overs: %{x:.1f}<br>Score: %{y}<extra></extra>'))
+    titles = {'worm': 'Live Match: Runs by Over', 'runs': 'Live Match: Runs per Delivery', 'wickets': 'Live Match: Fall of Wickets'}
+    fig = go.Figure(traces)
+    fig.update_layout(title=titles[kind], barmode='group')
+    return update_layout(fig)
+
+def live_extension(kind, balls):
+    """
+    extendData payload that appends new balls to a live_figure() chart.
+    Args:
+        kind (str): Chart kind, as for live_figure()
+        balls (list): New balls from live_since()
+    Returns:
+        list or None: [updates, trace indices] for dcc.Graph.extendData, None if no trace gets points
+    """
+    updates, indices = {}, []
+    for index, inning in enumerate(CHART_INNINGS):
+        points = _points(kind, balls, inning)
+        if not points['x']:
+            continue
+        indices.append(index)
+        for key, values in points.items():
+            updates.setdefault(key, []).append(values)
+    return [updates, indices] if indices else None
+
+def live_cards(kind, snapshot):
+    """
+    Score cards of the live panel.
+    Args:
+        kind (str): Chart kind of the panel; 'runs' adds the top scorer, 'wickets' the best bowler
+        snapshot (dict or None): Result of live_since()
+    Returns:
+        list: KPI card components
+    """
+    def card(value, label):
+        return html.Div([html.Div(value, className='kpi-value'), html.Div(label, className='kpi-label')], className='kpi-card')
+
+    if snapshot is None:
+        return [card('-', 'Live Match')]
+    cards = [
+        card(f"{innings['team']} {innings['runs']}/{innings['wickets']} ({_overs(innings['legal_balls'])})", f'Innings {inning}')
+        for inning, innings in sorted(snapshot['innings'].items())
+    ]
+    if kind == 'runs' and snapshot['top_batter']:
+        name, runs, balls = snapshot['top_batter']
+        cards.append(card(f'{name} {runs} ({balls})', 'Top Scorer'))
+    if kind == 'wickets' and snapshot['top_bowler']:
+        name, wickets, runs, legal_balls = snapshot['top_bowler']
+        cards.append(card(f'{name} {wickets}/{runs} ({_overs(legal_balls)})', 'Best Bowler'))
+    return cards
+
+def live_panel(prefix, kind):
+    """
+    Live match panel of a tab: score cards, a chart and the poll timer. Register its callback once
+    with register_live_panel().
+    Args:
+        prefix (str): Component id prefix, unique per tab
+        kind (str): Chart kind, as for live_figure()
+    Returns:
+        html.Div: Panel layout
+    """
+    snapshot = live_since(None)
+    return html.Div([
+        html.Div(live_cards(kind, snapshot), id=f'{prefix}-live-cards', className='kpi-row'),
+        html.Div([
+            dcc.Graph(figure=live_figure(kind, snapshot['balls'] if snapshot else ()), id=f'{prefix}-live-graph', className='chart-style')
+        ], className='full-chart'),
+        # What the chart holds; a cached layout is caught up by the first poll
+        dcc.Store(id=f'{prefix}-live-cursor', data=snapshot['cursor'] if snapshot else None),
+        dcc.Interval(id=f'{prefix}-live-interval', interval=LIVE_INTERVAL_MS)
+    ])
+
+def register_live_panel(prefix, kind):
+    """
+    Register the polling callback of a live_panel().
+    Args:
+        prefix (str): Component id prefix given to live_panel()
+        kind (str): Chart kind given to live_panel()
+    """
+    @callback(
+        Output(f'{prefix}-live-graph', 'extendData'),
+        Output(f'{prefix}-live-graph', 'figure'),
+        Output(f'{prefix}-live-cards', 'children'),
+        Output(f'{prefix}-live-cursor', 'data'),
+        Input(f'{prefix}-live-interval', 'n_intervals'),
+        State(f'{prefix}-live-cursor', 'data')
+    )
+    def update_live_panel(_, cursor):
+        snapshot = live_since(cursor)
+        if snapshot is None:
+            raise PreventUpdate
+        cards = live_cards(kind, snapshot)
+        if snapshot['reset']:
+            return no_update, live_figure(kind, snapshot['balls']), cards, snapshot['cursor']
+        return live_extension(kind, snapshot['balls']) or no_update, no_update, cards, snapshot['cursor']
+
+def start_feed(path=None):
+    """
+    Start tailing the feed file in a background thread, once per process.
+    Args:
+        path (str, optional): Feed file (defaults to LIVE_FEED)
+    """
+    global _tail
+    path = path or LIVE_FEED
+    if _tail is None and path:
+        with _tail_lock:
+            if _tail is None:
+                _tail = threading.Thread(target=_tail_feed, args=(path,), name='live-feed', daemon=True)
+                _tail.start()
+
+def _tail_feed(path):
+    position, pending, header = 0, b'', None
+    while True:
+        try:
+            if os.path.getsize(path) < position:
+                # The feed was truncated or replaced; read it from the start
+                position, pending, header = 0, b'', None
+            # Read bytes and decode whole lines only, so a character split across two reads or
+            # an invalid byte cannot stop the thread
+            with open(path, 'rb') as feed:
+                feed.seek(position)
+                chunk = feed.read()
+                position = feed.tell()
+        except OSError:
+            chunk = b''
+        if chunk:
+            # Keep a partly written last line for the next read
+            lines = (pending + chunk).split(b'\n')
+            pending = lines.pop()
+            lines = [line.decode('utf-8', errors='replace') for line in lines]
+            try:
+                if header is None and lines:
+                    header = next(csv.reader([lines.pop(0)]))
+                rows = [dict(zip(header, values)) for values in csv.reader(lines) if values]
+                if rows:
+                    add_balls(rows)
+            except Exception:
+                logger.exception('Skipped %d live feed lines', len(lines))
+        time.sleep(POLL_INTERVAL)
+
+def replay(match_id, path, delay):
+    """
+    Write the balls of a finished match to a feed file, one line at a time.
+    Args:
+        match_id (int): Match to replay, from data/deliveries.csv
+        path (str): Feed file to create
+        delay (float): Seconds between balls
+    """
+    with open(DELIVERIES_CSV, newline='') as source, open(path, 'w', newline='') as feed:
+        reader = csv.reader(source)
+        header = next(reader)
+        column = header.index('match_id')
+        feed.write(','.join(header) + '\n')
+        feed.flush()
+        for row in reader:
+            if row[column] == str(match_id):
+                line = io.StringIO()
+                csv.writer(line, lineterminator='\n').writerow(row)
+                feed.write(line.getvalue())
+                feed.flush()
+                time.sleep(delay)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Replay a match from data/deliveries.csv into a live feed file')
+    parser.add_argument('match_id', type=int)
+    parser.add_argument('path')
+    parser.add_argument('--delay', type=float, default=0.5, help='Seconds between balls')
+    args = parser.parse_args()
+    replay(args.match_id, args.path, args.delay)
@@ -0,0 +1,58 @@
+"""
+Peak memory allocated by each season-filtered callback.
+
+Every callback is run once to warm the data store and the aggregate cube, then run again under
+tracemalloc; the reported peak is the most memory the call held above what was allocated before
+it started. The callback caches are bypassed, so each run does the full work. Print the report with:
+
+    python -m utils.memory_profile
+"""
+import tracemalloc
+
+import pandas as pd
+
+SELECTIONS = [None, [2019, 2020]]
+
+def profile_calls(calls):
+    """
+    Measure the peak allocation of each call.
+    Args:
+        calls (dict): {label: zero-argument callable}
+    Returns:
+        DataFrame: Peak MB allocated per call, with columns [call, peak_mb]
+    """
+    rows = []
+    for label, call in calls.items():
+        call()
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            call()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        rows.append({'call': label, 'peak_mb': round((peak - baseline) / 1024 ** 2, 2)})
+    return pd.DataFrame(rows)
+
+def callback_calls():
+    """
+    The tab callbacks and player stat helpers to profile, with the caches bypassed.
+    Returns:
+        dict: {label: zero-argument callable}
+    """
+    from tabs import batting_stats, bowling_stats, teams_comparison
+    from utils.data_loader import get_data, get_batsman_stats, get_bowler_stats, BATSMANS, BOWLERS
+    _, _, ipl_df = get_data()
+    calls = {}
+    for seasons in SELECTIONS:
+        calls[f'batting_stats.update_page({seasons})'] = lambda seasons=seasons: batting_stats.update_page.__wrapped__(seasons)
+        calls[f'bowling_stats.update_page({seasons})'] = lambda seasons=seasons: bowling_stats.update_page.__wrapped__(seasons)
+        calls[f'teams_comparison.update_comparison_content({seasons})'] = lambda seasons=seasons: teams_comparison.update_comparison_content.__wrapped__(
+            'Mumbai Indians', 'Chennai Super Kings', seasons
+        )
+        calls[f'get_batsman_stats({seasons})'] = lambda seasons=seasons: get_batsman_stats(ipl_df, BATSMANS[0], seasons)
+        calls[f'get_bowler_stats({seasons})'] = lambda seasons=seasons: get_bowler_stats(ipl_df, BOWLERS[0], seasons)
+    return calls
+
+if __name__ == '__main__':
+    print(profile_calls(callback_calls()).to_string(index=False))
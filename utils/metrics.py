@@ -0,0 +1,392 @@
+"""
+Opt-in timing instrumentation of the data layer and the Dash callbacks, served at /metrics.
+
+With IPL_METRICS=1 every public aggregate of utils/aggregates.py, every get_* and player_*
+helper of utils/data_loader.py and every Dash callback is wrapped when its module is imported.
+Each call records its wall time, the rows of the frame it was given (rows scanned; helpers that
+read the season cube touch far fewer), the rows it returned (rows, or points of a figure's traces)
+and, with IPL_METRICS_MEMORY=1 as well, the bytes it allocated at peak under tracemalloc.
+Tracing slows every allocation and its peaks are shared by all threads, so the byte counts are
+approximate while requests overlap.
+
+A callback's wall time is also split into stages, so a slow callback shows where its time went:
+
+    aggregation    outermost calls into utils/aggregates.py (cube and profile builds, summaries)
+    figures        data_loader helpers, less the aggregation they triggered
+    serialization  Dash encoding the callback's response as JSON
+    callback       the rest: the callback's own code and waiting on producers
+
+Work a callback hands to utils/producers.py is counted towards the callback that started it;
+producers run in parallel, so on a machine with several CPUs the stages of such a callback can add
+up to more than its wall time. Hit and miss counts of the aggregate memos and of the season-cached
+callbacks, the latest producer timings and the data version are read at scrape time.
+
+    IPL_METRICS=1 python app.py
+    curl http://localhost:8050/metrics
+"""
+import contextvars
+import functools
+import inspect
+import os
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from dash.exceptions import PreventUpdate
+
+METRICS = os.environ.get('IPL_METRICS', '0') == '1'
+TRACE_MEMORY = METRICS and os.environ.get('IPL_METRICS_MEMORY', '0') == '1'
+# Histogram bucket bounds, in seconds
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STAGES = ('aggregation', 'figures', 'serialization', 'callback')
+
+# Metric name -> (type, help text); samples are exposed in this order
+FAMILIES = {
+    'ipl_call_seconds': ('histogram', 'Wall time of an instrumented data-layer call'),
+    'ipl_call_errors_total': ('counter', 'Data-layer calls that raised'),
+    'ipl_call_rows_scanned_total': ('counter', 'Rows of the frame passed to a data-layer call'),
+    'ipl_call_rows_output_total': ('counter', 'Rows or figure points returned by a data-layer call'),
+    'ipl_call_allocated_bytes_total': ('counter', 'Peak bytes allocated during a data-layer call (IPL_METRICS_MEMORY=1)'),
+    'ipl_callback_seconds': ('histogram', 'Wall time of a Dash callback, serialization included'),
+    'ipl_callback_stage_seconds': ('histogram', 'Time of a Dash callback spent in each stage'),
+    'ipl_callback_prevented_total': ('counter', 'Dash callbacks that prevented the update'),
+    'ipl_callback_errors_total': ('counter', 'Dash callbacks that raised'),
+    'ipl_callback_response_bytes_total': ('counter', 'Bytes of the JSON responses of a Dash callback'),
+    'ipl_callback_allocated_bytes_total': ('counter', 'Peak bytes allocated during a Dash callback (IPL_METRICS_MEMORY=1)'),
+    'ipl_http_request_seconds': ('histogram', 'Wall time of an HTTP request by route'),
+    'ipl_cache_requests_total': ('counter', 'Lookups of the aggregate memos and callback caches'),
+    'ipl_producer_last_seconds': ('gauge', 'Wall time of each producer in the latest run of its graph'),
+    'ipl_data_version': ('gauge', 'Version of the loaded dataset, bumped by every ingested match')
+}
+
+_counters = {}
+_histograms = {}
+_lock = threading.Lock()
+# Stage times of the callback running in this context; producers copy the context into their thread
+_request_stages = contextvars.ContextVar('ipl_request_stages', default=None)
+_thread = threading.local()
+
+if TRACE_MEMORY:
+    tracemalloc.start()
+
+def _labels(labels):
+    return tuple(sorted(labels.items()))
+
+def increment(name, value=1, **labels):
+    """
+    Add to a counter.
+    Args:
+        name (str): Metric name, a key of FAMILIES
+        value (float, optional): Amount to add
+        **labels: Label values of the series
+    """
+    key = (name, _labels(labels))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+def observe(name, value, **labels):
+    """
+    Record one observation in a histogram.
+    Args:
+        name (str): Metric name, a key of FAMILIES
+        value (float): Observed seconds
+        **labels: Label values of the series
+    """
+    key = (name, _labels(labels))
+    position = int(np.searchsorted(BUCKETS, value))
+    with _lock:
+        series = _histograms.get(key)
+        if series is None:
+            series = _histograms[key] = {'buckets': [0] * len(BUCKETS), 'sum': 0.0, 'count': 0}
+        if position < len(BUCKETS):
+            series['buckets'][position] += 1
+        series['sum'] += value
+        series['count'] += 1
+
+def count_cache(cache, hit):
+    """
+    Record a lookup of a memo or cache.
+    Args:
+        cache (str): Cache name
+        hit (bool): Whether the value was already there
+    """
+    if METRICS:
+        increment('ipl_cache_requests_total', cache=cache, result='hit' if hit else 'miss')
+
+def _state():
+    if not hasattr(_thread, 'depth'):
+        _thread.depth = {'aggregation': 0, 'data_loader': 0}
+        _thread.aggregated = 0.0
+        _thread.peaks = []
+    return _thread
+
+def _add_stage(stage, seconds):
+    stages = _request_stages.get()
+    if stages is not None:
+        with _lock:
+            stages[stage] += seconds
+
+def _allocation_start(state):
+    # A nested call resets the traced peak, so keep the enclosing call's peak so far on the stack
+    current, peak = tracemalloc.get_traced_memory()
+    if state.peaks:
+        state.peaks[-1][1] = max(state.peaks[-1][1], peak)
+    tracemalloc.reset_peak()
+    state.peaks.append([current, current])
+
+def _allocation_end(state):
+    peak = tracemalloc.get_traced_memory()[1]
+    start, inner_peak = state.peaks.pop()
+    peak = max(peak, inner_peak)
+    if state.peaks:
+        state.peaks[-1][1] = max(state.peaks[-1][1], peak)
+    return peak - start
+
+def _frame_rows(args, kwargs):
+    for value in (*args, *kwargs.values()):
+        if isinstance(value, pd.DataFrame):
+            return len(value)
+    return 0
+
+def _trace_points(trace):
+    for attr in ('x', 'values', 'y', 'labels'):
+        points = trace.get(attr) if isinstance(trace, dict) else getattr(trace, attr, None)
+        if points is not None:
+            return len(points)
+    return 1
+
+def output_rows(value):
+    """
+    Size of a data-layer result.
+    Args:
+        value: Result of an instrumented call
+    Returns:
+        int: Rows of a frame, series or array, points of a figure's traces, length of a list or
+            mapping, the sum over the items of a tuple, 0 for None and 1 for anything else
+    """
+    if value is None:
+        return 0
+    if isinstance(value, (pd.DataFrame, pd.Series, np.ndarray)):
+        return len(value)
+    if isinstance(value, go.Figure):
+        return sum(_trace_points(trace) for trace in value.data)
+    if isinstance(value, dict) and isinstance(value.get('data'), (list, tuple)):
+        return sum(_trace_points(trace) for trace in value['data'])
+    if isinstance(value, tuple):
+        return sum(output_rows(item) for item in value)
+    if isinstance(value, (list, dict)):
+        return len(value)
+    return 1
+
+def _instrumented(func, layer):
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        state = _state()
+        outermost = state.depth['aggregation'] == 0 and (layer == 'aggregation' or state.depth['data_loader'] == 0)
+        aggregated = state.aggregated
+        state.depth[layer] += 1
+        if TRACE_MEMORY:
+            _allocation_start(state)
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            increment('ipl_call_errors_total', layer=layer, function=name)
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            allocated = _allocation_end(state) if TRACE_MEMORY else None
+            state.depth[layer] -= 1
+            observe('ipl_call_seconds', seconds, layer=layer, function=name)
+            if outermost and layer == 'aggregation':
+                state.aggregated += seconds
+                _add_stage('aggregation', seconds)
+            elif outermost:
+                _add_stage('figures', max(seconds - (state.aggregated - aggregated), 0))
+            if allocated is not None:
+                increment('ipl_call_allocated_bytes_total', allocated, layer=layer, function=name)
+        increment('ipl_call_rows_scanned_total', _frame_rows(args, kwargs), layer=layer, function=name)
+        increment('ipl_call_rows_output_total', output_rows(result), layer=layer, function=name)
+        return result
+    return wrapper
+
+def instrument(module, layer, include, exclude=()):
+    """
+    Replace the public functions of a module with instrumented wrappers, if IPL_METRICS is set.
+    Call it at the end of the module, so later imports of the functions get the wrappers.
+    Args:
+        module (module): Module whose functions are wrapped
+        layer (str): Layer label of their metrics ('aggregation' or 'data_loader')
+        include (callable): Takes a function name and returns whether to wrap it
+        exclude (tuple, optional): Function names never wrapped
+    Returns:
+        list: Names of the wrapped functions
+    """
+    if not METRICS:
+        return []
+    wrapped = []
+    for name, func in list(vars(module).items()):
+        if not inspect.isfunction(func) or func.__module__ != module.__name__ or name.startswith('_'):
+            continue
+        if include(name) and name not in exclude:
+            setattr(module, name, _instrumented(func, layer))
+            wrapped.append(name)
+    return wrapped
+
+def _timed_to_json(to_json):
+    @functools.wraps(to_json)
+    def wrapper(value):
+        start = time.perf_counter()
+        try:
+            return to_json(value)
+        finally:
+            _add_stage('serialization', time.perf_counter() - start)
+    return wrapper
+
+def _instrumented_callback(dispatch, name):
+    @functools.wraps(dispatch)
+    def wrapper(*args, **kwargs):
+        stages = dict.fromkeys(STAGES, 0.0)
+        token = _request_stages.set(stages)
+        state = _state()
+        if TRACE_MEMORY:
+            _allocation_start(state)
+        start = time.perf_counter()
+        try:
+            response = dispatch(*args, **kwargs)
+        except PreventUpdate:
+            increment('ipl_callback_prevented_total', callback=name)
+            raise
+        except Exception:
+            increment('ipl_callback_errors_total', callback=name)
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            allocated = _allocation_end(state) if TRACE_MEMORY else None
+            _request_stages.reset(token)
+            stages['callback'] = max(seconds - stages['aggregation'] - stages['figures'] - stages['serialization'], 0)
+            observe('ipl_callback_seconds', seconds, callback=name)
+            for stage, stage_seconds in stages.items():
+                observe('ipl_callback_stage_seconds', stage_seconds, callback=name, stage=stage)
+            if allocated is not None:
+                increment('ipl_callback_allocated_bytes_total', allocated, callback=name)
+        if isinstance(response, (str, bytes)):
+            increment('ipl_callback_response_bytes_total', len(response), callback=name)
+        return response
+    return wrapper
+
+def instrument_callbacks(app):
+    """
+    Wrap every server-side callback registered so far, if IPL_METRICS is set.
+    Call it once every tab module is imported, before the first request.
+    Args:
+        app (Dash): Dash app
+    Returns:
+        list: Labels of the wrapped callbacks (module.function)
+    """
+    if not METRICS:
+        return []
+    from dash import _callback
+
+    # Dash encodes the callback response inside the dispatch wrapped below; time it as its own stage
+    if not getattr(_callback.to_json, '_ipl_timed', False):
+        _callback.to_json = _timed_to_json(_callback.to_json)
+        _callback.to_json._ipl_timed = True
+    labels = []
+    for callback_map in (_callback.GLOBAL_CALLBACK_MAP, app.callback_map):
+        for entry in callback_map.values():
+            dispatch = entry.get('callback')
+            if dispatch is None or getattr(dispatch, '_ipl_timed', False):
+                continue
+            func = inspect.unwrap(dispatch)
+            label = f'{func.__module__}.{func.__qualname__}'
+            entry['callback'] = _instrumented_callback(dispatch, label)
+            entry['callback']._ipl_timed = True
+            labels.append(label)
+    return labels
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _series(name, labels, value):
+    text = ','.join(f'{key}="{_escape(val)}"' for key, val in labels)
+    value = int(value) if float(value).is_integer() else repr(float(value))
+    return f'{name}{{{text}}} {value}' if text else f'{name} {value}'
+
+def _scraped():
+    # Counters and gauges kept by other modules, read fresh on every scrape
+    from utils.callback_cache import cache_stats
+    from utils.data_loader import data_version
+    from utils.producers import producer_timings
+
+    counters = {}
+    for cache, stats in cache_stats().items():
+        counters[('ipl_cache_requests_total', _labels({'cache': cache, 'result': 'hit'}))] = stats['hits']
+        counters[('ipl_cache_requests_total', _labels({'cache': cache, 'result': 'miss'}))] = stats['misses']
+    for graph, timings in producer_timings().items():
+        for producer, seconds in timings.items():
+            counters[('ipl_producer_last_seconds', _labels({'graph': graph, 'producer': producer}))] = seconds
+    counters[('ipl_data_version', ())] = data_version()
+    return counters
+
+def render():
+    """
+    Every metric in the Prometheus text exposition format.
+    Returns:
+        str: Exposition text
+    """
+    with _lock:
+        counters = dict(_counters)
+        histograms = {key: {'buckets': list(series['buckets']), 'sum': series['sum'], 'count': series['count']} for key, series in _histograms.items()}
+    counters.update(_scraped())
+
+    lines = []
+    for family, (kind, help_text) in FAMILIES.items():
+        samples = []
+        if kind == 'histogram':
+            for (name, labels), series in sorted(histograms.items()):
+                if name != family:
+                    continue
+                cumulative = 0
+                for bound, count in zip(BUCKETS, series['buckets']):
+                    cumulative += count
+                    samples.append(_series(f'{name}_bucket', labels + (('le', f'{bound:g}'),), cumulative))
+                samples.append(_series(f'{name}_bucket', labels + (('le', '+Inf'),), series['count']))
+                samples.append(_series(f'{name}_sum', labels, series['sum']))
+                samples.append(_series(f'{name}_count', labels, series['count']))
+        else:
+            samples = [_series(name, labels, value) for (name, labels), value in sorted(counters.items()) if name == family]
+        if samples:
+            lines += [f'# HELP {family} {help_text}', f'# TYPE {family} {kind}', *samples]
+    return '\n'.join(lines) + '\n'
+
+def register_routes(server):
+    """
+    Add the /metrics route and per-route request timing to the Flask server, if IPL_METRICS is set.
+    Args:
+        server (Flask): Dash app.server
+    """
+    if not METRICS:
+        return
+    from flask import Response, g, request
+
+    @server.before_request
+    def start_timer():
+        g.ipl_request_start = time.perf_counter()
+
+    @server.after_request
+    def stop_timer(response):
+        start = g.pop('ipl_request_start', None)
+        if start is not None:
+            route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+            observe('ipl_http_request_seconds', time.perf_counter() - start, route=route)
+        return response
+
+    @server.route('/metrics')
+    def metrics():
+        return Response(render(), content_type='text/plain; version=0.0.4; charset=utf-8')
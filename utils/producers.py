@@ -0,0 +1,95 @@
+"""
+Concurrent execution of the independent figure producers behind a callback.
+
+A tab callback such as Team Comparison builds a dozen tables and figures that do not depend on
+each other. run_producers() schedules them as a small dependency graph on a bounded, process-wide
+thread pool: a producer starts as soon as the producers it depends on have finished, and the
+callback waits for all of them at most `deadline` seconds. Threads rather than processes are
+used because producers read the shared in-memory data store and return Plotly figures, neither
+of which is worth pickling across processes; pandas and NumPy release the GIL inside their
+kernels, so the scans overlap.
+
+The wall time of every producer in the latest run of each graph is kept for
+producer_timings(). Pool size and deadline default to IPL_PRODUCER_WORKERS (the number of CPUs,
+at most 8) and IPL_PRODUCER_DEADLINE (30 seconds; 0 waits without limit).
+"""
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+DEFAULT_WORKERS = int(os.environ.get('IPL_PRODUCER_WORKERS', min(os.cpu_count() or 1, 8)))
+DEFAULT_DEADLINE = float(os.environ.get('IPL_PRODUCER_DEADLINE', '30'))
+
+_pool = None
+_pool_lock = threading.Lock()
+_timings = {}
+
+def _executor():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=max(DEFAULT_WORKERS, 1), thread_name_prefix='producer')
+    return _pool
+
+def _timed(func, args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def run_producers(name, producers, deadline=None):
+    """
+    Run a graph of producers concurrently and collect their results.
+    Args:
+        name (str): Graph name, the key of its timings in producer_timings()
+        producers (dict): {producer name: callable} for independent producers, or
+            {producer name: (callable, [dependency names])}; a producer with dependencies is
+            called with their results as positional arguments, in the listed order
+        deadline (float, optional): Seconds to wait for the whole graph (default DEFAULT_DEADLINE,
+            0 waits without limit)
+    Returns:
+        dict: {producer name: result}
+    Raises:
+        TimeoutError: Producers still unfinished when the deadline passed (they are left to finish
+            in the background and their results are discarded)
+    """
+    deadline = DEFAULT_DEADLINE if deadline is None else deadline
+    graph = {key: value if isinstance(value, tuple) else (value, []) for key, value in producers.items()}
+    unknown = {dep for _, deps in graph.values() for dep in deps} - graph.keys()
+    if unknown:
+        raise ValueError(f'Unknown producer dependencies: {sorted(unknown)}')
+
+    stop_at = time.monotonic() + deadline if deadline > 0 else None
+    results, timings, running = {}, {}, {}
+    waiting = dict(graph)
+    while waiting or running:
+        for key, (func, deps) in list(waiting.items()):
+            if all(dep in results for dep in deps):
+                # In the callback's context, so per-request state (utils.metrics stages) follows the producer
+                context = contextvars.copy_context()
+                running[_executor().submit(context.run, _timed, func, [results[dep] for dep in deps])] = key
+                del waiting[key]
+        if not running:
+            raise ValueError(f'Circular producer dependencies: {sorted(waiting)}')
+        timeout = None if stop_at is None else max(stop_at - time.monotonic(), 0)
+        done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+        if not done:
+            for future in running:
+                future.cancel()
+            _timings[name] = timings
+            raise TimeoutError(f'{name}: producers {sorted(running.values())} missed the {deadline}s deadline')
+        for future in done:
+            key = running.pop(future)
+            results[key], timings[key] = future.result()
+    _timings[name] = timings
+    return results
+
+def producer_timings():
+    """
+    Wall time of each producer in the latest run of every graph.
+    Returns:
+        dict: {graph name: {producer name: seconds}}
+    """
+    return {name: dict(timings) for name, timings in _timings.items()}
@@ -0,0 +1,546 @@
+"""
+Embedded DuckDB backend for the aggregates that scan every ball.
+
+The season cube and the per-season player profiles (utils.aggregates) are the only steps that
+read the whole ball-by-ball table; every season-filtered helper then works on their small tables.
+With IPL_QUERY_BACKEND=duckdb, load_data() writes the normalized matches and deliveries to a
+DuckDB file in data/cache/ (keyed, like the data cache, by a hash of the CSVs and the mapping
+tables) and both aggregates are built there with SQL instead of pandas. DuckDB reads only the
+columns a query needs, runs it on all cores, and spills to disk when IPL_DUCKDB_MEMORY_LIMIT
+(e.g. 2GB) is reached; IPL_DUCKDB_THREADS caps its threads. Query results are given the dtypes and
+row order of the pandas builds, so the tables are interchangeable. Other helpers, and the
+per-ball tables of Player Insights, still read the in-memory fact table.
+
+A match added with ingest_match() is not written to the database: the extended table's aggregates
+are carried over by refresh_season() as with pandas, and the database is rebuilt once the CSVs
+change. Without the duckdb package the pandas builds are used.
+
+Build the database ahead of a deploy, and check that both backends give identical results
+(every cube table, the profiles and every get_* helper, with and without a season filter) with:
+
+    python -m utils.sql_backend
+    python -m utils.sql_backend --parity
+"""
+import argparse
+import glob
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utils.aggregates import CUBE_KEYS, PHASES, VALID_DISMISSALS, attach_backend
+from utils.data_cache import CACHE_DIR
+from utils.star_schema import MATCH_INDEX, match_dimension
+
+DUCKDB_MEMORY_LIMIT = os.environ.get('IPL_DUCKDB_MEMORY_LIMIT', '')
+DUCKDB_THREADS = int(os.environ.get('IPL_DUCKDB_THREADS', '0'))
+
+# Every ball with the match attributes the aggregates read, stored as a view in the database
+BALLS_VIEW = """
+CREATE VIEW balls AS
+SELECT d.*, m.season, m.winner, m.target_overs, m.toss_winner, m.toss_decision, m.player_of_match
+FROM deliveries d JOIN matches m ON d.match_id = m.id
+"""
+
+_VALID = ', '.join(f"'{kind}'" for kind in VALID_DISMISSALS)
+
+# Per-ball flags shared by the cube queries; phase is the position in PHASES
+_BALL_MEASURES = f"""
+SELECT *,
+    CASE WHEN "over" < 6 THEN 0 WHEN "over" < 15 THEN 1 ELSE 2 END AS phase,
+    coalesce(extras_type NOT IN ('wides', 'noballs'), true) AS legal,
+    coalesce(dismissal_kind IN ({_VALID}), false) AS valid,
+    dismissal_kind IS NULL OR dismissal_kind IN ({_VALID}) AS credited
+FROM balls
+"""
+
+CUBE_QUERIES = {
+    'batting': f"""
+        SELECT season, batting_team, batter, phase,
+            count(*) AS balls,
+            count_if(legal) AS legal_balls,
+            sum(total_runs)::BIGINT AS runs,
+            sum(batsman_runs)::BIGINT AS batsman_runs,
+            sum(CASE WHEN legal THEN batsman_runs ELSE 0 END)::BIGINT AS legal_batsman_runs,
+            sum(is_wicket)::BIGINT AS wickets,
+            count_if(batsman_runs = 4) AS fours,
+            count_if(batsman_runs = 6) AS sixes,
+            count_if(total_runs = 4) AS four_run_balls,
+            count_if(total_runs = 6) AS six_run_balls,
+            count_if(total_runs <> 0) AS scoring_balls
+        FROM ({_BALL_MEASURES})
+        WHERE batting_team IS NOT NULL AND batter IS NOT NULL
+        GROUP BY season, batting_team, batter, phase
+        ORDER BY season, batting_team, batter, phase
+    """,
+    'bowling': f"""
+        SELECT season, bowling_team, bowler, phase,
+            count(*) AS balls,
+            count_if(legal) AS legal_balls,
+            sum(total_runs)::BIGINT AS runs,
+            sum(is_wicket)::BIGINT AS wickets,
+            count_if(valid) AS dismissals,
+            count_if(credited) AS credited_balls,
+            sum(CASE WHEN credited THEN total_runs ELSE 0 END)::BIGINT AS credited_runs,
+            sum(CASE WHEN credited THEN is_wicket ELSE 0 END)::BIGINT AS credited_wickets
+        FROM ({_BALL_MEASURES})
+        WHERE bowling_team IS NOT NULL AND bowler IS NOT NULL
+        GROUP BY season, bowling_team, bowler, phase
+        ORDER BY season, bowling_team, bowler, phase
+    """,
+    'overs': """
+        SELECT season, "over", sum(total_runs)::BIGINT AS runs
+        FROM balls
+        GROUP BY season, "over"
+        ORDER BY season, "over"
+    """,
+    'team_matches': """
+        SELECT season, batting_team, count(DISTINCT match_id) AS matches
+        FROM balls
+        WHERE batting_team IS NOT NULL
+        GROUP BY season, batting_team
+        ORDER BY season, batting_team
+    """,
+    'dismissals': f"""
+        SELECT season, bowling_team, dismissal_kind, count(*) AS dismissals
+        FROM balls
+        WHERE dismissal_kind IN ({_VALID}) AND bowling_team IS NOT NULL
+        GROUP BY season, bowling_team, dismissal_kind
+        ORDER BY season, bowling_team, dismissal_kind
+    """,
+    'teams': """
+        WITH sides AS (
+            SELECT season, match_id, batting_team AS team, true AS batted, total_runs, is_wicket FROM balls
+            UNION ALL
+            SELECT season, match_id, bowling_team, false, total_runs, is_wicket FROM balls
+        ),
+        totals AS (
+            SELECT season, team,
+                coalesce(sum(total_runs) FILTER (WHERE batted), 0)::BIGINT AS batting_runs,
+                count(*) FILTER (WHERE batted) AS batting_balls,
+                coalesce(sum(is_wicket) FILTER (WHERE batted), 0)::BIGINT AS wickets_lost,
+                coalesce(sum(total_runs) FILTER (WHERE NOT batted), 0)::BIGINT AS bowling_runs,
+                count(*) FILTER (WHERE NOT batted) AS bowling_balls,
+                coalesce(sum(is_wicket) FILTER (WHERE NOT batted), 0)::BIGINT AS wickets_taken,
+                count(DISTINCT match_id) FILTER (WHERE batted) AS batting_matches
+            FROM sides
+            WHERE team IS NOT NULL
+            GROUP BY season, team
+        ),
+        results AS (
+            SELECT p.season, p.team,
+                count(*) AS matches,
+                count_if(m.winner = p.team) AS wins,
+                count_if(m.toss_winner = p.team) AS toss_wins,
+                count_if(m.toss_winner = p.team AND m.toss_decision = 'bat' AND m.winner = p.team) AS bat_first_wins,
+                count_if(m.toss_winner = p.team AND coalesce(m.toss_decision <> 'bat', true) AND m.winner = p.team) AS field_first_wins
+            FROM (SELECT DISTINCT season, match_id, team FROM sides WHERE team IS NOT NULL) p
+            JOIN matches m ON p.match_id = m.id
+            GROUP BY p.season, p.team
+        )
+        SELECT season, team, batting_runs, batting_balls, wickets_lost, bowling_runs, bowling_balls, wickets_taken,
+            matches, batting_matches, wins, toss_wins, bat_first_wins, field_first_wins
+        FROM results JOIN totals USING (season, team)
+        ORDER BY season, team
+    """,
+    'innings': """
+        SELECT match_id, batting_team, first(season) AS season, sum(total_runs)::BIGINT AS runs
+        FROM balls
+        WHERE winner IS NOT NULL AND target_overs = 20 AND inning IN (1, 2) AND batting_team IS NOT NULL
+        GROUP BY match_id, batting_team
+        ORDER BY match_id, batting_team
+    """,
+    'bowling_figures': f"""
+        SELECT match_id, bowler, first(season) AS season, sum(total_runs)::BIGINT AS runs,
+            sum(is_wicket) FILTER (WHERE dismissal_kind IN ({_VALID}))::BIGINT AS wickets
+        FROM balls
+        WHERE bowler IS NOT NULL
+        GROUP BY match_id, bowler
+        ORDER BY match_id, bowler
+    """,
+    'over_runs': """
+        SELECT match_id, inning, bowler, "over", first(season) AS season, sum(total_runs)::BIGINT AS runs_conceded
+        FROM balls
+        WHERE bowler IS NOT NULL
+        GROUP BY match_id, inning, bowler, "over"
+        ORDER BY match_id, inning, bowler, "over"
+    """
+}
+
+# Cube columns that pandas sums with a named aggregation, mapped to the column they sum
+SUMMED_COLUMNS = {
+    ('innings', 'runs'): 'total_runs',
+    ('bowling_figures', 'runs'): 'total_runs',
+    ('bowling_figures', 'wickets'): 'is_wicket',
+    ('over_runs', 'runs_conceded'): 'total_runs'
+}
+
+_APPEARANCES = """
+SELECT season, player, count(*) AS matches
+FROM (
+    SELECT DISTINCT season, player, match_id FROM (
+        SELECT season, batter AS player, match_id FROM balls
+        UNION ALL SELECT season, bowler, match_id FROM balls
+        UNION ALL SELECT season, fielder, match_id FROM balls
+    )
+    WHERE player IS NOT NULL
+)
+GROUP BY season, player
+"""
+
+_BOWLER_BALLS = f"""
+SELECT season, bowler AS player, match_id, inning, "over", total_runs, is_wicket, dismissal_kind,
+    dismissal_kind IS NULL OR dismissal_kind IN ({_VALID}) AS credited
+FROM balls
+WHERE bowler IS NOT NULL
+"""
+
+PROFILE_QUERIES = {
+    'batting': f"""
+        WITH per_match AS (
+            SELECT season, batter AS player, match_id,
+                count(DISTINCT inning) AS innings,
+                sum(batsman_runs)::BIGINT AS runs,
+                count(*) AS balls,
+                count(player_dismissed) AS dismissals,
+                count_if(batsman_runs = 4) AS fours,
+                count_if(batsman_runs = 6) AS sixes,
+                bool_or(coalesce(player_of_match = batter, false)) AS player_of_the_match
+            FROM balls
+            WHERE batter IS NOT NULL
+            GROUP BY season, batter, match_id
+        )
+        SELECT p.season, p.player, any_value(a.matches) AS matches,
+            sum(innings)::BIGINT AS innings,
+            sum(runs)::BIGINT AS runs,
+            sum(balls)::BIGINT AS balls,
+            sum(dismissals)::BIGINT AS dismissals,
+            sum(fours)::BIGINT AS fours,
+            sum(sixes)::BIGINT AS sixes,
+            count_if(runs BETWEEN 50 AND 99) AS fifties,
+            count_if(runs >= 100) AS hundreds,
+            max(runs) AS best_score,
+            count_if(player_of_the_match) AS player_of_the_match
+        FROM per_match p JOIN ({_APPEARANCES}) a USING (season, player)
+        GROUP BY p.season, p.player
+        ORDER BY p.season, p.player
+    """,
+    'batting_dismissals': """
+        SELECT season, batter AS player, dismissal_kind, count(*) AS count
+        FROM balls
+        WHERE batter IS NOT NULL AND dismissal_kind IS NOT NULL
+        GROUP BY season, batter, dismissal_kind
+        ORDER BY season, player, dismissal_kind
+    """,
+    'bowling': f"""
+        WITH per_over AS (
+            SELECT season, player, match_id, inning, "over",
+                count_if(credited) AS credited,
+                sum(CASE WHEN credited THEN is_wicket ELSE 0 END) AS wickets,
+                sum(CASE WHEN credited THEN total_runs ELSE 0 END) AS runs
+            FROM ({_BOWLER_BALLS})
+            GROUP BY season, player, match_id, inning, "over"
+        ),
+        per_match AS (
+            SELECT season, player, match_id,
+                count(DISTINCT inning) AS innings,
+                sum(credited) AS credited,
+                sum(wickets) AS wickets,
+                sum(runs) AS runs
+            FROM per_over
+            GROUP BY season, player, match_id
+        ),
+        -- A maiden is an over whose credited balls conceded nothing, per (match, over)
+        maidens AS (
+            SELECT season, player, count_if(runs = 0) AS maiden_overs
+            FROM (
+                SELECT season, player, match_id, "over", sum(runs) AS runs
+                FROM per_over WHERE credited > 0
+                GROUP BY season, player, match_id, "over"
+            )
+            GROUP BY season, player
+        ),
+        figures AS (
+            SELECT season, bowler AS player, match_id, sum(total_runs) AS runs,
+                coalesce(sum(is_wicket) FILTER (WHERE dismissal_kind IN ({_VALID})), 0) AS wickets
+            FROM balls
+            WHERE bowler IS NOT NULL
+            GROUP BY season, bowler, match_id
+        ),
+        -- Most wickets, then fewest runs, then the earliest match
+        best AS (
+            SELECT season, player,
+                first(wickets ORDER BY wickets DESC, runs, match_id) AS best_wickets,
+                first(runs ORDER BY wickets DESC, runs, match_id) AS best_runs
+            FROM figures
+            GROUP BY season, player
+        )
+        SELECT season, player,
+            count(*) AS matches,
+            sum(innings)::BIGINT AS innings,
+            sum(wickets)::BIGINT AS wickets,
+            sum(runs)::BIGINT AS runs,
+            sum(credited)::BIGINT AS balls,
+            count_if(wickets = 4) AS four_wicket_hauls,
+            count_if(wickets = 5) AS five_wicket_hauls,
+            coalesce(any_value(maidens.maiden_overs), 0) AS maiden_overs,
+            any_value(best.best_wickets)::BIGINT AS best_wickets,
+            any_value(best.best_runs)::BIGINT AS best_runs
+        FROM per_match
+        LEFT JOIN maidens USING (season, player)
+        LEFT JOIN best USING (season, player)
+        GROUP BY season, player
+        ORDER BY season, player
+    """,
+    'bowling_dismissals': f"""
+        SELECT season, player, dismissal_kind, count(*) AS count
+        FROM ({_BOWLER_BALLS})
+        WHERE credited AND dismissal_kind IS NOT NULL
+        GROUP BY season, player, dismissal_kind
+        ORDER BY season, player, dismissal_kind
+    """
+}
+
+_connections = {}
+_connections_lock = threading.Lock()
+
+def database_path(key):
+    """
+    Path of the database for a given fingerprint.
+    Args:
+        key (str): Source fingerprint (see utils.data_cache.source_fingerprint)
+    Returns:
+        str: File path
+    """
+    return os.path.join(CACHE_DIR, f'ipl-{key}.duckdb')
+
+def write_database(path, matches_df, deliveries_df):
+    """
+    Write the normalized frames to a DuckDB file and drop databases of older fingerprints.
+    The file is written to a temporary path first and moved into place, so concurrent readers
+    never open a partially written database.
+    Args:
+        path (str): Database file from database_path()
+        matches_df (DataFrame): Matches dimension
+        deliveries_df (DataFrame): Ball-by-ball data
+    """
+    import duckdb
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with duckdb.connect(tmp_path) as connection:
+        for name, frame in (('matches', matches_df), ('deliveries', deliveries_df.drop(columns=MATCH_INDEX, errors='ignore'))):
+            # Categoricals are stored as plain strings, which DuckDB dictionary-compresses on disk
+            columns = ', '.join(
+                f'CAST("{column}" AS VARCHAR) AS "{column}"' if isinstance(frame[column].dtype, pd.CategoricalDtype) else f'"{column}"'
+                for column in frame.columns
+            )
+            connection.register('frame', frame)
+            connection.execute(f'CREATE TABLE {name} AS SELECT {columns} FROM frame')
+            connection.unregister('frame')
+        connection.execute(BALLS_VIEW)
+    os.replace(tmp_path, path)
+    for old in glob.glob(os.path.join(CACHE_DIR, 'ipl-*.duckdb')):
+        if old != path:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+def _connection(path):
+    connection = _connections.get(path)
+    if connection is None:
+        import duckdb
+
+        with _connections_lock:
+            connection = _connections.get(path)
+            if connection is None:
+                config = {}
+                if DUCKDB_MEMORY_LIMIT:
+                    config['memory_limit'] = DUCKDB_MEMORY_LIMIT
+                if DUCKDB_THREADS > 0:
+                    config['threads'] = DUCKDB_THREADS
+                connection = _connections[path] = duckdb.connect(path, read_only=True, config=config)
+    return connection
+
+def query(path, sql):
+    """
+    Run a query on a database and fetch the result.
+    Args:
+        path (str): Database file
+        sql (str): Query over the matches and deliveries tables or the balls view
+    Returns:
+        DataFrame: Result, with strings as objects
+    """
+    # One cursor per call: a DuckDB connection must not be shared by concurrent threads
+    with _connection(path).cursor() as cursor:
+        return cursor.execute(sql).df()
+
+def _summed(values, dtype):
+    # A named-aggregation sum in pandas keeps the summed column's integer dtype when every total fits
+    # in it; totals of groups without rows are missing (NaN) and make the column float
+    if values.isna().any():
+        return values.astype('float64')
+    if np.issubdtype(dtype, np.integer) and values.between(np.iinfo(dtype).min, np.iinfo(dtype).max).all():
+        return values.astype(dtype)
+    return values.astype('int64')
+
+def build_cube(ipl, path):
+    """
+    Build the per-season cube of a fact table with SQL.
+    Args:
+        ipl (DataFrame): Deliveries fact table the database was written from (for column dtypes)
+        path (str): Database file
+    Returns:
+        dict: {table name: DataFrame}, with the columns, dtypes and row order of aggregates.build_cube()
+    """
+    matches = match_dimension(ipl)
+    cube = {}
+    for table, sql in CUBE_QUERIES.items():
+        rows = query(path, sql)
+        # Keys keep the dtype of the column they come from; measures are int64 unless pandas sums them as-is
+        keys = ['season'] + CUBE_KEYS[table]
+        for column in rows.columns:
+            source = 'batting_team' if column == 'team' else column
+            if column == 'phase':
+                rows[column] = pd.Categorical.from_codes(rows[column].to_numpy('int8'), categories=PHASES)
+            elif column in keys:
+                rows[column] = rows[column].astype((matches if source == 'season' else ipl)[source].dtype)
+            elif (table, column) in SUMMED_COLUMNS:
+                rows[column] = _summed(rows[column], ipl[SUMMED_COLUMNS[table, column]].dtype)
+            else:
+                rows[column] = rows[column].astype('int64')
+        if table == 'bowling_figures':
+            rows['wickets'] = rows['wickets'].fillna(0)
+        cube[table] = rows
+    return cube
+
+def build_player_profiles(ipl, path):
+    """
+    Build every player's per-season batting and bowling record with SQL.
+    Args:
+        ipl (DataFrame): Deliveries fact table the database was written from (for column dtypes)
+        path (str): Database file
+    Returns:
+        dict: Tables laid out as aggregates.build_player_profiles() returns them
+    """
+    season_dtype = match_dimension(ipl)['season'].dtype
+    profiles = {}
+    for table, sql in PROFILE_QUERIES.items():
+        rows = query(path, sql)
+        rows['season'] = rows['season'].astype(season_dtype)
+        keys = ['season', 'player', 'dismissal_kind'] if table.endswith('dismissals') else ['season', 'player']
+        rows = rows.set_index(keys).astype('int64')
+        profiles[table] = rows['count'].rename(None) if table.endswith('dismissals') else rows
+    return profiles
+
+def attach_database(ipl, matches_df, deliveries_df, key):
+    """
+    Serve the cube and player profiles of a fact table from its DuckDB database, writing it first if missing.
+    Args:
+        ipl (DataFrame): Fact table from link_matches()
+        matches_df (DataFrame): Matches dimension
+        deliveries_df (DataFrame): Ball-by-ball data
+        key (str): Source fingerprint of the frames
+    Returns:
+        str: Database file, or None when duckdb is not installed (the pandas builds are used)
+    """
+    try:
+        import duckdb  # noqa: F401
+    except ImportError:
+        return None
+    path = database_path(key)
+    if not os.path.exists(path):
+        write_database(path, matches_df, deliveries_df)
+    attach_backend(ipl, {
+        'cube': lambda ipl: build_cube(ipl, path),
+        'profiles': lambda ipl: build_player_profiles(ipl, path)
+    })
+    return path
+
+def _differences(label, expected, actual):
+    try:
+        if isinstance(expected, pd.DataFrame):
+            pd.testing.assert_frame_equal(expected, actual)
+        elif isinstance(expected, pd.Series):
+            pd.testing.assert_series_equal(expected, actual)
+        elif hasattr(expected, 'to_json'):
+            assert expected.to_json() == actual.to_json(), 'figures differ'
+        elif isinstance(expected, (tuple, list)):
+            assert len(expected) == len(actual), 'lengths differ'
+            return [difference for pos, (e, a) in enumerate(zip(expected, actual)) for difference in _differences(f'{label}[{pos}]', e, a)]
+        elif isinstance(expected, dict):
+            assert expected.keys() == actual.keys(), 'keys differ'
+            return [difference for key in expected for difference in _differences(f'{label}[{key!r}]', expected[key], actual[key])]
+        else:
+            assert expected == actual or (expected != expected and actual != actual), f'{expected!r} != {actual!r}'
+    except AssertionError as error:
+        return [f'{label}: {str(error).splitlines()[0] if str(error) else "differs"}']
+    return []
+
+def parity(matches_csv=None, deliveries_csv=None):
+    """
+    Compare the pandas and DuckDB backends on one dataset.
+    Both load the same CSVs; the cube tables, the player profiles (raw and for season selections)
+    and the result of every get_* helper of utils.data_loader, with and without season filters,
+    must be identical.
+    Args:
+        matches_csv (str, optional): Matches file (default data/matches.csv)
+        deliveries_csv (str, optional): Deliveries file (default data/deliveries.csv)
+    Returns:
+        tuple: (number of comparisons, list of differences)
+    """
+    from utils import aggregates, data_loader
+    from utils.benchmark import function_calls
+
+    frames = {
+        backend: data_loader.load_data(matches_csv=matches_csv, deliveries_csv=deliveries_csv, query_backend=backend)
+        for backend in ('pandas', 'duckdb')
+    }
+    (matches_df, deliveries_df, pandas_ipl), (_, _, duckdb_ipl) = frames['pandas'], frames['duckdb']
+    seasons = sorted(int(season) for season in matches_df['season'].unique())
+    selections = [None, seasons[-1:], seasons[:3], seasons[::2]]
+
+    comparisons = [('cube', lambda ipl: aggregates.season_cube(ipl))]
+    comparisons += [(f'player_profiles({selection})', lambda ipl, s=selection: aggregates.player_profiles(ipl, s)) for selection in selections]
+    for selection in selections:
+        pandas_calls = function_calls(matches_df, deliveries_df, pandas_ipl, seasons=selection)
+        duckdb_calls = function_calls(frames['duckdb'][0], frames['duckdb'][1], duckdb_ipl, seasons=selection)
+        comparisons += [(f'{name}({selection})', (pandas_calls[name], duckdb_calls[name])) for name in pandas_calls]
+
+    differences = []
+    for label, call in comparisons:
+        if isinstance(call, tuple):
+            expected, actual = call[0](), call[1]()
+        else:
+            expected, actual = call(pandas_ipl), call(duckdb_ipl)
+        differences += _differences(label, expected, actual)
+    return len(comparisons), differences
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the DuckDB database of the aggregates, or check it against pandas')
+    parser.add_argument('--parity', action='store_true', help='Compare every aggregate and get_* helper across both backends')
+    parser.add_argument('--matches', help='Matches CSV (default data/matches.csv)')
+    parser.add_argument('--deliveries', help='Deliveries CSV (default data/deliveries.csv)')
+    args = parser.parse_args()
+
+    if args.parity:
+        import tempfile
+
+        from utils import stats_export
+        # Player Insights helpers queue rows for the stats export; keep them out of the real one
+        stats_export.EXPORT_DIR = tempfile.mkdtemp(prefix='ipl-parity-')
+        count, differences = parity(args.matches, args.deliveries)
+        print(f'{count} comparisons, {len(differences)} differences')
+        for difference in differences:
+            print(' ', difference)
+        sys.exit(1 if differences else 0)
+
+    from utils.data_cache import source_fingerprint
+    from utils.data_loader import MATCHES_CSV, DELIVERIES_CSV, TEAM_MAP, VENUE_MAP, load_data
+    matches_df, deliveries_df, ipl = load_data(matches_csv=args.matches, deliveries_csv=args.deliveries)
+    key = source_fingerprint([args.matches or MATCHES_CSV, args.deliveries or DELIVERIES_CSV], VENUE_MAP, TEAM_MAP)
+    path = attach_database(ipl, matches_df, deliveries_df, key)
+    print(f'Database ready: {path}' if path else 'DuckDB backend not available (is duckdb installed?)')
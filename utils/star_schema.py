@@ -0,0 +1,133 @@
+"""
+Star-schema access to the IPL data.
+
+Ball-by-ball deliveries are kept as a narrow fact table that carries only MATCH_INDEX, the
+row position of each ball's match in matches_df. Match attributes (season, venue, winner,
+toss, ...) are stored once in the matches dimension and gathered onto ball-level rows by
+integer index only when a query needs them, instead of being copied onto every ball by a
+merge.
+
+Fact tables hold their dimension in DataFrame.attrs, which pandas carries over to filtered
+slices and copies, so the accessors below also work on ipl[mask] or ipl.copy(). The dimension
+lives as long as some frame refers to it.
+"""
+import pandas as pd
+
+MATCH_INDEX = 'match_idx'
+_DIMENSION_KEY = 'matches_dimension'
+
+class _Dimension:
+    # pandas deep-copies attrs onto every slice and copy; share the matches frame instead
+    __slots__ = ('matches',)
+
+    def __init__(self, matches):
+        self.matches = matches
+
+    def __deepcopy__(self, memo):
+        return self
+
+def match_positions(matches_df, deliveries_df):
+    """
+    Compute the row position in matches_df of each delivery's match.
+    Args:
+        matches_df (DataFrame): Match-level data
+        deliveries_df (DataFrame): Ball-by-ball data
+    Returns:
+        ndarray: Smallest signed integer positions, -1 where the match is missing
+    """
+    positions = pd.Index(matches_df['id']).get_indexer(deliveries_df['match_id'])
+    return pd.to_numeric(pd.Series(positions), downcast='integer').to_numpy()
+
+def link_matches(matches_df, deliveries_df):
+    """
+    Link the deliveries fact table to matches_df as its dimension.
+    Args:
+        matches_df (DataFrame): Match-level data
+        deliveries_df (DataFrame): Ball-by-ball data with a MATCH_INDEX column (not modified)
+    Returns:
+        DataFrame: Fact table of deliveries that have a match, sharing deliveries_df's columns
+    """
+    if (deliveries_df[MATCH_INDEX].to_numpy() < 0).any():
+        # Same rows as the inner merge this table replaces
+        fact = deliveries_df[deliveries_df[MATCH_INDEX] >= 0]
+    else:
+        fact = deliveries_df.copy(deep=False)
+    fact.attrs[_DIMENSION_KEY] = _Dimension(matches_df)
+    return fact
+
+def match_dimension(df):
+    """
+    Return the matches dimension a fact table (or a slice of it) is linked to.
+    Args:
+        df (DataFrame): Fact table from link_matches() or a slice of it
+    Returns:
+        DataFrame: Match-level data
+    """
+    return df.attrs[_DIMENSION_KEY].matches
+
+def match_column(df, column):
+    """
+    Gather a match attribute onto each ball-level row by integer index.
+    Frames that already carry the column (e.g. a merged frame) return it unchanged.
+    Args:
+        df (DataFrame): Fact table or a slice of it
+        column (str): Column of the matches dimension (e.g. 'season', 'venue', 'winner')
+    Returns:
+        Series: Attribute aligned to df.index
+    """
+    if column in df.columns:
+        return df[column]
+    values = match_dimension(df)[column].array
+    return pd.Series(values.take(df[MATCH_INDEX].to_numpy()), index=df.index, name=column)
+
+def with_match_columns(df, columns):
+    """
+    Return df with the requested match attributes attached as columns.
+    Meant for small frames (a player's or team's rows); df itself is not modified.
+    Args:
+        df (DataFrame): Fact table or a slice of it
+        columns (list): Columns of the matches dimension to attach
+    Returns:
+        DataFrame: Frame with the extra columns
+    """
+    missing = [col for col in columns if col not in df.columns]
+    if not missing:
+        return df
+    return df.assign(**{col: match_column(df, col) for col in missing})
+
+def in_seasons(df, seasons):
+    """
+    Boolean mask of the rows played in any of the given seasons.
+    The membership test runs once per match and is then gathered onto the balls.
+    Args:
+        df (DataFrame): Fact table or a slice of it
+        seasons (list): Seasons to keep
+    Returns:
+        Series: Boolean mask aligned to df.index
+    """
+    if 'season' in df.columns:
+        return df['season'].isin(seasons)
+    per_match = match_dimension(df)['season'].isin(seasons).to_numpy()
+    return pd.Series(per_match[df[MATCH_INDEX].to_numpy()], index=df.index)
+
+def select_rows(df, seasons=None, mask=None, columns=None):
+    """
+    Select the rows and columns a query reads, without copying the rest of the fact table.
+    With no seasons, mask or columns, df itself is returned, so callers must not modify the result.
+    Args:
+        df (DataFrame): Fact table or a slice of it
+        seasons (list, optional): Seasons to keep (all seasons if empty)
+        mask (Series, optional): Further boolean row mask aligned to df.index
+        columns (list, optional): Columns to keep; MATCH_INDEX is kept too, so match attributes
+            can still be gathered from the result
+    Returns:
+        DataFrame: Selected rows and columns
+    """
+    if seasons:
+        season_mask = in_seasons(df, seasons)
+        mask = season_mask if mask is None else mask & season_mask
+    if columns is not None and MATCH_INDEX in df.columns and MATCH_INDEX not in columns:
+        columns = list(columns) + [MATCH_INDEX]
+    if mask is None:
+        return df if columns is None else df[columns]
+    return df.loc[mask] if columns is None else df.loc[mask, columns]
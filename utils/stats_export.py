@@ -0,0 +1,204 @@
+"""
+Background export of the player stats shown on the Player Insights tab.
+
+get_player_stats() used to append a row to batter_stats.csv / bowler_stats.csv /
+allrounder_stats.csv inside the Dash callback, deciding on the header with os.path.exists, which
+blocked the request on disk I/O and raced between worker processes. Rows are now queued with
+export_row() and written by one background thread per process, in batches.
+
+Each batch becomes its own immutable part file in EXPORT_DIR/<kind>/, written to a temporary path
+and moved into place, so worker processes never write to the same file and readers never see a
+partial one. Parts are Feather files (IPL_EXPORT_FORMAT=feather, the default, needs pyarrow) or
+CSV files (IPL_EXPORT_FORMAT=csv, also the fallback without pyarrow). The accumulated export of
+a kind is streamed as one CSV from /exports/<kind>.csv (see register_routes()).
+"""
+import atexit
+import copy
+import glob
+import itertools
+import logging
+import os
+import queue
+import threading
+import time
+
+import pandas as pd
+from flask import Response, abort, stream_with_context
+
+EXPORT_DIR = os.environ.get('IPL_EXPORT_DIR', 'exports')
+EXPORT_FORMAT = os.environ.get('IPL_EXPORT_FORMAT', 'feather')
+EXPORT_KINDS = ('batter_stats', 'bowler_stats', 'allrounder_stats')
+# Rows per part file, and seconds a row may wait for its batch to fill
+BATCH_SIZE = 256
+FLUSH_INTERVAL = 2.0
+# Seconds flush() waits for the writer before giving up
+FLUSH_TIMEOUT = 30.0
+
+logger = logging.getLogger(__name__)
+
+_rows = queue.Queue()
+_writer = None
+_writer_lock = threading.Lock()
+_part_ids = itertools.count()
+
+def export_row(kind, row):
+    """
+    Queue one row for export without touching the filesystem.
+    Args:
+        kind (str): Export name, one of EXPORT_KINDS
+        row (dict): Stats of one player; nested dicts are flattened into 'outer.inner' columns
+    """
+    if kind not in EXPORT_KINDS:
+        raise ValueError(f'Unknown export {kind!r}')
+    _start_writer()
+    # Snapshot the row; the caller keeps using its dict
+    _rows.put((kind, copy.deepcopy(row)))
+
+def flush(timeout=FLUSH_TIMEOUT):
+    """
+    Block until every queued row of this process has been written, or the timeout has passed.
+    Args:
+        timeout (float): Seconds to wait at most
+    Returns:
+        bool: True if the queue was drained
+    """
+    deadline = time.monotonic() + timeout
+    with _rows.all_tasks_done:
+        if _rows.unfinished_tasks:
+            _start_writer()
+        while _rows.unfinished_tasks:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning('Gave up flushing %d queued export rows after %.1fs', _rows.unfinished_tasks, timeout)
+                return False
+            _rows.all_tasks_done.wait(remaining)
+    return True
+
+def _start_writer():
+    global _writer
+    if _writer is None or not _writer.is_alive():
+        with _writer_lock:
+            if _writer is None or not _writer.is_alive():
+                if _writer is None:
+                    # Write the rows still queued when the process exits
+                    atexit.register(flush)
+                else:
+                    logger.warning('Restarting the stats export writer')
+                _writer = threading.Thread(target=_write_batches, name='stats-export', daemon=True)
+                _writer.start()
+
+def _write_batches():
+    while True:
+        batch = [_rows.get()]
+        deadline = time.monotonic() + FLUSH_INTERVAL
+        while len(batch) < BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(_rows.get(timeout=timeout))
+            except queue.Empty:
+                break
+        try:
+            for kind in EXPORT_KINDS:
+                rows = [row for row_kind, row in batch if row_kind == kind]
+                if rows:
+                    write_part(kind, pd.json_normalize(rows))
+        except Exception:
+            # A failed batch is dropped rather than stopping the writer
+            logger.exception('Dropped a batch of %d export rows', len(batch))
+        finally:
+            for _ in batch:
+                _rows.task_done()
+
+def write_part(kind, frame):
+    """
+    Write one batch of rows as a new part file of an export.
+    Args:
+        kind (str): Export name, one of EXPORT_KINDS
+        frame (DataFrame): Rows to write
+    Returns:
+        str: Path of the part file
+    """
+    kind_dir = os.path.join(EXPORT_DIR, kind)
+    os.makedirs(kind_dir, exist_ok=True)
+    name = f'{time.time_ns()}-{os.getpid()}-{next(_part_ids)}'
+    if EXPORT_FORMAT == 'feather':
+        path = os.path.join(kind_dir, f'{name}.feather')
+        tmp_path = f'{path}.tmp'
+        try:
+            # Object columns mix strings, numbers and None; store them as strings and keep the
+            # missing values null, so the streamed CSV has empty cells like the CSV parts
+            strings = {col: frame[col].astype(str).where(frame[col].notna(), None)
+                       for col in frame.columns[frame.dtypes == object]}
+            frame.assign(**strings).to_feather(tmp_path)
+            os.replace(tmp_path, path)
+            return path
+        except ImportError:
+            pass
+    path = os.path.join(kind_dir, f'{name}.csv')
+    tmp_path = f'{path}.tmp'
+    frame.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    return path
+
+def part_paths(kind):
+    """
+    Part files of an export, oldest first.
+    Args:
+        kind (str): Export name, one of EXPORT_KINDS
+    Returns:
+        list: Part file paths
+    """
+    paths = glob.glob(os.path.join(EXPORT_DIR, kind, '*.feather')) + glob.glob(os.path.join(EXPORT_DIR, kind, '*.csv'))
+    # Part names start with their write time in nanoseconds
+    return sorted(paths, key=lambda path: int(os.path.basename(path).split('-', 1)[0]))
+
+def read_part(path):
+    """
+    Read one part file.
+    Args:
+        path (str): Part file path
+    Returns:
+        DataFrame: Rows of the part
+    """
+    return pd.read_feather(path) if path.endswith('.feather') else pd.read_csv(path)
+
+def stream_csv(kind):
+    """
+    Stream the accumulated export of a kind as CSV, one part at a time.
+    Args:
+        kind (str): Export name, one of EXPORT_KINDS
+    Returns:
+        generator: CSV text chunks, starting with the header
+    """
+    columns = None
+    for path in part_paths(kind):
+        try:
+            frame = read_part(path)
+        except (ImportError, OSError, ValueError):
+            continue
+        if columns is None:
+            columns = list(frame.columns)
+            yield frame.to_csv(index=False)
+        else:
+            # Keep the header of the first part
+            yield frame.reindex(columns=columns).to_csv(index=False, header=False)
+
+def register_routes(server):
+    """
+    Add the /exports/<kind>.csv download route to the Flask server behind the Dash app.
+    Args:
+        server (Flask): Dash app.server
+    """
+    @server.route('/exports/<kind>.csv')
+    def download_export(kind):
+        if kind not in EXPORT_KINDS:
+            abort(404)
+        # Include the rows this worker has queued so far
+        flush()
+        return Response(
+            stream_with_context(stream_csv(kind)),
+            mimetype='text/csv',
+            headers={'Content-Disposition': f'attachment; filename={kind}.csv'}
+        )
@@ -0,0 +1,54 @@
+"""
+Vectorized detection of streaks of consecutive events in the ball-by-ball data.
+
+A streak is a run of consecutive flagged rows (wickets, dot balls, boundaries, ...) within a group
+such as a bowler's spell in a match. Run lengths are computed for every row at once from the
+sorted arrays, instead of calling a Python function with a rolling window for every group.
+"""
+import numpy as np
+import pandas as pd
+
+def _key_codes(key):
+    key = pd.Series(key)
+    if isinstance(key.dtype, pd.CategoricalDtype):
+        return key.cat.codes.to_numpy()
+    return key.to_numpy()
+
+def streak_lengths(flags, group_keys=()):
+    """
+    Length of the run of consecutive True flags ending at each row.
+    Rows must already be sorted so that each group is contiguous and in event order.
+    Args:
+        flags (array-like): Boolean flag of each row
+        group_keys (list, optional): Key columns (Series or arrays) whose change starts a new group
+    Returns:
+        ndarray: Run length at each row (0 where the flag is False)
+    """
+    flags = np.asarray(flags, dtype=bool)
+    positions = np.arange(len(flags))
+    group_start = np.zeros(len(flags), dtype=bool)
+    group_start[:1] = True
+    for key in group_keys:
+        codes = _key_codes(key)
+        group_start[1:] |= codes[1:] != codes[:-1]
+    # Position of the last row before each run: the last unflagged row, or the row before the group
+    last_break = np.where(~flags, positions, np.where(group_start, positions - 1, -1))
+    last_break = np.maximum.accumulate(last_break)
+    return positions - last_break
+
+def find_streaks(df, flag, by, order, length):
+    """
+    Rows at which a streak of at least `length` consecutive flagged rows ends.
+    A streak of length + k rows yields k + 1 rows, as a rolling window of `length` would.
+    Args:
+        df (DataFrame): Ball-by-ball rows
+        flag (str): Boolean (or 0/1) column marking the event
+        by (list): Columns identifying a group, e.g. ['match_id', 'bowler']
+        order (list): Columns giving the event order within a group, e.g. ['over', 'ball']
+        length (int): Minimum streak length
+    Returns:
+        DataFrame: Matching rows of df, with a 'streak' column holding the run length
+    """
+    sorted_df = df.sort_values(by=by + order)
+    runs = streak_lengths(sorted_df[flag].to_numpy() != 0, [sorted_df[column] for column in by])
+    return sorted_df[runs >= length].assign(streak=runs[runs >= length])
@@ -0,0 +1,292 @@
+"""
+Synthetic IPL-like matches.csv and deliveries.csv at any multiple of the real volume.
+
+Scale 1 is one league shaped like the IPL (10 teams, the 2008-2024 seasons with the real number of
+matches per season, about 270k balls). Larger scales add leagues of the same shape, with their
+own teams, players and grounds, the way loading more T20 leagues would grow the data; fractional
+scales shrink the one league. Outcomes are drawn ball by ball from the distributions of the
+shipped data (extras, run values, wicket rate and dismissal mix, toss decisions), innings stop at
+20 overs, ten wickets or a reached target, and results, margins and players of the match follow
+from the simulated scores. The frames have the CSV columns, so they go through load_data()
+like the real files.
+
+Write a dataset with:
+    python -m utils.synthetic_data --scale 10 --out data/synthetic/x10
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+# Matches per season of the real data
+SEASON_MATCHES = {
+    2008: 58, 2009: 57, 2010: 60, 2011: 73, 2012: 74, 2013: 76, 2014: 60, 2015: 59, 2016: 60,
+    2017: 59, 2018: 60, 2019: 60, 2020: 60, 2021: 60, 2022: 74, 2023: 74, 2024: 71
+}
+IPL_TEAMS = [
+    'Chennai Super Kings', 'Mumbai Indians', 'Royal Challengers Bengaluru', 'Kolkata Knight Riders',
+    'Delhi Capitals', 'Punjab Kings', 'Rajasthan Royals', 'Sunrisers Hyderabad',
+    'Gujarat Titans', 'Lucknow Super Giants'
+]
+PLAYOFFS = ['Qualifier 1', 'Eliminator', 'Qualifier 2', 'Final']
+MATCH_COLUMNS = [
+    'id', 'season', 'city', 'date', 'match_type', 'player_of_match', 'venue', 'team1', 'team2',
+    'toss_winner', 'toss_decision', 'winner', 'result', 'result_margin', 'target_runs', 'target_overs',
+    'super_over', 'method', 'umpire1', 'umpire2'
+]
+DELIVERY_COLUMNS = [
+    'match_id', 'inning', 'batting_team', 'bowling_team', 'over', 'ball', 'batter', 'bowler',
+    'non_striker', 'batsman_runs', 'extra_runs', 'total_runs', 'extras_type', 'is_wicket',
+    'player_dismissed', 'dismissal_kind', 'fielder'
+]
+
+# Per-league pools
+PLAYERS = 250
+SQUAD = 18
+GROUNDS = 12
+UMPIRES = 40
+
+# Ball outcome distributions of the shipped data
+EXTRAS = np.array([None, 'wides', 'legbyes', 'noballs', 'byes'], dtype=object)
+EXTRAS_P = [0.9457, 0.0343, 0.0099, 0.0051, 0.0050]
+RUNS = np.array([0, 1, 2, 3, 4, 6])
+RUNS_P = [0.3933, 0.3513, 0.0671, 0.0048, 0.1277, 0.0558]
+# Wickets per ball without extras, for the overall rate of about one in twenty balls
+WICKET_P = 0.0527
+DISMISSALS = np.array(['caught', 'bowled', 'run out', 'lbw', 'stumped', 'caught and bowled', 'hit wicket'], dtype=object)
+DISMISSALS_P = [0.6036, 0.1658, 0.0916, 0.0710, 0.0370, 0.0217, 0.0093]
+FIELDED = {'caught', 'run out', 'stumped'}
+FIELD_FIRST_P = 0.64
+# Candidate deliveries simulated per innings; 120 legal balls need about 127
+MAX_DELIVERIES = 150
+
+def _innings(rng, batting_xi, bowling_xi, target=None):
+    # Simulate one innings for every row of the XIs; returns per-delivery arrays of the kept balls
+    n = len(batting_xi)
+    shape = (n, MAX_DELIVERIES)
+    extras = rng.choice(len(EXTRAS), size=shape, p=EXTRAS_P)
+    batsman_runs = RUNS[rng.choice(len(RUNS), size=shape, p=RUNS_P)]
+    batsman_runs[(extras != 0) & (extras != 3)] = 0
+    extra_runs = np.select([extras == 1, extras == 3, extras == 2, extras == 4],
+                           [1, 1, rng.integers(1, 3, size=shape), rng.integers(1, 5, size=shape)], 0)
+    is_wicket = (extras == 0) & (rng.random(shape) < WICKET_P)
+    batsman_runs[is_wicket] = 0
+    total_runs = batsman_runs + extra_runs
+
+    legal = (extras != 1) & (extras != 3)
+    legal_before = np.cumsum(legal, axis=1) - legal
+    wickets_before = np.cumsum(is_wicket, axis=1) - is_wicket
+    runs_before = np.cumsum(total_runs, axis=1) - total_runs
+    keep = (legal_before < 120) & (wickets_before < 10)
+    if target is not None:
+        keep &= runs_before < target[:, None]
+
+    # Batters come in in XI order; the older of the pair is the one dismissed, and odd runs and
+    # over ends swap the strike
+    over = legal_before // 6
+    odd = (batsman_runs + np.where((extras == 2) | (extras == 4), extra_runs, 0)) % 2
+    swaps = np.cumsum(odd, axis=1) - odd + over
+    older = np.minimum(wickets_before, 9)
+    on_strike = np.where(is_wicket, 0, swaps % 2)
+    rows = np.broadcast_to(np.arange(n)[:, None], shape)
+    batter = batting_xi[rows, older + on_strike]
+    non_striker = batting_xi[rows, older + 1 - on_strike]
+    # The last five of the bowling XI bowl in rotation
+    bowler = bowling_xi[rows, 6 + over % 5]
+    dismissal = np.where(is_wicket, rng.choice(len(DISMISSALS), size=shape, p=DISMISSALS_P), -1)
+    fielder = bowling_xi[rows, rng.integers(0, 11, size=shape)]
+
+    row, position = np.nonzero(keep)
+    over = over[row, position]
+    # Deliveries are numbered within each over, extras included
+    new_over = np.ones(len(row), dtype=bool)
+    new_over[1:] = (row[1:] != row[:-1]) | (over[1:] != over[:-1])
+    starts = np.maximum.accumulate(np.where(new_over, np.arange(len(row)), 0))
+    return {
+        'row': row,
+        'over': over,
+        'ball': np.arange(len(row)) - starts + 1,
+        'batter': batter[row, position],
+        'bowler': bowler[row, position],
+        'non_striker': non_striker[row, position],
+        'batsman_runs': batsman_runs[row, position],
+        'extra_runs': extra_runs[row, position],
+        'total_runs': total_runs[row, position],
+        'extras': extras[row, position],
+        'is_wicket': is_wicket[row, position].astype('int64'),
+        'dismissal': dismissal[row, position],
+        'fielder': fielder[row, position]
+    }
+
+def generate_league(league, scale=1.0, seed=0):
+    """
+    Generate the matches and balls of one synthetic league.
+    Args:
+        league (int): League number; league 0 uses the IPL team names
+        scale (float, optional): Matches per season relative to the IPL (at most 1 per league)
+        seed (int, optional): Random seed
+    Returns:
+        tuple: (matches_df, deliveries_df) with the columns of matches.csv and deliveries.csv
+    """
+    rng = np.random.default_rng([seed, league])
+    teams = np.array(IPL_TEAMS if league == 0 else [f'League {league} Team {i + 1}' for i in range(len(IPL_TEAMS))], dtype=object)
+    players = np.array([f'L{league:02d} Player {i:03d}' for i in range(PLAYERS)], dtype=object)
+    grounds = np.array([f'League {league} Ground {i + 1}' for i in range(GROUNDS)], dtype=object)
+    cities = np.array([f'League {league} City {i + 1}' for i in range(GROUNDS)], dtype=object)
+    umpires = np.array([f'Umpire {i + 1:02d}' for i in range(UMPIRES)], dtype=object)
+    seasons = list(SEASON_MATCHES)
+
+    # Fixtures
+    counts = np.array([max(1, round(SEASON_MATCHES[season] * scale)) for season in seasons])
+    season = np.repeat(seasons, counts)
+    season_pos = np.repeat(np.arange(len(seasons)), counts)
+    n = len(season)
+    team1 = rng.integers(0, len(teams), n)
+    team2 = (team1 + rng.integers(1, len(teams), n)) % len(teams)
+    ground_weights = 1 / np.arange(1, GROUNDS + 1)
+    ground = rng.choice(GROUNDS, size=n, p=ground_weights / ground_weights.sum())
+    number_in_season = np.arange(n) - np.repeat(np.cumsum(counts) - counts, counts)
+    from_end = np.repeat(counts, counts) - number_in_season
+    # The last matches of a season are the playoffs, ending with the final
+    match_type = np.where(from_end <= len(PLAYOFFS), np.array(PLAYOFFS, dtype=object)[np.clip(len(PLAYOFFS) - from_end, 0, len(PLAYOFFS) - 1)], 'League')
+    date = pd.to_datetime([f'{s}-04-01' for s in season]) + pd.to_timedelta(number_in_season, unit='D')
+
+    # Squads change every season; each match picks eleven of the eighteen, keeping squad order
+    squads = np.stack([rng.permutation(PLAYERS)[:len(teams) * SQUAD].reshape(len(teams), SQUAD) for _ in seasons])
+    def playing_xi(team):
+        picks = np.sort(np.argsort(rng.random((n, SQUAD)), axis=1)[:, :11], axis=1)
+        return np.take_along_axis(squads[season_pos, team], picks, axis=1)
+    xi1, xi2 = playing_xi(team1), playing_xi(team2)
+
+    toss_first = rng.random(n) < 0.5
+    toss_winner = np.where(toss_first, team1, team2)
+    field = rng.random(n) < FIELD_FIRST_P
+    # team1 of the fixture bats first when it won the toss and batted, or lost it and was put in
+    team1_bats = toss_first != field
+    first, second = np.where(team1_bats, team1, team2), np.where(team1_bats, team2, team1)
+    first_xi = np.where(team1_bats[:, None], xi1, xi2)
+    second_xi = np.where(team1_bats[:, None], xi2, xi1)
+
+    innings1 = _innings(rng, first_xi, second_xi)
+    first_total = np.bincount(innings1['row'], weights=innings1['total_runs'], minlength=n).astype('int64')
+    innings2 = _innings(rng, second_xi, first_xi, target=first_total + 1)
+    second_total = np.bincount(innings2['row'], weights=innings2['total_runs'], minlength=n).astype('int64')
+    second_wickets = np.bincount(innings2['row'], weights=innings2['is_wicket'], minlength=n).astype('int64')
+
+    # Results
+    chased = second_total > first_total
+    tie = second_total == first_total
+    winner = np.where(chased, second, np.where(tie, np.where(rng.random(n) < 0.5, first, second), first))
+    result = np.where(chased, 'wickets', np.where(tie, 'tie', 'runs'))
+    margin = np.where(chased, 10 - second_wickets, np.where(tie, np.nan, first_total - second_total))
+
+    frames = []
+    for inning, balls, batting, bowling in ((1, innings1, first, second), (2, innings2, second, first)):
+        row = balls['row']
+        dismissal = balls['dismissal']
+        dismissal_kind = np.where(dismissal >= 0, DISMISSALS[np.maximum(dismissal, 0)], None)
+        fielded = pd.Series(dismissal_kind).isin(FIELDED).to_numpy()
+        frames.append(pd.DataFrame({
+            'match_id': 0,
+            'inning': inning,
+            'batting_team': teams[batting[row]],
+            'bowling_team': teams[bowling[row]],
+            'over': balls['over'],
+            'ball': balls['ball'],
+            'batter': players[balls['batter']],
+            'bowler': players[balls['bowler']],
+            'non_striker': players[balls['non_striker']],
+            'batsman_runs': balls['batsman_runs'],
+            'extra_runs': balls['extra_runs'],
+            'total_runs': balls['total_runs'],
+            'extras_type': EXTRAS[balls['extras']],
+            'is_wicket': balls['is_wicket'],
+            'player_dismissed': np.where(balls['is_wicket'] == 1, players[balls['batter']], None),
+            'dismissal_kind': dismissal_kind,
+            'fielder': np.where(fielded, players[balls['fielder']], None),
+            '_row': row
+        }))
+    deliveries = pd.concat(frames, ignore_index=True)
+    deliveries = deliveries.sort_values(['_row', 'inning'], kind='stable', ignore_index=True)
+
+    ids = 2_000_000 + league * 100_000 + np.arange(n)
+    deliveries['match_id'] = ids[deliveries['_row'].to_numpy()]
+    # Player of the match: the match's top scorer
+    scores = deliveries.groupby(['_row', 'batter'])['batsman_runs'].sum().reset_index()
+    top = scores.loc[scores.groupby('_row')['batsman_runs'].idxmax()]
+    player_of_match = pd.Series(top['batter'].to_numpy(), index=top['_row'].to_numpy()).reindex(range(n)).to_numpy()
+    deliveries = deliveries.drop(columns='_row')
+
+    umpire1 = rng.integers(0, UMPIRES, n)
+    umpire2 = (umpire1 + rng.integers(1, UMPIRES, n)) % UMPIRES
+    matches = pd.DataFrame({
+        'id': ids,
+        'season': season,
+        'city': cities[ground],
+        'date': date.strftime('%Y-%m-%d'),
+        'match_type': match_type,
+        'player_of_match': player_of_match,
+        'venue': grounds[ground],
+        'team1': teams[team1],
+        'team2': teams[team2],
+        'toss_winner': teams[toss_winner],
+        'toss_decision': np.where(field, 'field', 'bat'),
+        'winner': teams[winner],
+        'result': result,
+        'result_margin': margin,
+        'target_runs': (first_total + 1).astype(float),
+        'target_overs': 20.0,
+        'super_over': np.where(tie, 'Y', 'N'),
+        'method': None,
+        'umpire1': umpires[umpire1],
+        'umpire2': umpires[umpire2]
+    })
+    return matches[MATCH_COLUMNS], deliveries[DELIVERY_COLUMNS]
+
+def _leagues(scale):
+    # Whole leagues of IPL volume, or one smaller league below scale 1
+    count = max(1, int(round(scale)))
+    return count, scale / count
+
+def generate(scale=1.0, seed=0):
+    """
+    Generate a synthetic dataset in memory.
+    Args:
+        scale (float, optional): Volume relative to the IPL data (1, 10, 100, or a fraction for quick runs)
+        seed (int, optional): Random seed
+    Returns:
+        tuple: (matches_df, deliveries_df) with the columns of matches.csv and deliveries.csv
+    """
+    count, league_scale = _leagues(scale)
+    leagues = [generate_league(league, league_scale, seed) for league in range(count)]
+    return pd.concat([m for m, _ in leagues], ignore_index=True), pd.concat([d for _, d in leagues], ignore_index=True)
+
+def write_dataset(out_dir, scale=1.0, seed=0):
+    """
+    Write a synthetic matches.csv and deliveries.csv, one league at a time to bound memory.
+    Args:
+        out_dir (str): Directory for the two files
+        scale (float, optional): Volume relative to the IPL data
+        seed (int, optional): Random seed
+    Returns:
+        tuple: (matches path, deliveries path)
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    matches_path = os.path.join(out_dir, 'matches.csv')
+    deliveries_path = os.path.join(out_dir, 'deliveries.csv')
+    count, league_scale = _leagues(scale)
+    for league in range(count):
+        matches, deliveries = generate_league(league, league_scale, seed)
+        mode, header = ('w', True) if league == 0 else ('a', False)
+        matches.to_csv(matches_path, mode=mode, header=header, index=False)
+        deliveries.to_csv(deliveries_path, mode=mode, header=header, index=False)
+    return matches_path, deliveries_path
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Write a synthetic IPL-like dataset')
+    parser.add_argument('--scale', type=float, default=1.0, help='Volume relative to the IPL data')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default=os.path.join('data', 'synthetic'), help='Output directory')
+    args = parser.parse_args()
+    print(*write_dataset(args.out, args.scale, args.seed), sep='\n')